@@ -0,0 +1,123 @@
+"""
+GlixAI Chat Context
+Bounded conversation context for multi-turn chat: recent messages plus a rolling summary
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from agents.llm_client import estimate_tokens, get_llm_client
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT = """You keep a running summary of a career-coaching conversation between a user and GlixAI.
+Merge the new messages into the existing summary. Keep what the assistant will need later: the user's
+background, skills, goals and constraints, and any advice or decisions already given.
+Write plain prose, at most {words} words."""
+
+ROLE_LABELS = {"user": "User", "assistant": "GlixAI"}
+MESSAGE_FIELDS = {"_id": 0, "role": 1, "content": 1, "timestamp": 1}
+
+
+def format_messages(messages: list) -> str:
+    return "\n".join(f"{ROLE_LABELS.get(m['role'], m['role'])}: {m['content']}" for m in messages)
+
+
+class ChatContext:
+    """Builds the conversation history sent with each chat turn.
+
+    The prompt gets the session's rolling summary plus the newest messages
+    that fit in ``max_tokens`` (at most ``max_turns`` user/assistant pairs).
+    Older messages not yet in the summary are folded into it after the
+    reply, in the background, ``summary_batch`` at a time. The prompt stays
+    the same size however long the session runs, and a turn never waits on
+    a summary call.
+    """
+
+    def __init__(self, db, max_tokens: Optional[int] = None, max_turns: Optional[int] = None,
+                 summary_tokens: Optional[int] = None, summary_batch: Optional[int] = None):
+        self.sessions = db.chat_sessions
+        self.messages = db.chat_messages
+        self.max_tokens = max_tokens or int(os.environ.get('CHAT_CONTEXT_TOKENS', 1500))
+        self.max_turns = max_turns or int(os.environ.get('CHAT_CONTEXT_TURNS', 10))
+        self.summary_tokens = summary_tokens or int(os.environ.get('CHAT_SUMMARY_TOKENS', 300))
+        self.summary_batch = summary_batch or int(os.environ.get('CHAT_SUMMARY_BATCH', 20))
+        self._summarizing = {}
+
+    def _clip(self, text: str, tokens: int) -> str:
+        limit = tokens * 4
+        return text if len(text) <= limit else text[:limit] + "…"
+
+    async def build(self, turn: dict) -> dict:
+        """Window for a turn from ChatStore.start_turn: prompt text plus the messages left for the summary"""
+        summary = turn.get("summary") or ""
+        summary_until = turn.get("summary_until")
+        query = {"session_id": turn["session_id"]}
+        if summary_until:
+            query["timestamp"] = {"$gt": summary_until}
+        limit = 2 * self.max_turns + self.summary_batch
+        newest_first = await self.messages.find(query, MESSAGE_FIELDS).sort(
+            [("timestamp", -1), ("id", -1)]
+        ).to_list(limit)
+
+        budget = self.max_tokens - estimate_tokens(summary)
+        window = []
+        for message in newest_first:
+            if len(window) == 2 * self.max_turns:
+                break
+            content = self._clip(message["content"], self.max_tokens // 4)
+            cost = estimate_tokens(content)
+            if cost > budget:
+                break
+            budget -= cost
+            window.append({**message, "content": content})
+
+        parts = []
+        if summary:
+            parts.append(f"Summary of the earlier conversation:\n{summary}")
+        if window:
+            parts.append(f"Recent messages:\n{format_messages(window[::-1])}")
+        overflow = newest_first[len(window):][::-1][:self.summary_batch]
+        if overflow and len(newest_first) == limit:
+            # More unsummarized messages than were fetched: the summary has to
+            # continue from summary_until, not from the oldest message fetched,
+            # or the ones in between would never reach it.
+            bounds = dict(query.get("timestamp", {}))
+            if window:
+                bounds["$lt"] = window[-1]["timestamp"]
+            older = {"session_id": turn["session_id"], **({"timestamp": bounds} if bounds else {})}
+            overflow = await self.messages.find(older, MESSAGE_FIELDS).sort(
+                [("timestamp", 1), ("id", 1)]
+            ).to_list(self.summary_batch)
+        return {"text": "\n\n".join(parts), "overflow": overflow, "summary": summary, "summary_until": summary_until}
+
+    def schedule_summary(self, session_id: str, window: dict):
+        """Fold the window's overflow into the session summary in the background"""
+        if not window["overflow"] or session_id in self._summarizing:
+            return
+        self._summarizing[session_id] = asyncio.create_task(self._summarize(session_id, window))
+
+    async def _summarize(self, session_id: str, window: dict):
+        try:
+            overflow = window["overflow"]
+            text = (f"Existing summary:\n{window['summary'] or '(none yet)'}\n\n"
+                    f"New messages:\n{format_messages(overflow)}")
+            system = SUMMARY_PROMPT.format(words=self.summary_tokens * 3 // 4)
+            summary = await get_llm_client().send(f"{session_id}-summary", system, text)
+            # Conditional on summary_until, so a concurrent summary is never overwritten.
+            await self.sessions.update_one(
+                {"id": session_id, "summary_until": window["summary_until"]},
+                {"$set": {"summary": self._clip(summary, self.summary_tokens),
+                          "summary_until": overflow[-1]["timestamp"]}},
+            )
+        except Exception as e:
+            logger.warning(f"Chat summary for session {session_id} failed: {e}")
+        finally:
+            self._summarizing.pop(session_id, None)
+
+    async def close(self):
+        """Wait for summaries still running"""
+        if self._summarizing:
+            await asyncio.gather(*self._summarizing.values(), return_exceptions=True)
@@ -1,8 +1,9 @@
-import os
 import logging
 from dotenv import load_dotenv
 from pathlib import Path
-from emergentintegrations.llm.chat import LlmChat, UserMessage
+from typing import AsyncIterator
+from agents.llm_client import get_llm_client
+from agents.llm_cache import get_llm_cache, make_cache_key
 
 ROOT_DIR = Path(__file__).parent.parent
 load_dotenv(ROOT_DIR / '.env')
@@ -30,26 +31,40 @@ Format responses with markdown for readability. Use bullet points, headers, and
 Never mention that you are powered by OpenAI or any specific model. You are GlixAI."""
 
 
-async def get_ai_response(session_id: str, user_message: str, context: str = "") -> str:
-    """Get AI response from GPT-5.2 via Emergent LLM key"""
+def build_system_message(context: str = "", history: str = "") -> str:
+    system = SYSTEM_PROMPT
+    if context:
+        system += f"\n\nAdditional context:\n{context}"
+    if history:
+        system += f"\n\nConversation so far:\n{history}"
+    return system
+
+
+async def get_ai_response(session_id: str, user_message: str, context: str = "", cached: bool = False,
+                          history: str = "") -> str:
+    """Get AI response from GPT-5.2 via Emergent LLM key.
+
+    ``history`` is the bounded conversation window from ChatContext. With
+    cached=True, replies are looked up by prompt hash first and stored
+    afterwards; use it only for prompts that do not depend on the session.
+    """
     try:
-        api_key = os.environ.get('EMERGENT_LLM_KEY')
-        if not api_key:
+        llm = get_llm_client()
+        if not llm.configured:
             return "AI service is not configured. Please check the API key."
 
-        system = SYSTEM_PROMPT
-        if context:
-            system += f"\n\nAdditional context:\n{context}"
+        system = build_system_message(context, history)
 
-        chat = LlmChat(
-            api_key=api_key,
-            session_id=session_id,
-            system_message=system
-        )
-        chat.with_model("openai", "gpt-5.2")
+        if not cached:
+            return await llm.send(session_id, system, user_message)
 
-        msg = UserMessage(text=user_message)
-        response = await chat.send_message(msg)
+        cache = get_llm_cache()
+        model = f"{llm.provider}/{llm.model}"
+        key = make_cache_key(model, system, user_message)
+        response = await cache.get(key)
+        if response is None:
+            response = await llm.send(session_id, system, user_message)
+            await cache.set(key, response, model)
         return response
 
     except Exception as e:
@@ -57,6 +72,25 @@ async def get_ai_response(session_id: str, user_message: str, context: str = "")
         return f"I encountered an issue processing your request. Please try again. Error: {str(e)}"
 
 
+async def stream_ai_response(session_id: str, user_message: str, context: str = "",
+                             history: str = "") -> AsyncIterator[str]:
+    """Stream the AI response in chunks as they are generated"""
+    try:
+        llm = get_llm_client()
+        if not llm.configured:
+            yield "AI service is not configured. Please check the API key."
+            return
+
+        system = build_system_message(context, history)
+
+        async for chunk in llm.stream(session_id, system, user_message):
+            yield chunk
+
+    except Exception as e:
+        logger.error(f"AI chat stream error: {e}")
+        yield f"I encountered an issue processing your request. Please try again. Error: {str(e)}"
+
+
 async def analyze_resume_with_ai(session_id: str, resume_text: str) -> str:
     """Use AI to analyze resume text"""
     prompt = f"""Analyze the following resume and provide:
@@ -74,12 +108,16 @@ Resume text:
 
 Provide a detailed, structured analysis."""
 
-    return await get_ai_response(session_id, prompt)
+    return await get_ai_response(session_id, prompt, cached=True)
 
 
 async def generate_roadmap_with_ai(session_id: str, current_skills: list, target_role: str, timeline_weeks: int = 12) -> str:
     """Use AI to generate a career roadmap"""
-    skills_str = ", ".join(current_skills) if current_skills else "Not specified"
+    # Order and case of the skills do not change the roadmap, so canonicalize
+    # them to let equivalent requests share a cache entry.
+    skills = sorted({s.strip().lower() for s in current_skills or [] if s.strip()})
+    skills_str = ", ".join(skills) if skills else "Not specified"
+    target_role = target_role.strip()
     prompt = f"""Create a detailed career roadmap:
 - **Current Skills**: {skills_str}
 - **Target Role**: {target_role}
@@ -101,4 +139,4 @@ Also include:
 - **Learning Resources** with direct links to platforms like Coursera, edX, GitHub
 - **Portfolio Projects** to demonstrate competency"""
 
-    return await get_ai_response(session_id, prompt)
+    return await get_ai_response(session_id, prompt, cached=True)
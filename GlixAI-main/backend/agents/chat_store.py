@@ -0,0 +1,105 @@
+"""
+GlixAI Chat Store
+Persists chat turns in three Mongo round trips without ever dropping the user message
+"""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY = 11000
+
+
+def new_message(session_id: str, role: str, content: str) -> dict:
+    """A chat_messages document: id, session_id, role, content and an ISO timestamp"""
+    return {
+        "id": str(uuid.uuid4()),
+        "session_id": session_id,
+        "role": role,
+        "content": content,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class ChatStore:
+    """Writes a chat turn as one session upsert before the reply and two writes after it.
+
+    ``start_turn`` creates the session if it is missing ($setOnInsert) and
+    parks the user message on it under ``pending_messages``, all in one
+    atomic upsert, so the message is durable before the LLM is called.
+    ``finish_turn`` writes the user and assistant messages with one
+    ``bulk_write`` and then bumps the session, clearing the parked copy.
+
+    If the process dies in between, the parked message stays on the
+    session, and the next turn returns it from its upsert and writes it
+    along with its own messages. Each message is an upsert keyed on its id
+    that only sets fields on insert, so a message written twice (a
+    concurrent turn on the same session, or a retry) is stored once, with
+    or without the unique index, and ``message_count`` grows by the
+    messages actually added.
+    """
+
+    def __init__(self, db):
+        self.sessions = db.chat_sessions
+        self.messages = db.chat_messages
+
+    async def start_turn(self, session_id: str, content: str) -> dict:
+        user_message = new_message(session_id, "user", content)
+        now = user_message["timestamp"]
+        previous = await self.sessions.find_one_and_update(
+            {"id": session_id},
+            {
+                "$setOnInsert": {"title": "New Chat", "created_at": now, "updated_at": now, "message_count": 0},
+                "$set": {f"pending_messages.{user_message['id']}": user_message},
+            },
+            projection={"_id": 0, "pending_messages": 1, "summary": 1, "summary_until": 1},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+        previous = previous or {}
+        recovered = list((previous.get("pending_messages") or {}).values())
+        if recovered:
+            logger.info(f"Recovering {len(recovered)} unsaved message(s) of session {session_id}")
+        return {
+            "session_id": session_id,
+            "user_message": user_message,
+            "recovered": recovered,
+            # Rolling summary state, for ChatContext
+            "summary": previous.get("summary"),
+            "summary_until": previous.get("summary_until"),
+        }
+
+    async def finish_turn(self, turn: dict, reply: str) -> dict:
+        session_id = turn["session_id"]
+        user_message = turn["user_message"]
+        assistant_message = new_message(session_id, "assistant", reply)
+        parked = turn["recovered"] + [user_message]
+
+        writes = [
+            UpdateOne({"id": message["id"]}, {"$setOnInsert": message}, upsert=True)
+            for message in parked + [assistant_message]
+        ]
+        try:
+            added = (await self.messages.bulk_write(writes, ordered=False)).upserted_count
+        except BulkWriteError as e:
+            # Two upserts of one id racing on the unique index: the loser is already stored.
+            if any(error.get("code") != DUPLICATE_KEY for error in e.details.get("writeErrors", [])):
+                raise
+            added = e.details.get("nUpserted", 0)
+
+        content = user_message["content"]
+        await self.sessions.update_one(
+            {"id": session_id},
+            {
+                "$set": {"updated_at": assistant_message["timestamp"],
+                         "title": content[:50] + ("..." if len(content) > 50 else "")},
+                "$inc": {"message_count": added},
+                "$unset": {f"pending_messages.{message['id']}": "" for message in parked},
+            },
+        )
+        return assistant_message
@@ -5,6 +5,9 @@ Analyzes emotional and social intelligence from text
 
 import re
 
+from shared.keyword_matcher import KeywordMatcher
+from shared.metrics import timed
+
 # EQ indicators
 EQ_POSITIVE_INDICATORS = {
     "leadership": ["led", "managed", "mentored", "guided", "coached", "directed", "supervised", "inspired"],
@@ -48,17 +51,26 @@ CULTURE_PROFILES = {
 }
 
 
+# One automaton over every indicator and culture keyword. Prefix matching keeps
+# stems such as "mentor" and "team" matching "mentored" and "teams".
+INDICATOR_MATCHER = KeywordMatcher(
+    [ind for indicators in EQ_POSITIVE_INDICATORS.values() for ind in indicators]
+    + [ind for indicators in SQ_POSITIVE_INDICATORS.values() for ind in indicators]
+    + [kw for profile in CULTURE_PROFILES.values() for kw in profile["keywords"]],
+    prefix=True,
+)
+
+
+@timed("eq_sq")
 def analyze_eq_sq(text: str) -> dict:
     """Analyze EQ and SQ from resume/experience text"""
-    text_lower = text.lower()
-    words = text_lower.split()
-    word_count = len(words)
+    found = set(INDICATOR_MATCHER.find(text))
 
     # Calculate EQ score
     eq_scores = {}
     eq_total = 0
     for category, indicators in EQ_POSITIVE_INDICATORS.items():
-        count = sum(1 for ind in indicators if ind in text_lower)
+        count = sum(1 for ind in indicators if ind in found)
         eq_scores[category] = min(count * 20, 100)
         eq_total += eq_scores[category]
 
@@ -68,7 +80,7 @@ def analyze_eq_sq(text: str) -> dict:
     sq_scores = {}
     sq_total = 0
     for category, indicators in SQ_POSITIVE_INDICATORS.items():
-        count = sum(1 for ind in indicators if ind in text_lower)
+        count = sum(1 for ind in indicators if ind in found)
         sq_scores[category] = min(count * 20, 100)
         sq_total += sq_scores[category]
 
@@ -77,7 +89,7 @@ def analyze_eq_sq(text: str) -> dict:
     # Culture fit analysis
     culture_matches = []
     for culture, profile in CULTURE_PROFILES.items():
-        match_count = sum(1 for kw in profile["keywords"] if kw in text_lower)
+        match_count = sum(1 for kw in profile["keywords"] if kw in found)
         if match_count >= 2:
             culture_matches.append({
                 "culture": culture,
@@ -0,0 +1,41 @@
+"""
+GlixAI Job Enrichment
+Adds automation risk, shadow salary and skill match to job search results in one pass
+"""
+
+from functools import lru_cache
+from typing import List, Optional
+
+from agents.risk_analytics import calculate_automation_risk, get_shadow_salary
+from shared.skill_dictionary import match_normalized_skills, normalize_skill_set
+
+
+@lru_cache(maxsize=4096)
+def resolve_title(title: str) -> tuple:
+    """Risk fields and salary data for a job title, memoized per title"""
+    risk = calculate_automation_risk(title)
+    risk_fields = {
+        "risk_score": risk["risk_score"],
+        "risk_level": risk["risk_level"],
+        "human_necessity": risk["human_necessity"],
+        "horizon": risk["horizon"],
+    }
+    return risk_fields, get_shadow_salary(title)
+
+
+def enrich_jobs(jobs: List[dict], user_skills: Optional[List[str]] = None) -> List[dict]:
+    """Enrich jobs in place and return them.
+
+    The user's skills are normalized once for the whole list; titles and
+    job skill lists seen before are resolved from the memo.
+    """
+    user_normalized = normalize_skill_set(user_skills) if user_skills else None
+    for job in jobs:
+        risk_fields, salary = resolve_title(job.get("title", ""))
+        job.update(risk_fields)
+        # Copied so that no two responses share the memoized dict.
+        job["shadow_salary"] = dict(salary)
+        if user_normalized is not None:
+            job_normalized = normalize_skill_set(job.get("skills", []))
+            job["match_score"] = match_normalized_skills(user_normalized, job_normalized)
+    return jobs
@@ -1,11 +1,27 @@
 import httpx
+import importlib.util
 import logging
+import os
 import re
 from bs4 import BeautifulSoup
 from typing import Optional
+from shared.keyword_matcher import KeywordMatcher
+from shared.job_index import JobIndex
+from shared.metrics import timed
 
 logger = logging.getLogger(__name__)
 
+COMMON_SKILLS = [
+    "python", "javascript", "react", "node.js", "aws", "docker",
+    "kubernetes", "sql", "mongodb", "typescript", "java", "go",
+    "machine learning", "deep learning", "tensorflow", "pytorch",
+    "ci/cd", "devops", "agile", "scrum", "git", "linux",
+    "api", "rest", "graphql", "html", "css", "tailwind",
+    "fastapi", "django", "flask", "spring", "angular", "vue"
+]
+
+SKILL_MATCHER = KeywordMatcher(COMMON_SKILLS)
+
 # Sample job data for fallback/demo
 SAMPLE_JOBS = [
     {
@@ -131,96 +147,114 @@ SAMPLE_JOBS = [
 ]
 
 
-async def search_jobs_web(query: str, location: str = "", page: int = 1) -> list:
-    """Search for jobs using web scraping (Google search)"""
+# Fallback search index over the sample jobs; larger feeds can be added with
+# JOB_INDEX.add_many().
+JOB_INDEX = JobIndex(SAMPLE_JOBS)
+
+
+SEARCH_URL = os.environ.get('JOB_SEARCH_URL', 'https://www.google.com/search')
+SEARCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+_search_client: Optional[httpx.AsyncClient] = None
+
+
+def create_search_client() -> httpx.AsyncClient:
+    """Pooled keep-alive client for job searches, on HTTP/2 when h2 is installed"""
+    max_connections = int(os.environ.get('JOB_SEARCH_MAX_CONNECTIONS', 100))
+    return httpx.AsyncClient(
+        timeout=10,
+        headers=SEARCH_HEADERS,
+        follow_redirects=True,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30,
+        ),
+    )
+
+
+def get_search_client() -> httpx.AsyncClient:
+    """Return the process-wide search client, creating it on first use"""
+    global _search_client
+    if _search_client is None:
+        _search_client = create_search_client()
+    return _search_client
+
+
+async def close_search_client():
+    global _search_client
+    if _search_client is not None:
+        await _search_client.aclose()
+        _search_client = None
+
+
+@timed("job_search")
+async def search_jobs_live(query: str, location: str = "", page: int = 1) -> list:
+    """Search for jobs using web scraping (Google search); empty when the search fails"""
     try:
         search_query = f"{query} jobs {location}".strip()
-        url = f"https://www.google.com/search?q={search_query}+site:linkedin.com/jobs+OR+site:indeed.com+OR+site:glassdoor.com"
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url, headers=headers, follow_redirects=True)
-
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
-                results = []
-
-                for g in soup.select("div.g")[:10]:
-                    title_el = g.select_one("h3")
-                    link_el = g.select_one("a")
-                    snippet_el = g.select_one("div.VwiC3b")
-
-                    if title_el and link_el:
-                        href = link_el.get("href", "")
-                        title = title_el.get_text()
-                        snippet = snippet_el.get_text() if snippet_el else ""
-
-                        source = "Web"
-                        if "linkedin.com" in href:
-                            source = "LinkedIn"
-                        elif "indeed.com" in href:
-                            source = "Indeed"
-                        elif "glassdoor.com" in href:
-                            source = "Glassdoor"
-
-                        results.append({
-                            "title": title,
-                            "company": extract_company(title, snippet),
-                            "location": location or "Various",
-                            "salary": extract_salary(snippet),
-                            "description": snippet[:300],
-                            "skills": extract_skills_from_text(snippet),
-                            "source": source,
-                            "url": href,
-                            "posted": "Recent",
-                            "type": "Full-time"
-                        })
-
-                if results:
-                    return results
+        params = {"q": f"{search_query} site:linkedin.com/jobs OR site:indeed.com OR site:glassdoor.com"}
+        if page > 1:
+            params["start"] = (page - 1) * 10
+
+        response = await get_search_client().get(SEARCH_URL, params=params)
+        if response.status_code == 200:
+            soup = BeautifulSoup(response.text, "html.parser")
+            results = []
+
+            for g in soup.select("div.g")[:10]:
+                title_el = g.select_one("h3")
+                link_el = g.select_one("a")
+                snippet_el = g.select_one("div.VwiC3b")
+
+                if title_el and link_el:
+                    href = link_el.get("href", "")
+                    title = title_el.get_text()
+                    snippet = snippet_el.get_text() if snippet_el else ""
+
+                    source = "Web"
+                    if "linkedin.com" in href:
+                        source = "LinkedIn"
+                    elif "indeed.com" in href:
+                        source = "Indeed"
+                    elif "glassdoor.com" in href:
+                        source = "Glassdoor"
+
+                    results.append({
+                        "title": title,
+                        "company": extract_company(title, snippet),
+                        "location": location or "Various",
+                        "salary": extract_salary(snippet),
+                        "description": snippet[:300],
+                        "skills": extract_skills_from_text(snippet),
+                        "source": source,
+                        "url": href,
+                        "posted": "Recent",
+                        "type": "Full-time"
+                    })
+
+            return results
 
     except Exception as e:
         logger.warning(f"Web search failed: {e}")
 
-    return get_filtered_sample_jobs(query, location)
+    return []
+
+
+async def search_jobs_web(query: str, location: str = "", page: int = 1) -> list:
+    """Search for jobs on the web, falling back to the sample jobs"""
+    return await search_jobs_live(query, location, page) or get_filtered_sample_jobs(query, location)
 
 
 def get_filtered_sample_jobs(query: str, location: str = "") -> list:
     """Return filtered sample jobs based on query"""
-    query_lower = query.lower()
-    location_lower = location.lower() if location else ""
-
-    scored_jobs = []
-    for job in SAMPLE_JOBS:
-        score = 0
-        title_lower = job["title"].lower()
-        desc_lower = job["description"].lower()
-        loc_lower = job["location"].lower()
-        skills_str = " ".join(job["skills"]).lower()
-
-        for word in query_lower.split():
-            if word in title_lower:
-                score += 3
-            if word in desc_lower:
-                score += 1
-            if word in skills_str:
-                score += 2
-
-        if location_lower and (location_lower in loc_lower or "remote" in loc_lower):
-            score += 2
-
-        if score > 0 or not query_lower:
-            scored_jobs.append((score, job))
-
-    scored_jobs.sort(key=lambda x: x[0], reverse=True)
-
-    if not scored_jobs:
+    results = JOB_INDEX.search(query, location, limit=8)
+    if not results:
         return SAMPLE_JOBS[:5]
-
-    return [j for _, j in scored_jobs[:8]]
+    return results
 
 
 def extract_company(title: str, snippet: str) -> str:
@@ -250,14 +284,5 @@ def extract_salary(text: str) -> str:
 
 def extract_skills_from_text(text: str) -> list:
     """Extract skill keywords from text"""
-    common_skills = [
-        "python", "javascript", "react", "node.js", "aws", "docker",
-        "kubernetes", "sql", "mongodb", "typescript", "java", "go",
-        "machine learning", "deep learning", "tensorflow", "pytorch",
-        "ci/cd", "devops", "agile", "scrum", "git", "linux",
-        "api", "rest", "graphql", "html", "css", "tailwind",
-        "fastapi", "django", "flask", "spring", "angular", "vue"
-    ]
-    text_lower = text.lower()
-    found = [s for s in common_skills if s in text_lower]
+    found = SKILL_MATCHER.find(text)
     return found[:6] if found else ["see description"]
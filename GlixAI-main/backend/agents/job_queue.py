@@ -0,0 +1,166 @@
+"""
+GlixAI Job Queue
+Background execution of LLM-heavy requests, with job state in Mongo, polling and webhooks
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlparse
+
+import httpx
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+JOB_RESULT_TTL_SECONDS = int(os.environ.get('JOB_RESULT_TTL_SECONDS', 24 * 3600))
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class JobQueue:
+    """In-process queue of jobs run by a fixed pool of worker tasks.
+
+    Work waits in an asyncio queue of at most ``max_pending`` jobs and at
+    most ``workers`` jobs run at once. Each job's state (queued, running,
+    done or failed, and the result or error) lives in the ``jobs``
+    collection, so whichever process answers ``GET /api/jobs/{id}`` can
+    report it. Finished jobs expire ``JOB_RESULT_TTL_SECONDS`` later.
+
+    A job may name a webhook URL. When the job finishes, the job document
+    is POSTed there once. Only hosts in JOB_WEBHOOK_ALLOWED_HOSTS are
+    accepted, so that callers cannot make the server reach arbitrary hosts.
+    """
+
+    def __init__(self, collection, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.collection = collection
+        self.workers = workers or int(os.environ.get('JOB_WORKERS', 4))
+        self.max_pending = max_pending or int(os.environ.get('JOB_QUEUE_SIZE', 1000))
+        self.webhook_hosts = {
+            host.strip().lower()
+            for host in os.environ.get('JOB_WEBHOOK_ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
+            if host.strip()
+        }
+        self.webhook_timeout = float(os.environ.get('JOB_WEBHOOK_TIMEOUT_SECONDS', 5))
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks = []
+        self._active = set()
+        # Slots taken by submit() calls still writing their job document.
+        self._reserved = 0
+        self._http: Optional[httpx.AsyncClient] = None
+
+    def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._http = httpx.AsyncClient(timeout=self.webhook_timeout)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"Job queue started (workers={self.workers}, max_pending={self.max_pending})")
+
+    async def close(self):
+        """Stop the workers; jobs that had not finished are marked failed"""
+        # Taken first: a cancelled worker drops its job from _active on the way out.
+        interrupted = list(self._active)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if interrupted:
+            await self.collection.update_many(
+                {"id": {"$in": interrupted}, "status": {"$in": ["queued", "running"]}},
+                {"$set": {"status": "failed", "error": "Interrupted by server shutdown", **self._finished_fields()}},
+            )
+        self._active.clear()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def check_webhook(self, url: str) -> Optional[str]:
+        """Why a webhook URL is refused, or None when it is acceptable"""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            return "Webhook URL must be an absolute http(s) URL."
+        if parsed.hostname.lower() not in self.webhook_hosts:
+            return f"Webhook host {parsed.hostname} is not allowed."
+        return None
+
+    async def submit(self, kind: str, run: Callable[[], Awaitable[dict]], webhook_url: Optional[str] = None) -> dict:
+        """Queue run() and return the new job's document; raises JobQueueFull when the queue is full"""
+        if self._queue is None:
+            self.start()
+        # The slot is reserved before the insert is awaited, so concurrent
+        # submissions cannot all pass the check and then overflow the queue.
+        if self._queue.qsize() + self._reserved >= self.max_pending:
+            raise JobQueueFull(f"{self.max_pending} jobs already waiting")
+        self._reserved += 1
+        job = {
+            "id": str(uuid.uuid4()),
+            "kind": kind,
+            "status": "queued",
+            "webhook_url": webhook_url,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        try:
+            await self.collection.insert_one(dict(job))
+        finally:
+            self._reserved -= 1
+        self._active.add(job["id"])
+        self._queue.put_nowait((job["id"], run))
+        return job
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await self.collection.find_one({"id": job_id}, {"_id": 0, "expire_at": 0})
+
+    @staticmethod
+    def _finished_fields() -> dict:
+        now = datetime.now(timezone.utc)
+        # expire_at is a BSON date, which the TTL index needs.
+        return {"finished_at": now.isoformat(), "expire_at": now + timedelta(seconds=JOB_RESULT_TTL_SECONDS)}
+
+    async def _worker(self):
+        while True:
+            job_id, run = await self._queue.get()
+            try:
+                await self._run(job_id, run)
+            except Exception as e:
+                logger.error(f"Job {job_id} could not be recorded: {e}")
+            finally:
+                self._active.discard(job_id)
+                self._queue.task_done()
+
+    async def _run(self, job_id: str, run: Callable[[], Awaitable[dict]]):
+        await self.collection.update_one(
+            {"id": job_id}, {"$set": {"status": "running", "started_at": datetime.now(timezone.utc).isoformat()}}
+        )
+        try:
+            update = {"status": "done", "result": await run()}
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e!r}")
+            update = {"status": "failed", "error": str(e)}
+        job = await self.collection.find_one_and_update(
+            {"id": job_id}, {"$set": {**update, **self._finished_fields()}},
+            projection={"_id": 0, "expire_at": 0}, return_document=ReturnDocument.AFTER,
+        )
+        if job and job.get("webhook_url"):
+            await self._notify(job)
+
+    async def _notify(self, job: dict):
+        try:
+            response = await self._http.post(job["webhook_url"], json=job)
+            outcome = {"webhook_status": response.status_code}
+        except Exception as e:
+            logger.warning(f"Webhook for job {job['id']} failed: {e!r}")
+            outcome = {"webhook_status": None, "webhook_error": str(e)}
+        await self.collection.update_one({"id": job["id"]}, {"$set": outcome})
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self._tasks),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "active": len(self._active),
+        }
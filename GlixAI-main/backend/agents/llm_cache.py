@@ -0,0 +1,111 @@
+"""
+GlixAI LLM Response Cache
+Content-addressed cache for deterministic prompts, in memory with an optional Mongo tier
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model: str, system_message: str, prompt: str) -> str:
+    """Hash of the model and the whitespace-normalized prompt"""
+    normalized = " ".join(prompt.split())
+    payload = "\0".join([model, " ".join(system_message.split()), normalized])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LlmResponseCache:
+    """Two-tier cache of LLM replies keyed by prompt hash.
+
+    The first tier is an in-process LRU. The optional second tier is a Mongo
+    collection, shared by every worker and surviving restarts; each entry
+    carries an ``expire_at`` for the TTL index in shared.mongo_indexes.
+    Mongo errors are logged and treated as misses.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[int] = None):
+        self.max_entries = max_entries or int(os.environ.get('LLM_CACHE_SIZE', 512))
+        self.ttl_seconds = ttl_seconds or int(os.environ.get('LLM_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+        self.memory_hits = 0
+        self.mongo_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._collection = None
+
+    def use_mongo(self, collection):
+        """Enable the Mongo tier"""
+        self._collection = collection
+
+    def _remember(self, key: str, response: str):
+        self._entries[key] = (response, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            response, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return response
+            del self._entries[key]
+
+        if self._collection is not None:
+            try:
+                doc = await self._collection.find_one({"_id": key}, {"response": 1})
+            except Exception as e:
+                logger.warning(f"LLM cache lookup failed: {e}")
+                doc = None
+            if doc:
+                self.mongo_hits += 1
+                self._remember(key, doc["response"])
+                return doc["response"]
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, response: str, model: str = ""):
+        self._remember(key, response)
+        if self._collection is None:
+            return
+        now = datetime.now(timezone.utc)
+        try:
+            await self._collection.update_one(
+                {"_id": key},
+                # expire_at is a BSON date, which the TTL index needs.
+                {"$set": {"response": response, "model": model, "created_at": now,
+                          "expire_at": now + timedelta(seconds=self.ttl_seconds)}},
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.mongo_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "mongo_hits": self.mongo_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.mongo_hits) / lookups * 100, 1) if lookups else 0.0,
+        }
+
+
+_cache: Optional[LlmResponseCache] = None
+
+
+def get_llm_cache() -> LlmResponseCache:
+    """Return the process-wide cache, creating it on first use"""
+    global _cache
+    if _cache is None:
+        _cache = LlmResponseCache()
+    return _cache
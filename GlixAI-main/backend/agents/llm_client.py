@@ -0,0 +1,195 @@
+"""
+GlixAI LLM Client Manager
+Long-lived, concurrency-bounded access to the Emergent LLM provider
+"""
+
+import asyncio
+import os
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+import litellm
+from emergentintegrations.llm.chat import LlmChat, UserMessage
+
+from shared.metrics import metrics, span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROVIDER = "openai"
+DEFAULT_MODEL = "gpt-5.2"
+# Emergent universal keys only work through Emergent's proxy, which litellm
+# reaches when LLM_API_BASE points at it.
+EMERGENT_KEY_PREFIX = "sk-emergent-"
+TOKENS_HELP = "LLM tokens sent and received, estimated at four characters per token"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token), good enough for budgeting"""
+    return len(text) // 4 + 1
+
+
+def count_tokens(direction: str, text: str):
+    metrics.add("glixai_llm_tokens_total", TOKENS_HELP, {"direction": direction}, estimate_tokens(text))
+
+
+class LlmClientManager:
+    """Shared LLM access for the whole process.
+
+    Reads the API key once, keeps one pooled keep-alive HTTP client for the
+    provider and caps the number of requests in flight. Callers beyond the
+    cap wait their turn instead of flooding the provider.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, max_in_flight: Optional[int] = None,
+                 provider: str = DEFAULT_PROVIDER, model: str = DEFAULT_MODEL, timeout: float = 120.0):
+        self.api_key = api_key if api_key is not None else os.environ.get('EMERGENT_LLM_KEY')
+        self.api_base = os.environ.get('LLM_API_BASE') or None
+        self.max_in_flight = max_in_flight or int(os.environ.get('LLM_MAX_IN_FLIGHT', 16))
+        self.provider = provider
+        self.model = model
+        self.timeout = timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._http: Optional[httpx.AsyncClient] = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    @property
+    def can_stream(self) -> bool:
+        """Whether litellm can reach the provider LlmChat uses with this key"""
+        return self.configured and (bool(self.api_base) or not self.api_key.startswith(EMERGENT_KEY_PREFIX))
+
+    async def start(self):
+        """Open the pooled HTTP client and route provider calls through it"""
+        if self._http is not None:
+            return
+        self._http = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_in_flight,
+                max_keepalive_connections=self.max_in_flight,
+                keepalive_expiry=60,
+            ),
+        )
+        litellm.aclient_session = self._http
+        logger.info(f"LLM client started (max_in_flight={self.max_in_flight}, streaming={self.can_stream})")
+        if self.configured and not self.can_stream:
+            message = ("EMERGENT_LLM_KEY is an Emergent key but LLM_API_BASE is not set, so litellm cannot "
+                       "reach the provider; /api/chat/stream will send every reply as a single chunk")
+            if os.environ.get('LLM_STREAMING_REQUIRED', 'false').lower() == 'true':
+                await self.close()
+                raise RuntimeError(message)
+            logger.error(message)
+
+    async def close(self):
+        if self._http is None:
+            return
+        if litellm.aclient_session is self._http:
+            litellm.aclient_session = None
+        await self._http.aclose()
+        self._http = None
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Hold one of the in-flight slots, queueing until one is free"""
+        self.waiting += 1
+        try:
+            with span("llm_wait"):
+                await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    async def _send(self, session_id: str, system_message: str, text: str) -> str:
+        chat = LlmChat(
+            api_key=self.api_key,
+            session_id=session_id,
+            system_message=system_message
+        )
+        chat.with_model(self.provider, self.model)
+        return await chat.send_message(UserMessage(text=text))
+
+    async def send(self, session_id: str, system_message: str, text: str) -> str:
+        """Send one user message, waiting for a free slot if the cap is reached"""
+        async with self._slot():
+            count_tokens("prompt", system_message + text)
+            with span("llm"):
+                reply = await self._send(session_id, system_message, text)
+            count_tokens("completion", reply)
+            return reply
+
+    async def stream(self, session_id: str, system_message: str, text: str) -> AsyncIterator[str]:
+        """Yield the reply in chunks as the provider generates it.
+
+        LlmChat has no streaming call, so this goes through litellm directly,
+        with the same provider, model and key plus LLM_API_BASE. When litellm
+        cannot reach the provider (see ``can_stream``) or rejects the request,
+        the whole reply is fetched through LlmChat and yielded as one chunk.
+        """
+        async with self._slot():
+            with span("llm"):
+                count_tokens("prompt", system_message + text)
+                if not self.can_stream:
+                    reply = await self._send(session_id, system_message, text)
+                    count_tokens("completion", reply)
+                    yield reply
+                    return
+                try:
+                    response = await litellm.acompletion(
+                        model=f"{self.provider}/{self.model}",
+                        messages=[
+                            {"role": "system", "content": system_message},
+                            {"role": "user", "content": text},
+                        ],
+                        api_key=self.api_key,
+                        api_base=self.api_base,
+                        timeout=self.timeout,
+                        stream=True,
+                    )
+                except Exception as e:
+                    logger.warning(f"LLM streaming unavailable, sending a single reply: {e}")
+                    reply = await self._send(session_id, system_message, text)
+                    count_tokens("completion", reply)
+                    yield reply
+                    return
+
+                async for chunk in response:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        count_tokens("completion", delta)
+                        yield delta
+
+
+_manager: Optional[LlmClientManager] = None
+
+
+def get_llm_client() -> LlmClientManager:
+    """Return the process-wide manager, creating it on first use"""
+    global _manager
+    if _manager is None:
+        _manager = LlmClientManager()
+    return _manager
+
+
+async def start_llm_client() -> LlmClientManager:
+    manager = get_llm_client()
+    await manager.start()
+    return manager
+
+
+async def close_llm_client():
+    global _manager
+    if _manager is not None:
+        await _manager.close()
+        _manager = None
@@ -0,0 +1,140 @@
+"""
+GlixAI PDF Extraction Service
+Page-parallel PDF text extraction on a bounded process pool
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Optional
+
+import PyPDF2
+
+from shared.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+def _on_timeout(signum, frame):
+    raise TimeoutError("PDF extraction timed out")
+
+
+def _extract_page_range(content: bytes, start: int, end: int, timeout: float) -> tuple:
+    """Worker: return the document page count and the text of pages [start, end).
+
+    Raises TimeoutError after ``timeout`` seconds of work. The alarm is set
+    in the worker, so time spent queued for a worker does not count, and a
+    PDF that makes the parser spin frees the worker instead of holding it.
+    """
+    signal.signal(signal.SIGALRM, _on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        reader = PyPDF2.PdfReader(io.BytesIO(content))
+        total = len(reader.pages)
+        return total, [reader.pages[i].extract_text() or "" for i in range(start, min(end, total))]
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class PdfExtractor:
+    """Extracts PDF text off the event loop.
+
+    Pages are split into ranges that run on separate worker processes, and
+    are yielded in order as soon as each range is done, so callers can start
+    on the first pages while later ones are still being parsed. Documents
+    are cut off at ``max_pages``. Each page range may run for ``timeout``
+    seconds once a worker starts on it; past that, iteration raises
+    TimeoutError after the pages already yielded.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pages: Optional[int] = None,
+                 timeout: Optional[float] = None, pages_per_task: Optional[int] = None):
+        self.max_workers = max_workers or int(os.environ.get('PDF_WORKERS', min(4, os.cpu_count() or 1)))
+        self.max_pages = max_pages or int(os.environ.get('PDF_MAX_PAGES', 50))
+        self.timeout = timeout or float(os.environ.get('PDF_TIMEOUT_SECONDS', 20))
+        self.pages_per_task = pages_per_task or int(os.environ.get('PDF_PAGES_PER_TASK', 4))
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        if self._pool is None:
+            # Spawned rather than forked: the server process runs threads
+            # (Mongo driver, thread pool) that are unsafe to fork.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @timed("pdf_extract")
+    async def iter_pages(self, content: bytes) -> AsyncIterator[str]:
+        """Yield the text of each non-empty page, in page order"""
+        self.start()
+        loop = asyncio.get_running_loop()
+
+        def submit(start: int, end: int):
+            return loop.run_in_executor(self._pool, _extract_page_range, content, start, end, self.timeout)
+
+        async def result(future):
+            try:
+                return await future
+            except BrokenProcessPool:
+                # A worker died (killed, out of memory); later calls get a fresh pool.
+                logger.error("PDF worker pool broke; restarting it")
+                self.close()
+                raise
+
+        # The first range also reports the page count, so it is sent alone.
+        first_end = min(self.pages_per_task, self.max_pages)
+        total, texts = await result(submit(0, first_end))
+        for text in texts:
+            if text:
+                yield text
+
+        last = min(total, self.max_pages)
+        if total > self.max_pages:
+            logger.info(f"PDF has {total} pages, extracting the first {self.max_pages}")
+
+        pending = [
+            submit(start, min(start + self.pages_per_task, last))
+            for start in range(first_end, last, self.pages_per_task)
+        ]
+        try:
+            for future in pending:
+                _, texts = await result(future)
+                for text in texts:
+                    if text:
+                        yield text
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def extract_text(self, content: bytes) -> str:
+        pages = [page async for page in self.iter_pages(content)]
+        return "".join(page + "\n" for page in pages)
+
+
+_extractor: Optional[PdfExtractor] = None
+
+
+def get_pdf_extractor() -> PdfExtractor:
+    """Return the process-wide extractor, creating it on first use"""
+    global _extractor
+    if _extractor is None:
+        _extractor = PdfExtractor()
+    return _extractor
+
+
+def close_pdf_extractor():
+    global _extractor
+    if _extractor is not None:
+        _extractor.close()
+        _extractor = None
@@ -1,9 +1,41 @@
 import logging
 import re
+from shared.keyword_matcher import KeywordMatcher
+from shared.metrics import timed
 
 logger = logging.getLogger(__name__)
 
-
+ALL_SKILLS = [
+    "python", "javascript", "typescript", "java", "c++", "c#", "go", "rust",
+    "ruby", "php", "swift", "kotlin", "scala", "r", "matlab",
+    "react", "angular", "vue", "svelte", "next.js", "nuxt",
+    "node.js", "express", "fastapi", "django", "flask", "spring boot",
+    "rails", "laravel", "asp.net",
+    "html", "css", "sass", "tailwind", "bootstrap",
+    "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
+    "dynamodb", "sqlite", "oracle", "sql server", "cassandra",
+    "aws", "azure", "gcp", "google cloud", "heroku", "vercel",
+    "docker", "kubernetes", "terraform", "ansible", "jenkins",
+    "ci/cd", "github actions", "gitlab",
+    "tensorflow", "pytorch", "scikit-learn", "keras", "opencv",
+    "pandas", "numpy", "matplotlib", "jupyter",
+    "machine learning", "deep learning", "nlp", "computer vision",
+    "data analysis", "data science", "data engineering",
+    "git", "linux", "bash", "powershell",
+    "rest api", "graphql", "grpc", "websocket",
+    "agile", "scrum", "jira", "confluence",
+    "figma", "sketch", "adobe xd",
+    "react native", "flutter", "android", "ios",
+    "microservices", "serverless", "event-driven",
+    "sql", "nosql", "etl", "big data", "spark", "hadoop",
+    "llm", "transformers", "langchain", "rag",
+    "prompt engineering", "fine-tuning",
+]
+
+SKILL_MATCHER = KeywordMatcher(ALL_SKILLS)
+
+
+@timed("resume_parse")
 def parse_resume_text(text: str) -> dict:
     """Parse resume text and extract structured information"""
     text_lower = text.lower()
@@ -25,39 +57,7 @@ def parse_resume_text(text: str) -> dict:
 
 def extract_skills(text: str) -> list:
     """Extract technical skills from resume text"""
-    all_skills = [
-        "python", "javascript", "typescript", "java", "c++", "c#", "go", "rust",
-        "ruby", "php", "swift", "kotlin", "scala", "r", "matlab",
-        "react", "angular", "vue", "svelte", "next.js", "nuxt",
-        "node.js", "express", "fastapi", "django", "flask", "spring boot",
-        "rails", "laravel", "asp.net",
-        "html", "css", "sass", "tailwind", "bootstrap",
-        "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
-        "dynamodb", "sqlite", "oracle", "sql server", "cassandra",
-        "aws", "azure", "gcp", "google cloud", "heroku", "vercel",
-        "docker", "kubernetes", "terraform", "ansible", "jenkins",
-        "ci/cd", "github actions", "gitlab",
-        "tensorflow", "pytorch", "scikit-learn", "keras", "opencv",
-        "pandas", "numpy", "matplotlib", "jupyter",
-        "machine learning", "deep learning", "nlp", "computer vision",
-        "data analysis", "data science", "data engineering",
-        "git", "linux", "bash", "powershell",
-        "rest api", "graphql", "grpc", "websocket",
-        "agile", "scrum", "jira", "confluence",
-        "figma", "sketch", "adobe xd",
-        "react native", "flutter", "android", "ios",
-        "microservices", "serverless", "event-driven",
-        "sql", "nosql", "etl", "big data", "spark", "hadoop",
-        "llm", "transformers", "langchain", "rag",
-        "prompt engineering", "fine-tuning",
-    ]
-
-    found = []
-    for skill in all_skills:
-        if skill in text:
-            found.append(skill)
-
-    return list(set(found))
+    return SKILL_MATCHER.find(text)
 
 
 def estimate_experience(text: str) -> str:
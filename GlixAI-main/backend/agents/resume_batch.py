@@ -0,0 +1,271 @@
+"""
+GlixAI Batch Resume Analyzer
+Analyzes many uploaded resumes at once and persists them in bulk
+"""
+
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import uuid
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from agents.chat_engine import analyze_resume_with_ai
+from agents.pdf_extractor import get_pdf_extractor
+from agents.resume_rules import analyze_rules
+
+logger = logging.getLogger(__name__)
+
+RESUME_EXTENSIONS = ('.pdf', '.txt', '.md')
+
+
+def expand_uploads(uploads: List[Tuple[str, bytes]], max_files: int, max_file_bytes: int,
+                   max_total_bytes: int) -> List[Tuple[str, bytes, Optional[str]]]:
+    """Flatten uploaded files and zip archives into (filename, content, error) triples.
+
+    Files over ``max_file_bytes``, whether uploaded directly or inside an
+    archive, get an error entry in place of their content, as does a direct
+    upload that would take the batch past ``max_total_bytes``. Archives are
+    checked before any member is read: one with more entries than
+    ``max_files``, or whose declared sizes would take the batch past
+    ``max_total_bytes``, is refused as a whole. zipfile never inflates a
+    member past its declared size, so the declared sizes bound memory.
+    """
+    files = []
+    total_bytes = 0
+    for filename, content in uploads:
+        if len(files) >= max_files:
+            break
+        if not (filename or "").lower().endswith('.zip'):
+            if len(content) > max_file_bytes:
+                logger.warning(f"Skipping {filename}: {len(content)} bytes")
+                files.append((filename, b"", f"File is larger than {max_file_bytes} bytes."))
+            elif total_bytes + len(content) > max_total_bytes:
+                logger.warning(f"Skipping {filename}: batch past {max_total_bytes} bytes")
+                files.append((filename, b"", f"File takes the batch past the {max_total_bytes} byte limit."))
+            else:
+                total_bytes += len(content)
+                files.append((filename, content, None))
+            continue
+        try:
+            archive = zipfile.ZipFile(io.BytesIO(content))
+        except zipfile.BadZipFile as e:
+            logger.warning(f"Skipping unreadable archive {filename}: {e}")
+            files.append((filename, b"", "Unreadable zip archive."))
+            continue
+
+        entries = archive.infolist()
+        if len(entries) > max_files:
+            logger.warning(f"Refusing archive {filename}: {len(entries)} entries")
+            files.append((filename, b"", f"Archive has more than {max_files} entries."))
+            continue
+        members = [
+            info for info in entries
+            if not info.is_dir() and not info.filename.startswith('__MACOSX/')
+            and info.filename.lower().endswith(RESUME_EXTENSIONS)
+        ][:max_files - len(files)]
+        archive_bytes = sum(info.file_size for info in members if info.file_size <= max_file_bytes)
+        if total_bytes + archive_bytes > max_total_bytes:
+            logger.warning(f"Refusing archive {filename}: {archive_bytes} bytes uncompressed")
+            files.append((filename, b"", f"Archive expands past the {max_total_bytes} byte batch limit."))
+            continue
+
+        total_bytes += archive_bytes
+        for info in members:
+            if info.file_size > max_file_bytes:
+                logger.warning(f"Skipping {info.filename} in {filename}: {info.file_size} bytes")
+                files.append((info.filename, b"", f"File is larger than {max_file_bytes} bytes."))
+                continue
+            files.append((info.filename, archive.read(info), None))
+    return files[:max_files]
+
+
+class ResumeBatchAnalyzer:
+    """Runs resume batches through the same analysis as /resume/analyze.
+
+    Text extraction goes through the shared PDF pool, the rule-based
+    analyzers run on a process pool of their own and at most
+    ``llm_concurrency`` LLM calls per batch are in flight, so one large
+    batch cannot take every slot of the shared LLM client. A batch sends at
+    most as many PDFs to the extraction pool as it has workers. Results are
+    yielded as each file finishes and written with ordered ``insert_many``
+    calls of ``insert_chunk`` documents.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, llm_concurrency: Optional[int] = None,
+                 insert_chunk: Optional[int] = None, max_files: Optional[int] = None,
+                 max_file_bytes: Optional[int] = None, max_total_bytes: Optional[int] = None):
+        self.max_workers = max_workers or int(os.environ.get('BATCH_WORKERS', min(4, os.cpu_count() or 1)))
+        self.llm_concurrency = llm_concurrency or int(os.environ.get('BATCH_LLM_CONCURRENCY', 4))
+        self.insert_chunk = insert_chunk or int(os.environ.get('BATCH_INSERT_CHUNK', 50))
+        self.max_files = max_files or int(os.environ.get('BATCH_MAX_FILES', 500))
+        self.max_file_bytes = max_file_bytes or int(os.environ.get('BATCH_MAX_FILE_BYTES', 10 * 1024 * 1024))
+        self.max_total_bytes = max_total_bytes or int(os.environ.get('BATCH_MAX_TOTAL_BYTES', 200 * 1024 * 1024))
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _extract_text(self, filename: str, content: bytes, pdf_slots: asyncio.Semaphore) -> Tuple[str, Optional[str]]:
+        """The file's text, and an error when none could be extracted"""
+        if not filename.lower().endswith('.pdf'):
+            return content.decode('utf-8', errors='ignore'), None
+        pages = []
+        async with pdf_slots:
+            try:
+                async for page in get_pdf_extractor().iter_pages(content):
+                    pages.append(page)
+            except TimeoutError:
+                # Pages extracted before the timeout are still analyzed.
+                logger.warning(f"PDF extraction of {filename} timed out after {len(pages)} page(s)")
+                if not pages:
+                    return "", "timeout"
+            except Exception as e:
+                logger.error(f"PDF parse error in {filename}: {e!r}")
+                if not pages:
+                    return "", "Could not extract text from the uploaded PDF."
+        return "".join(page + "\n" for page in pages), None
+
+    async def _analyze_file(self, index: int, filename: str, content: bytes, error: Optional[str],
+                            llm_slots: asyncio.Semaphore, pdf_slots: asyncio.Semaphore) -> dict:
+        try:
+            return await self._analyze_text(index, filename, content, error, llm_slots, pdf_slots)
+        except Exception as e:
+            logger.error(f"Batch resume analysis of {filename} failed: {e!r}")
+            return {"index": index, "filename": filename, "status": "error", "error": str(e) or repr(e)}
+
+    async def _analyze_text(self, index: int, filename: str, content: bytes, error: Optional[str],
+                            llm_slots: asyncio.Semaphore, pdf_slots: asyncio.Semaphore) -> dict:
+        if error is None:
+            text, error = await self._extract_text(filename, content, pdf_slots)
+            if error is None and not text.strip():
+                error = "Could not extract text from the uploaded file."
+        if error is not None:
+            return {"index": index, "filename": filename, "status": "error", "error": error}
+
+        async def ai_analysis():
+            async with llm_slots:
+                return await analyze_resume_with_ai(f"resume-{str(uuid.uuid4())[:8]}", text[:3000])
+
+        async def rules_analysis():
+            self.start()
+            pool = self._pool
+            try:
+                return await asyncio.get_running_loop().run_in_executor(pool, analyze_rules, text)
+            except BrokenProcessPool:
+                # A worker died (killed, out of memory); later files get a fresh pool.
+                if self._pool is pool:
+                    logger.error("Batch rules pool broke; restarting it")
+                    self.close()
+                raise
+
+        ai, (parsed, eq_sq) = await asyncio.gather(ai_analysis(), rules_analysis())
+        return {
+            "index": index,
+            "filename": filename,
+            "status": "ok",
+            "resume_id": str(uuid.uuid4()),
+            "parsed": parsed,
+            "ai_analysis": ai,
+            "eq_sq": eq_sq,
+        }
+
+    async def _flush(self, collection, docs: List[dict]) -> Tuple[int, Optional[str]]:
+        try:
+            result = await collection.insert_many(docs, ordered=True)
+            return len(result.inserted_ids), None
+        except BulkWriteError as e:
+            # An ordered insert stops at the first failure; everything before it is stored.
+            written = e.details.get("nInserted", 0)
+            logger.error(f"Batch resume insert stopped after {written} of {len(docs)}: {e}")
+            return written, str(e)
+        except Exception as e:
+            logger.error(f"Batch resume insert failed: {e}")
+            return 0, str(e)
+
+    async def run(self, uploads: List[Tuple[str, bytes]], collection) -> AsyncIterator[dict]:
+        """Yield one result per file as it completes, then a summary"""
+        self.start()
+        files = expand_uploads(uploads, self.max_files, self.max_file_bytes, self.max_total_bytes)
+        llm_slots = asyncio.Semaphore(self.llm_concurrency)
+        pdf_slots = asyncio.Semaphore(get_pdf_extractor().max_workers)
+        tasks = [
+            asyncio.create_task(self._analyze_file(i, name, content, error, llm_slots, pdf_slots))
+            for i, (name, content, error) in enumerate(files)
+        ]
+
+        pending_docs, saved, failed, write_errors = [], 0, 0, []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result["status"] == "ok":
+                    pending_docs.append({
+                        "id": result["resume_id"],
+                        "filename": result["filename"],
+                        "parsed_data": result["parsed"],
+                        "ai_analysis": result["ai_analysis"],
+                        "eq_sq_assessment": result["eq_sq"],
+                        "uploaded_at": datetime.now(timezone.utc).isoformat(),
+                    })
+                else:
+                    failed += 1
+                yield result
+
+                if len(pending_docs) >= self.insert_chunk:
+                    written, error = await self._flush(collection, pending_docs)
+                    saved += written
+                    if error:
+                        write_errors.append(error)
+                    pending_docs = []
+
+            if pending_docs:
+                written, error = await self._flush(collection, pending_docs)
+                saved += written
+                if error:
+                    write_errors.append(error)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield {
+            "status": "done",
+            "total": len(files),
+            "analyzed": len(files) - failed,
+            "failed": failed,
+            "saved": saved,
+            "write_errors": write_errors,
+        }
+
+
+_analyzer: Optional[ResumeBatchAnalyzer] = None
+
+
+def get_resume_batch_analyzer() -> ResumeBatchAnalyzer:
+    """Return the process-wide batch analyzer, creating it on first use"""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = ResumeBatchAnalyzer()
+    return _analyzer
+
+
+def close_resume_batch_analyzer():
+    global _analyzer
+    if _analyzer is not None:
+        _analyzer.close()
+        _analyzer = None
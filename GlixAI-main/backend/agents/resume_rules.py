@@ -0,0 +1,16 @@
+"""
+GlixAI Resume Rules Worker
+Rule-based resume analysis run on the batch analyzer's worker processes
+"""
+
+from agents.eq_scoring import analyze_eq_sq
+from agents.resume_analyzer import parse_resume_text
+
+
+def analyze_rules(text: str) -> tuple:
+    """Worker: run the rule-based analyzers on one resume.
+
+    Kept apart from resume_batch so spawned workers import only the
+    analyzers, not the LLM client and its dependencies.
+    """
+    return parse_resume_text(text), analyze_eq_sq(text)
@@ -3,6 +3,9 @@ GlixAI Automation Risk Indexer
 Calculates job sustainability vs AI automation trends
 """
 
+from shared.role_resolver import RoleResolver
+from shared.skill_dictionary import SKILL_DICTIONARY
+
 # Automation vulnerability by job characteristics
 AUTOMATION_FACTORS = {
     "repetitive_tasks": 0.85,
@@ -147,14 +150,16 @@ SHADOW_SALARIES = {
     "product manager": {"low": 110000, "median": 155000, "high": 220000, "trend": "+5%", "demand": "Very High"},
 }
 
+# Title -> profile key resolution for the tables above
+RISK_ROLE_RESOLVER = RoleResolver(ROLE_RISK_PROFILES, aliases=SKILL_DICTIONARY)
+SALARY_ROLE_RESOLVER = RoleResolver(SHADOW_SALARIES, aliases=SKILL_DICTIONARY)
+
 
 def calculate_automation_risk(job_title: str) -> dict:
     """Calculate automation risk for a job title"""
-    title_lower = job_title.lower().strip()
-
-    # Direct match
-    if title_lower in ROLE_RISK_PROFILES:
-        profile = ROLE_RISK_PROFILES[title_lower]
+    role = RISK_ROLE_RESOLVER.resolve(job_title)
+    if role:
+        profile = ROLE_RISK_PROFILES[role]
         return {
             "job_title": job_title,
             "risk_score": profile["risk_score"],
@@ -165,19 +170,6 @@ def calculate_automation_risk(job_title: str) -> dict:
             "mitigation": profile["mitigation"],
         }
 
-    # Fuzzy match
-    for role, profile in ROLE_RISK_PROFILES.items():
-        if any(word in title_lower for word in role.split()):
-            return {
-                "job_title": job_title,
-                "risk_score": profile["risk_score"],
-                "risk_level": get_risk_level(profile["risk_score"]),
-                "human_necessity": 100 - profile["risk_score"],
-                "horizon": profile["horizon"],
-                "key_factors": profile["factors"],
-                "mitigation": profile["mitigation"],
-            }
-
     # Default for unknown roles
     return {
         "job_title": job_title,
@@ -205,15 +197,9 @@ def get_risk_level(score: int) -> str:
 
 def get_shadow_salary(role: str) -> dict:
     """Get shadow salary data for a role"""
-    role_lower = role.lower().strip()
-
-    if role_lower in SHADOW_SALARIES:
-        data = SHADOW_SALARIES[role_lower]
-        return {"role": role, **data, "source": "GlixAI Shadow Data (30-day market analysis)"}
-
-    for key, data in SHADOW_SALARIES.items():
-        if any(word in role_lower for word in key.split()):
-            return {"role": role, **data, "source": "GlixAI Shadow Data (30-day market analysis)"}
+    key = SALARY_ROLE_RESOLVER.resolve(role)
+    if key:
+        return {"role": role, **SHADOW_SALARIES[key], "source": "GlixAI Shadow Data (30-day market analysis)"}
 
     return {
         "role": role,
@@ -0,0 +1,124 @@
+"""
+GlixAI Job Search Cache
+TTL cache for job search results with stale-while-revalidate and request coalescing
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def make_search_key(query: str, location: str = "", stream: str = "", page: int = 1) -> tuple:
+    """Case- and whitespace-insensitive key for one search"""
+    def normalize(value: str) -> str:
+        return " ".join((value or "").lower().split())
+    return normalize(query), normalize(location), normalize(stream), page or 1
+
+
+class SearchResultCache:
+    """In-process cache of upstream search results.
+
+    Results younger than ``ttl`` seconds are served as they are. Results
+    older than that but within ``stale`` more seconds are still served, and
+    a background refresh is started. Concurrent lookups of the same key
+    share a single upstream fetch, whether it is a miss or a refresh.
+
+    An empty result means the upstream search failed or found nothing. It
+    is kept only ``failure_ttl`` seconds, so a failing upstream is not
+    hit on every request but is retried soon, and a refresh that comes
+    back empty leaves the stale results in place.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None,
+                 stale: Optional[float] = None, failure_ttl: Optional[float] = None):
+        self.max_entries = max_entries or int(os.environ.get('JOB_SEARCH_CACHE_SIZE', 1000))
+        self.ttl = ttl if ttl is not None else float(os.environ.get('JOB_SEARCH_CACHE_TTL_SECONDS', 300))
+        self.stale = stale if stale is not None else float(os.environ.get('JOB_SEARCH_CACHE_STALE_SECONDS', 3600))
+        self.failure_ttl = failure_ttl if failure_ttl is not None else float(
+            os.environ.get('JOB_SEARCH_CACHE_FAILURE_TTL_SECONDS', 30)
+        )
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+
+    def _store(self, key: tuple, results: list):
+        if not results and self._entries.get(key, ((),))[0]:
+            return
+        self._entries[key] = (results, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _fetch(self, key: tuple, fetch: Callable[[], Awaitable[list]]) -> asyncio.Task:
+        """Start the upstream fetch for key, or join the one already running"""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        async def run():
+            try:
+                results = await fetch()
+                self._store(key, results)
+                return results
+            finally:
+                self._inflight.pop(key, None)
+
+        task = self._inflight[key] = asyncio.create_task(run())
+        task.add_done_callback(self._log_fetch_error)
+        return task
+
+    async def get_or_fetch(self, key: tuple, fetch: Callable[[], Awaitable[list]]) -> list:
+        """Return cached results for key, calling fetch() only when needed"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            results, fetched_at = entry
+            age = time.monotonic() - fetched_at
+            if age < (self.ttl if results else self.failure_ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return results
+            if results and age < self.ttl + self.stale:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                self._fetch(key, fetch)
+                return results
+
+        self.misses += 1
+        # Shielded so that one caller giving up does not cancel the fetch others wait on.
+        return await asyncio.shield(self._fetch(key, fetch))
+
+    @staticmethod
+    def _log_fetch_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Search fetch failed: {task.exception()}")
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups * 100, 1) if lookups else 0.0,
+        }
+
+
+_cache: Optional[SearchResultCache] = None
+
+
+def get_search_cache() -> SearchResultCache:
+    """Return the process-wide search cache, creating it on first use"""
+    global _cache
+    if _cache is None:
+        _cache = SearchResultCache()
+    return _cache
@@ -0,0 +1,119 @@
+"""
+GlixAI Chat Persistence Benchmark
+Mongo round trips and DB time per chat turn, old five-call path versus ChatStore
+
+Against --mongo-url the DB time is measured. Without it the turns run on
+mongomock_motor, whose in-process cost says nothing about a real server,
+so the DB time is modelled as --rtt milliseconds per round trip.
+
+Run from the backend directory:
+    python -m benchmarks.bench_chat_persistence --turns 500 --rtt 1.0
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from agents.chat_store import ChatStore, new_message
+
+
+class TimedCollection:
+    """Collection proxy that counts awaited calls and the time spent in them.
+
+    With a modelled ``rtt`` (seconds) each call is charged that instead of
+    its measured time.
+    """
+
+    def __init__(self, collection, meter: dict, rtt: Optional[float]):
+        self._collection = collection
+        self._meter = meter
+        self._rtt = rtt
+
+    def __getattr__(self, name):
+        method = getattr(self._collection, name)
+
+        async def call(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self._meter["calls"] += 1
+                self._meter["seconds"] += self._rtt if self._rtt is not None else time.perf_counter() - start
+
+        return call
+
+
+class TimedDatabase:
+    def __init__(self, db, rtt: Optional[float]):
+        self.meter = {"calls": 0, "seconds": 0.0}
+        self.chat_sessions = TimedCollection(db.chat_sessions, self.meter, rtt)
+        self.chat_messages = TimedCollection(db.chat_messages, self.meter, rtt)
+
+
+async def legacy_turn(db, session_id: str, message: str, reply: str):
+    """The pre-ChatStore sequence from server.py"""
+    existing = await db.chat_sessions.find_one({"id": session_id}, {"_id": 0})
+    if not existing:
+        now = datetime.now(timezone.utc).isoformat()
+        await db.chat_sessions.insert_one({"id": session_id, "title": "New Chat", "created_at": now,
+                                           "updated_at": now, "message_count": 0})
+    await db.chat_messages.insert_one(new_message(session_id, "user", message))
+    await db.chat_messages.insert_one(new_message(session_id, "assistant", reply))
+    await db.chat_sessions.update_one(
+        {"id": session_id},
+        {"$set": {"updated_at": datetime.now(timezone.utc).isoformat(), "title": message[:50]},
+         "$inc": {"message_count": 2}}
+    )
+
+
+async def store_turn(db, session_id: str, message: str, reply: str):
+    store = ChatStore(db)
+    turn = await store.start_turn(session_id, message)
+    await store.finish_turn(turn, reply)
+
+
+async def measure(db, turn_fn, turns: int, turns_per_session: int) -> dict:
+    sessions = [f"bench-{uuid.uuid4()}" for _ in range(max(1, turns // turns_per_session))]
+    db.meter.update(calls=0, seconds=0.0)
+    for i in range(turns):
+        await turn_fn(db, sessions[i % len(sessions)], f"question {i}", f"answer {i}")
+    return {"calls": db.meter["calls"] / turns, "ms": db.meter["seconds"] * 1000 / turns}
+
+
+async def run(args):
+    if args.mongo_url:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        client = AsyncIOMotorClient(args.mongo_url)
+        rtt = None
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+        client = AsyncMongoMockClient()
+        rtt = args.rtt / 1000
+    raw = client[args.db]
+    await raw.chat_messages.create_index("id", unique=True)
+    db = TimedDatabase(raw, rtt)
+
+    print(f"{'path':<24}{'calls / turn':>14}{'DB ms / turn':>14}" + ("" if args.mongo_url else f"  (modelled, {args.rtt} ms RTT)"))
+    for name, fn in (("legacy", legacy_turn), ("ChatStore", store_turn)):
+        result = await measure(db, fn, args.turns, args.turns_per_session)
+        print(f"{name:<24}{result['calls']:>14.2f}{result['ms']:>14.2f}")
+
+    if args.mongo_url:
+        await client.drop_database(args.db)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--turns-per-session", type=int, default=10)
+    parser.add_argument("--rtt", type=float, default=1.0, help="modelled round trip in ms (mongomock only)")
+    parser.add_argument("--mongo-url", default=None)
+    parser.add_argument("--db", default="glix_bench_chat")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
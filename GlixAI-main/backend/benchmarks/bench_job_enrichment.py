@@ -0,0 +1,65 @@
+"""
+GlixAI Job Enrichment Benchmark
+Cost per 1,000 jobs of the old per-job enrichment loop versus the batched, memoized pass
+
+Run from the backend directory:
+    python -m benchmarks.bench_job_enrichment
+"""
+
+import time
+
+from agents.job_enrichment import enrich_jobs, resolve_title
+from agents.risk_analytics import calculate_automation_risk, get_shadow_salary
+from benchmarks.bench_job_index import synthetic_jobs
+from shared import skill_dictionary
+from shared.skill_dictionary import calculate_skill_match
+
+JOBS = 1_000
+REPEAT = 5
+USER_SKILLS = ["Python", "JS", "k8s", "AWS", "docker", "ML", "SQL", "react", "tf", "GCP"]
+
+
+def legacy_enrich(jobs: list, user_skills: list) -> list:
+    for job in jobs:
+        risk = calculate_automation_risk(job.get("title", ""))
+        job["risk_score"] = risk["risk_score"]
+        job["risk_level"] = risk["risk_level"]
+        job["human_necessity"] = risk["human_necessity"]
+        job["horizon"] = risk["horizon"]
+        job["shadow_salary"] = get_shadow_salary(job.get("title", ""))
+        if user_skills:
+            job["match_score"] = calculate_skill_match(user_skills, job.get("skills", []))
+    return jobs
+
+
+def best_of(fn, jobs: list, clear_memo: bool = False) -> float:
+    """Best wall time in milliseconds over REPEAT runs on fresh copies"""
+    timings = []
+    for _ in range(REPEAT):
+        batch = [dict(job) for job in jobs]
+        if clear_memo:
+            resolve_title.cache_clear()
+            skill_dictionary.normalize_skill.cache_clear()
+            skill_dictionary._normalize_skill_tuple.cache_clear()
+        start = time.perf_counter()
+        fn(batch, USER_SKILLS)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    jobs = synthetic_jobs(JOBS)
+    titles = len({job["title"] for job in jobs})
+    legacy_ms = best_of(legacy_enrich, jobs)
+    cold_ms = best_of(enrich_jobs, jobs, clear_memo=True)
+    warm_ms = best_of(enrich_jobs, jobs)
+
+    print(f"{JOBS:,} jobs, {titles} distinct titles, {len(USER_SKILLS)} user skills")
+    print(f"{'path':<28}{'ms / 1k jobs':>14}{'speedup':>10}")
+    print(f"{'legacy per-job loop':<28}{legacy_ms:>14.2f}{1:>9.1f}x")
+    print(f"{'batched, empty memo':<28}{cold_ms:>14.2f}{legacy_ms / cold_ms:>9.1f}x")
+    print(f"{'batched, warm memo':<28}{warm_ms:>14.2f}{legacy_ms / warm_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+GlixAI Job Index Benchmark
+Compares the inverted index with the linear scan it replaced on synthetic job corpora
+
+Run from the backend directory:
+    python -m benchmarks.bench_job_index
+"""
+
+import random
+import time
+
+from agents.job_hunter import SAMPLE_JOBS
+from shared.job_index import JobIndex
+
+SIZES = [1_000, 10_000, 100_000]
+REPEAT = 5
+QUERIES = [("python", ""), ("senior data engineer", "Remote"), ("kubernetes", "New York"), ("rust embedded", "")]
+
+EXTRA_TITLE_WORDS = ["Senior", "Staff", "Junior", "Lead", "Principal", "Platform", "Backend", "Data", "Cloud", "Embedded"]
+FILLER = ["build", "own", "scale", "services", "customers", "team", "platform", "reliable", "ship", "mentor", "design"]
+EXTRA_SKILLS = ["rust", "go", "kafka", "spark", "terraform", "graphql", "redis", "airflow", "scala", "swift"]
+CITIES = ["Remote", "New York, NY", "Austin, TX", "Seattle, WA", "Berlin", "London", "Bangalore", "Toronto"]
+
+
+def synthetic_jobs(count: int, seed: int = 7) -> list:
+    """Vary the sample jobs into a corpus of the given size"""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        base = SAMPLE_JOBS[i % len(SAMPLE_JOBS)]
+        skills = base["skills"] + rng.sample(EXTRA_SKILLS, 2)
+        jobs.append({
+            **base,
+            "title": f"{rng.choice(EXTRA_TITLE_WORDS)} {base['title']}",
+            "location": rng.choice(CITIES),
+            "skills": skills,
+            "description": (f"{base['description']} Stack includes {', '.join(skills)}. "
+                            f"{' '.join(rng.choices(FILLER, k=rng.randint(0, 40)))} Req {i}."),
+        })
+    return jobs
+
+
+def legacy_search(jobs: list, query: str, location: str = "") -> list:
+    query_lower = query.lower()
+    location_lower = location.lower() if location else ""
+    scored_jobs = []
+    for job in jobs:
+        score = 0
+        title_lower = job["title"].lower()
+        desc_lower = job["description"].lower()
+        loc_lower = job["location"].lower()
+        skills_str = " ".join(job["skills"]).lower()
+        for word in query_lower.split():
+            if word in title_lower:
+                score += 3
+            if word in desc_lower:
+                score += 1
+            if word in skills_str:
+                score += 2
+        if location_lower and (location_lower in loc_lower or "remote" in loc_lower):
+            score += 2
+        if score > 0 or not query_lower:
+            scored_jobs.append((score, job))
+    scored_jobs.sort(key=lambda x: x[0], reverse=True)
+    return [j for _, j in scored_jobs[:8]]
+
+
+def best_of(fn) -> float:
+    """Best wall time in milliseconds over REPEAT runs"""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    print(f"{'query':<32}{'jobs':>9}{'build ms':>10}{'legacy ms':>11}{'first ms':>10}{'index ms':>10}"
+          f"{'repeat ms':>11}{'speedup':>9}")
+    for size in SIZES:
+        jobs = synthetic_jobs(size)
+        start = time.perf_counter()
+        index = JobIndex(jobs)
+        build_ms = (time.perf_counter() - start) * 1000
+        for query, location in QUERIES:
+            label = f"{query!r} {location!r}"
+            legacy_ms = best_of(lambda: legacy_search(jobs, query, location))
+            # The first query for a term builds its cached score list.
+            start = time.perf_counter()
+            index.search(query, location)
+            first_ms = (time.perf_counter() - start) * 1000
+            # "index" reuses the term score lists but not the result cache; "repeat" hits it.
+            index_ms = best_of(lambda: (index._result_cache.clear(), index.search(query, location)))
+            repeat_ms = best_of(lambda: index.search(query, location))
+            print(f"{label:<32}{size:>9,}{build_ms:>10.0f}{legacy_ms:>11.2f}{first_ms:>10.2f}{index_ms:>10.3f}"
+                  f"{repeat_ms:>11.4f}{legacy_ms / index_ms:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
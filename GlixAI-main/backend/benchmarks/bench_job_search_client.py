@@ -0,0 +1,121 @@
+"""
+GlixAI Job Search Client Benchmark
+A new httpx.AsyncClient per search (old path) versus the shared pooled client, against a local stub search engine
+
+With --tls the stub serves HTTPS on a throwaway self-signed certificate
+(made with the openssl CLI), so each fresh client pays for the TLS
+handshake the way a real search engine connection does.
+
+Run from the backend directory:
+    python -m benchmarks.bench_job_search_client --requests 1000 --concurrency 200 --tls
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import tempfile
+import time
+
+import certifi
+import httpx
+
+from benchmarks.stats import HEADER, format_row, summarize
+from benchmarks.stub_search_server import StubSearchServer
+
+
+class FreshClient:
+    """Stands in for the shared client: a new AsyncClient for every request, as before"""
+
+    async def get(self, url, params=None):
+        from agents.job_hunter import SEARCH_HEADERS
+
+        async with httpx.AsyncClient(timeout=10) as client:
+            return await client.get(url, params=params, headers=SEARCH_HEADERS, follow_redirects=True)
+
+
+def make_certificate(directory: str) -> tuple:
+    certfile = os.path.join(directory, "cert.pem")
+    keyfile = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", keyfile, "-out", certfile, "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost"],
+        check=True, capture_output=True,
+    )
+    return certfile, keyfile
+
+
+async def drive(total: int, concurrency: int) -> dict:
+    from agents.job_hunter import search_jobs_web
+
+    latencies = []
+    errors = 0
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        nonlocal errors
+        async with gate:
+            start = time.perf_counter()
+            results = await search_jobs_web(f"python {i % 20}", "Remote")
+            # search_jobs_web falls back to the sample jobs when the request fails.
+            if results and "/jobs/view/" in results[0]["url"]:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run(args, server: StubSearchServer):
+    from agents import job_hunter
+
+    print(HEADER)
+    shared_client = job_hunter.get_search_client
+    job_hunter.get_search_client = FreshClient
+    try:
+        before = await drive(args.requests, args.concurrency)
+    finally:
+        job_hunter.get_search_client = shared_client
+    connections_before = server.stats["connections"]
+    print(format_row("client per search", before))
+
+    try:
+        after = await drive(args.requests, args.concurrency)
+    finally:
+        await job_hunter.close_search_client()
+    print(format_row("shared client", after))
+    print(f"connections opened: {connections_before} per-search, "
+          f"{server.stats['connections'] - connections_before} shared")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="stub server think time in seconds")
+    parser.add_argument("--tls", action="store_true", help="serve the stub over HTTPS")
+    parser.add_argument("--port", type=int, default=8901)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        certfile = keyfile = None
+        if args.tls:
+            certfile, keyfile = make_certificate(directory)
+            # httpx reads SSL_CERT_FILE when it builds each client's SSL context.
+            # The stub certificate is appended to the usual certifi bundle so
+            # that loading it costs what it does in production.
+            bundle = os.path.join(directory, "bundle.pem")
+            with open(bundle, "w") as out, open(certifi.where()) as ca, open(certfile) as cert:
+                out.write(ca.read() + "\n" + cert.read())
+            os.environ["SSL_CERT_FILE"] = bundle
+
+        with StubSearchServer(port=args.port, latency=args.latency, certfile=certfile, keyfile=keyfile) as server:
+            os.environ["JOB_SEARCH_URL"] = server.search_url
+            asyncio.run(run(args, server))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+GlixAI JSON Response Benchmark
+Per-response serialization time: FastAPI's default path versus FastJSONResponse and FastJSONRoute
+
+Three ways a dict returned by an endpoint becomes a body:
+    before       jsonable_encoder, then JSONResponse (json.dumps)
+    class only   jsonable_encoder, then FastJSONResponse (orjson); what
+                 default_response_class alone changes
+    route        FastJSONResponse straight from the endpoint's value, as
+                 FastJSONRoute does, with the brand block spliced in
+
+Run from the backend directory:
+    python -m benchmarks.bench_json_response
+"""
+
+import time
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from agents.job_enrichment import enrich_jobs
+from agents.risk_analytics import calculate_automation_risk
+from agents.roadmap_architect import generate_roadmap
+from agents.science_streams import SCIENCE_FULL_FORMS
+from agents.sprint_generator import generate_gap_sprints
+from benchmarks.bench_job_index import synthetic_jobs
+from shared.brand_config import BRAND_CONFIG
+from shared.json_response import FastJSONResponse, pre_encode
+from shared.skill_dictionary import SKILL_DICTIONARY
+
+REPEAT = 7
+BRAND = pre_encode(BRAND_CONFIG["white_label"])
+
+
+def roadmap_payload() -> dict:
+    roadmap = generate_roadmap(["python", "sql"], "Data Scientist", 24)
+    return {
+        "structured_roadmap": roadmap,
+        "ai_roadmap": "## Week 1\nStudy statistics and linear algebra. " * 60,
+        "sprints": generate_gap_sprints(roadmap["skill_gap_analysis"]["missing_must_have"]),
+        "roadmap_id": "5f0c4a8e-0000-4000-8000-000000000000",
+        "brand": BRAND,
+    }
+
+
+def dictionary_payload() -> dict:
+    combined = {**SKILL_DICTIONARY, **SCIENCE_FULL_FORMS}
+    return {"dictionary": combined, "total": len(combined)}
+
+
+def jobs_payload() -> dict:
+    jobs = enrich_jobs(synthetic_jobs(10), ["python", "docker", "aws"])
+    return {"jobs": jobs, "total": len(jobs), "query": "Backend Developer", "location": "", "brand": BRAND}
+
+
+def risk_payload() -> dict:
+    return {"risk": calculate_automation_risk("ml engineer"), "brand": BRAND}
+
+
+PAYLOADS = [
+    ("/roadmap/generate", roadmap_payload),
+    ("/skills/dictionary", dictionary_payload),
+    ("/jobs/search", jobs_payload),
+    ("/analytics/risk", risk_payload),
+]
+
+PATHS = [
+    ("before", lambda content: JSONResponse(jsonable_encoder(content)).body),
+    ("class only", lambda content: FastJSONResponse(jsonable_encoder(content)).body),
+    ("route", lambda content: FastJSONResponse(content).body),
+]
+
+
+def per_call_us(fn, content) -> float:
+    """Best mean time per call in microseconds over REPEAT batches"""
+    calls = 200
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn(content)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best * 1e6
+
+
+def main():
+    print(f"{'payload':<22}{'bytes':>8}" + "".join(f"{name + ' us':>15}" for name, _ in PATHS) + f"{'saved':>9}")
+    for label, build in PAYLOADS:
+        content = build()
+        size = len(PATHS[0][1](content))
+        timings = [per_call_us(fn, content) for _, fn in PATHS]
+        print(f"{label:<22}{size:>8,}" + "".join(f"{t:>15.1f}" for t in timings) + f"{1 - timings[-1] / timings[0]:>8.0%}")
+
+    unspliced = dict(BRAND)
+    spliced_us = per_call_us(lambda c: FastJSONResponse(c).body, risk_payload())
+    encoded_us = per_call_us(lambda c: FastJSONResponse(c).body, {**risk_payload(), "brand": unspliced})
+    print(f"\nbrand block on /analytics/risk: {encoded_us:.2f} us encoded per response, {spliced_us:.2f} us spliced")
+
+
+if __name__ == "__main__":
+    main()
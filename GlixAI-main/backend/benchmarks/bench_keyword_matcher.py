@@ -0,0 +1,91 @@
+"""
+GlixAI Keyword Matcher Benchmark
+Compares the shared automaton with the per-keyword substring loops it replaced
+
+Run from the backend directory:
+    python -m benchmarks.bench_keyword_matcher
+"""
+
+import random
+import time
+
+from agents.eq_scoring import CULTURE_PROFILES, EQ_POSITIVE_INDICATORS, SQ_POSITIVE_INDICATORS, analyze_eq_sq
+from agents.job_hunter import COMMON_SKILLS, extract_skills_from_text
+from agents.resume_analyzer import ALL_SKILLS, extract_skills
+
+SIZES = [1_000, 10_000, 100_000]
+REPEAT = 5
+
+FILLER_WORDS = [
+    "the", "and", "with", "for", "using", "across", "built", "designed", "delivered",
+    "platform", "services", "pipeline", "production", "customers", "reduced", "latency",
+    "improved", "reliability", "owned", "roadmap", "quarterly", "migration", "legacy",
+    "experience", "years", "responsible", "end-to-end", "features", "analytics", "internal",
+]
+SIGNAL_WORDS = [
+    "python", "react", "kubernetes", "docker", "node.js", "c++", "ci/cd", "machine learning",
+    "led", "mentored", "collaborated", "stakeholders", "team", "presented", "remote", "agile",
+]
+
+
+def synthetic_resume(word_count: int, seed: int = 42) -> str:
+    """Build a resume-like text where roughly one word in ten is a keyword"""
+    rng = random.Random(seed)
+    words = []
+    for _ in range(word_count):
+        pool = SIGNAL_WORDS if rng.random() < 0.1 else FILLER_WORDS
+        words.append(rng.choice(pool) + rng.choice(["", "", "", ",", "."]))
+    return " ".join(words)
+
+
+def legacy_extract_skills(text: str) -> list:
+    return list(set(skill for skill in ALL_SKILLS if skill in text))
+
+
+def legacy_extract_skills_from_text(text: str) -> list:
+    text_lower = text.lower()
+    found = [s for s in COMMON_SKILLS if s in text_lower]
+    return found[:6] if found else ["see description"]
+
+
+def legacy_eq_indicator_counts(text: str) -> dict:
+    text_lower = text.lower()
+    counts = {}
+    for group in (EQ_POSITIVE_INDICATORS, SQ_POSITIVE_INDICATORS):
+        for category, indicators in group.items():
+            counts[category] = sum(1 for ind in indicators if ind in text_lower)
+    for culture, profile in CULTURE_PROFILES.items():
+        counts[culture] = sum(1 for kw in profile["keywords"] if kw in text_lower)
+    return counts
+
+
+def best_of(fn, arg) -> float:
+    """Best wall time in milliseconds over REPEAT runs"""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+CASES = [
+    ("resume_analyzer.extract_skills", lambda t: legacy_extract_skills(t.lower()), lambda t: extract_skills(t.lower())),
+    ("job_hunter.extract_skills_from_text", legacy_extract_skills_from_text, extract_skills_from_text),
+    # analyze_eq_sq does a little scoring on top of the scan; the legacy column is the scan alone.
+    ("eq_scoring.analyze_eq_sq", legacy_eq_indicator_counts, analyze_eq_sq),
+]
+
+
+def main():
+    print(f"{'case':<38}{'words':>9}{'legacy ms':>12}{'matcher ms':>12}{'speedup':>9}")
+    for name, legacy, current in CASES:
+        for size in SIZES:
+            text = synthetic_resume(size)
+            legacy_ms = best_of(legacy, text)
+            current_ms = best_of(current, text)
+            print(f"{name:<38}{size:>9,}{legacy_ms:>12.2f}{current_ms:>12.2f}{legacy_ms / current_ms:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
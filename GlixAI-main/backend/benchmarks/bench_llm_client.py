@@ -0,0 +1,109 @@
+"""
+GlixAI LLM Client Benchmark
+Per-request LlmChat (old path) versus the pooled LlmClientManager, against a local fake provider
+
+Needs the full backend requirements. The fake server stands in for the
+provider through OPENAI_API_BASE, so no real key or network is used.
+With --fake, benchmarks.fake_emergentintegrations replaces LlmChat in
+process instead, which measures the in-flight cap alone without a server
+or the real emergentintegrations package.
+
+Run from the backend directory:
+    python -m benchmarks.bench_llm_client --requests 400 --concurrency 100 --latency 0.3 --capacity 32
+    python -m benchmarks.bench_llm_client --fake --requests 2000 --concurrency 200 --capacity 32
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.fake_llm_server import FakeLlmServer
+from benchmarks.stats import HEADER, format_row, summarize
+
+
+async def legacy_get_ai_response(session_id: str, user_message: str) -> str:
+    """The pre-manager code path: fresh LlmChat and key lookup on every call"""
+    from emergentintegrations.llm.chat import LlmChat, UserMessage
+    from agents.chat_engine import SYSTEM_PROMPT
+
+    chat = LlmChat(
+        api_key=os.environ.get('EMERGENT_LLM_KEY'),
+        session_id=session_id,
+        system_message=SYSTEM_PROMPT
+    )
+    chat.with_model("openai", "gpt-5.2")
+    return await chat.send_message(UserMessage(text=user_message))
+
+
+async def pooled_get_ai_response(session_id: str, user_message: str) -> str:
+    from agents.llm_client import get_llm_client
+    from agents.chat_engine import SYSTEM_PROMPT
+
+    return await get_llm_client().send(session_id, SYSTEM_PROMPT, user_message)
+
+
+async def drive(call, total: int, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        nonlocal errors
+        async with gate:
+            start = time.perf_counter()
+            try:
+                await call(f"bench-{i}", "Suggest a 12 week plan to become an ML engineer.")
+                latencies.append(time.perf_counter() - start)
+            except Exception:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run(args):
+    from agents.llm_client import start_llm_client, close_llm_client
+
+    print(HEADER)
+    before = await drive(legacy_get_ai_response, args.requests, args.concurrency)
+    print(format_row("per-request LlmChat", before))
+
+    await start_llm_client()
+    try:
+        after = await drive(pooled_get_ai_response, args.requests, args.concurrency)
+    finally:
+        await close_llm_client()
+    print(format_row("pooled manager", after))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.3, help="fake provider generation time in seconds")
+    parser.add_argument("--capacity", type=int, default=32, help="fake provider in-flight limit before 429s")
+    parser.add_argument("--max-in-flight", type=int, default=32)
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--fake", action="store_true", help="use the in-process fake LlmChat instead of a server")
+    parser.add_argument("--jitter", type=float, default=0.2, help="--fake latency variation, as a fraction")
+    args = parser.parse_args()
+
+    os.environ["EMERGENT_LLM_KEY"] = "sk-local-benchmark"
+    os.environ["LLM_MAX_IN_FLIGHT"] = str(args.max_in_flight)
+    if args.fake:
+        from benchmarks.fake_emergentintegrations import install
+        chat = install(latency=args.latency, jitter=args.jitter, capacity=args.capacity)
+        asyncio.run(run(args))
+        print(f"fake provider: {chat.stats}")
+        return
+
+    with FakeLlmServer(port=args.port, latency=args.latency, capacity=args.capacity) as server:
+        os.environ["OPENAI_API_BASE"] = server.base_url
+        asyncio.run(run(args))
+        print(f"fake provider: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+GlixAI Skill Matrix Benchmark
+Per-pair calculate_skill_match / get_skill_gaps loops versus the vectorized SkillMatrix
+
+Run from the backend directory:
+    python -m benchmarks.bench_skill_matrix
+"""
+
+import random
+import time
+
+from benchmarks.bench_job_index import synthetic_jobs
+from shared.skill_dictionary import ROLE_REQUIREMENTS, calculate_skill_match, get_skill_gaps
+from shared.skill_matrix import SkillMatrix, get_role_matrix
+
+JOBS = 10_000
+USERS = 300
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    rng = random.Random(7)
+    jobs = synthetic_jobs(JOBS)
+    pool = sorted({skill for job in jobs for skill in job["skills"]}) + ["js", "ml", "k8s", "aws"]
+    users = [rng.sample(pool, rng.randint(3, 15)) for _ in range(USERS)]
+    user = users[0]
+
+    build_ms = timed(lambda: SkillMatrix([job["skills"] for job in jobs]))
+    matrix = SkillMatrix([job["skills"] for job in jobs])
+    roles = get_role_matrix()
+
+    rows = [
+        (f"1 user x {JOBS:,} jobs",
+         timed(lambda: [calculate_skill_match(user, job["skills"]) for job in jobs]),
+         timed(lambda: matrix.match_scores(user))),
+        (f"{USERS} users x {len(ROLE_REQUIREMENTS)} roles",
+         timed(lambda: [[get_skill_gaps(u, role)["match_score"] for role in ROLE_REQUIREMENTS] for u in users]),
+         timed(lambda: roles.match_matrix(users))),
+        (f"100 users x {JOBS:,} jobs",
+         timed(lambda: [[calculate_skill_match(u, job["skills"]) for job in jobs] for u in users[:100]]),
+         timed(lambda: matrix.match_matrix(users[:100]))),
+    ]
+
+    print(f"matrix build for {JOBS:,} jobs: {build_ms:.1f} ms, {len(matrix.vocabulary)} distinct skills")
+    print(f"{'workload':<26}{'loop ms':>10}{'matrix ms':>11}{'speedup':>10}")
+    for name, loop_ms, matrix_ms in rows:
+        print(f"{name:<26}{loop_ms:>10.1f}{matrix_ms:>11.2f}{loop_ms / matrix_ms:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
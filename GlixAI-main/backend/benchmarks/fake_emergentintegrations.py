@@ -0,0 +1,82 @@
+"""
+GlixAI Fake Emergent Integrations
+In-process stand-in for emergentintegrations.llm.chat with configurable latency, for load tests
+"""
+
+import asyncio
+import random
+import sys
+import types
+
+from benchmarks.fake_llm_server import DEFAULT_REPLY
+
+
+class RateLimitError(Exception):
+    pass
+
+
+def create_module(latency: float = 0.5, jitter: float = 0.0, reply: str = DEFAULT_REPLY,
+                  capacity: int = 0) -> types.ModuleType:
+    """Build a module with the LlmChat / UserMessage interface the backend uses.
+
+    Each send_message() sleeps ``latency`` seconds, varied uniformly by up to
+    ``jitter`` of it either way, and returns ``reply``. When ``capacity`` is
+    set, calls beyond that many in flight raise RateLimitError, like a
+    provider answering 429. ``stats`` counts the calls served, rejected and
+    in flight.
+    """
+    module = types.ModuleType("emergentintegrations.llm.chat")
+    stats = {"in_flight": 0, "served": 0, "rejected": 0}
+
+    class UserMessage:
+        def __init__(self, text: str, file_contents=None):
+            self.text = text
+            self.file_contents = file_contents
+
+    class LlmChat:
+        def __init__(self, api_key: str, session_id: str, system_message: str):
+            self.api_key = api_key
+            self.session_id = session_id
+            self.system_message = system_message
+            self.provider = "openai"
+            self.model = "gpt-5.2"
+
+        def with_model(self, provider: str, model: str):
+            self.provider = provider
+            self.model = model
+            return self
+
+        async def send_message(self, user_message: UserMessage) -> str:
+            if capacity and stats["in_flight"] >= capacity:
+                stats["rejected"] += 1
+                raise RateLimitError(f"429: more than {capacity} requests in flight")
+            stats["in_flight"] += 1
+            try:
+                await asyncio.sleep(max(latency * (1 + random.uniform(-jitter, jitter)), 0))
+            finally:
+                stats["in_flight"] -= 1
+            stats["served"] += 1
+            return reply
+
+    module.UserMessage = UserMessage
+    module.LlmChat = LlmChat
+    module.RateLimitError = RateLimitError
+    module.stats = stats
+    return module
+
+
+def install(**options) -> types.ModuleType:
+    """Register the fake under sys.modules; call before the backend is imported"""
+    chat = create_module(**options)
+    package = types.ModuleType("emergentintegrations")
+    llm = types.ModuleType("emergentintegrations.llm")
+    package.__path__ = []
+    llm.__path__ = []
+    package.llm = llm
+    llm.chat = chat
+    sys.modules.update({
+        "emergentintegrations": package,
+        "emergentintegrations.llm": llm,
+        "emergentintegrations.llm.chat": chat,
+    })
+    return chat
@@ -0,0 +1,141 @@
+"""
+GlixAI Fake LLM Server
+OpenAI-compatible chat completions endpoint with configurable latency for local benchmarks
+
+Run standalone from the backend directory:
+    python -m benchmarks.fake_llm_server --port 8900 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+import uuid
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+DEFAULT_REPLY = "Here is a structured plan. **Step 1**: build fundamentals. **Step 2**: ship a portfolio project."
+
+
+def create_app(latency: float = 0.5, capacity: int = 0, reply: str = DEFAULT_REPLY) -> Starlette:
+    """Build the fake provider.
+
+    ``latency`` is the simulated generation time in seconds; streamed
+    replies spread it evenly across their chunks. When ``capacity`` is set,
+    requests beyond that many in flight are rejected with 429, like a
+    rate-limited provider.
+    """
+    state = {"in_flight": 0, "served": 0, "rejected": 0}
+
+    async def stream_reply(model: str):
+        words = reply.split(" ")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        state["in_flight"] += 1
+        try:
+            for i, word in enumerate(words):
+                await asyncio.sleep(latency / len(words))
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "delta": {"content": word if i == 0 else " " + word},
+                        "finish_reason": None,
+                    }],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+        finally:
+            state["in_flight"] -= 1
+        state["served"] += 1
+
+    async def chat_completions(request: Request):
+        body = await request.json()
+        if capacity and state["in_flight"] >= capacity:
+            state["rejected"] += 1
+            return JSONResponse({"error": {"message": "rate limited", "type": "rate_limit"}}, status_code=429)
+        if body.get("stream"):
+            return StreamingResponse(stream_reply(body.get("model", "gpt-5.2")), media_type="text/event-stream")
+
+        state["in_flight"] += 1
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            state["in_flight"] -= 1
+        state["served"] += 1
+
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in body.get("messages", []))
+        return JSONResponse({
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-5.2"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": reply},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(reply.split()),
+                "total_tokens": prompt_tokens + len(reply.split()),
+            },
+        })
+
+    async def stats(request: Request):
+        return JSONResponse(state)
+
+    app = Starlette(routes=[
+        Route("/v1/chat/completions", chat_completions, methods=["POST"]),
+        Route("/stats", stats),
+    ])
+    app.state.stats = state
+    return app
+
+
+class FakeLlmServer:
+    """Runs the fake provider on a background thread with its own event loop"""
+
+    def __init__(self, port: int = 8900, **options):
+        self.port = port
+        self.app = create_app(**options)
+        self._server = uvicorn.Server(uvicorn.Config(self.app, host="127.0.0.1", port=port, log_level="warning"))
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1"
+
+    @property
+    def stats(self) -> dict:
+        return self.app.state.stats
+
+    def __enter__(self):
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self._server.should_exit = True
+        self._thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible LLM server")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--capacity", type=int, default=0)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency, args.capacity), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
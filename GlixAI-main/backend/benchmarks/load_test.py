@@ -0,0 +1,329 @@
+"""
+GlixAI Load Test
+Drives a mix of chat, job search, resume and passport requests at a target rate against a local backend
+
+The backend (server.py under uvicorn) runs in its own process with every
+external dependency replaced: Mongo by mongomock_motor, or a local mongod
+with --mongo-url; the LLM by a fake emergentintegrations module that
+sleeps --llm-latency per call; and web search by the stub search server.
+With --llm provider the real emergentintegrations package is used
+instead, pointed at the fake OpenAI-compatible server.
+
+Arrivals are open loop (Poisson at --rps), so a slow backend builds a
+queue instead of slowing the client down, and every latency is measured
+from the request's scheduled start. Responses that are not 2xx, or whose
+JSON body carries an "error" key, count as errors.
+
+Run from the backend directory:
+    python -m benchmarks.load_test --rps 20 --duration 30 --llm-latency 0.5
+    python -m benchmarks.load_test --mix chat=1,passport=1 --mongo-url mongodb://localhost:27017
+"""
+
+import argparse
+import asyncio
+import collections
+import logging
+import multiprocessing
+import os
+import random
+import time
+import uuid
+from typing import Optional
+
+import httpx
+import uvicorn
+
+from benchmarks.fake_llm_server import FakeLlmServer
+from benchmarks.stats import HEADER, format_row, summarize
+from benchmarks.stub_search_server import StubSearchServer
+
+DEFAULT_MIX = "chat=4,jobs=3,resume=1,passport=2"
+
+ROLES = ["Data Scientist", "ML Engineer", "Backend Developer", "Frontend Developer",
+         "DevOps Engineer", "Cloud Architect", "Data Engineer", "Full Stack Developer"]
+LOCATIONS = ["", "Bangalore", "Remote"]
+SKILLS = ["python", "sql", "docker", "aws", "react", "javascript", "machine learning",
+          "pandas", "kubernetes", "git", "java", "tensorflow", "linux", "fastapi"]
+CHAT_MESSAGES = [
+    "How do I move from backend development into machine learning?",
+    "Which certifications are worth it for a cloud architect?",
+    "Review my plan: three months of SQL, then Spark, then Airflow.",
+    "What should I build for a data engineering portfolio?",
+    "How do I prepare for a system design interview?",
+]
+RESUME_TEMPLATE = """{name}
+{name_lower}@example.com | +91 98765 43210 | Bangalore
+
+SUMMARY
+{role} with {years} years of experience. I led a team of four, mentored juniors and
+collaborated with product and design to deliver projects on time.
+
+EXPERIENCE
+Senior {role}, Company {n} (2020 - present)
+- Built services in {skills} serving 2 million users
+- Reduced infrastructure cost by 30% and improved latency by 45%
+
+EDUCATION
+B.Tech in Computer Science, 2016
+
+SKILLS
+{skills}
+"""
+
+
+def parse_mix(spec: str) -> dict:
+    """"chat=4,jobs=3" -> {"chat": 4.0, "jobs": 3.0}"""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in REQUESTS:
+            raise ValueError(f"Unknown request type {name!r}; expected one of {', '.join(REQUESTS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class Workload:
+    """Builds the requests of each type, varied the way real traffic varies.
+
+    Chat turns are spread over ``sessions`` sessions, so histories and
+    summaries grow as they would. Job searches draw from a fixed set of
+    query/location/page keys, so the search cache sees repeats.
+    """
+
+    def __init__(self, rng: random.Random, sessions: int):
+        self.rng = rng
+        self.sessions = [f"load-{uuid.uuid4().hex[:12]}" for _ in range(sessions)]
+
+    def skills(self) -> list:
+        return self.rng.sample(SKILLS, self.rng.randint(3, 7))
+
+    def chat(self, client: httpx.AsyncClient):
+        return client.post("/api/chat", json={
+            "session_id": self.rng.choice(self.sessions),
+            "message": self.rng.choice(CHAT_MESSAGES),
+        })
+
+    def jobs(self, client: httpx.AsyncClient):
+        return client.post("/api/jobs/search", json={
+            "query": self.rng.choice(ROLES),
+            "location": self.rng.choice(LOCATIONS),
+            "skills": self.skills(),
+            "page": self.rng.choice((1, 1, 1, 2)),
+        })
+
+    def resume(self, client: httpx.AsyncClient):
+        n = self.rng.randint(1, 10_000)
+        text = RESUME_TEMPLATE.format(
+            name=f"Candidate {n}", name_lower=f"candidate{n}", role=self.rng.choice(ROLES),
+            years=self.rng.randint(1, 12), n=n, skills=", ".join(self.skills()),
+        )
+        return client.post("/api/resume/analyze", files={"file": (f"resume-{n}.txt", text.encode(), "text/plain")})
+
+    def passport(self, client: httpx.AsyncClient):
+        return client.post("/api/passport/generate", json={
+            "name": f"Candidate {self.rng.randint(1, 10_000)}",
+            "skills": self.skills(),
+            "target_role": self.rng.choice(ROLES),
+            "bio": "I love solving problems with my team and learning new technology.",
+        })
+
+
+REQUESTS = {"chat": Workload.chat, "jobs": Workload.jobs, "resume": Workload.resume, "passport": Workload.passport}
+
+
+def _serve_backend(port: int, env: dict, mongo_mock: bool, llm_options: Optional[dict], log_level: str):
+    os.environ.update(env)
+    if llm_options is not None:
+        from benchmarks.fake_emergentintegrations import install
+        install(**llm_options)
+    if mongo_mock:
+        import motor.motor_asyncio
+        from mongomock_motor import AsyncMongoMockClient
+        motor.motor_asyncio.AsyncIOMotorClient = AsyncMongoMockClient
+
+    import server
+    # server.py logs every request's outbound calls at INFO, which would swamp the report.
+    logging.getLogger().setLevel(log_level.upper())
+    uvicorn.run(server.app, host="127.0.0.1", port=port, log_level="warning", backlog=4096)
+
+
+class BackendServer:
+    """Runs server.py in a separate process, so it does not share the load generator's GIL"""
+
+    def __init__(self, port: int, env: dict, mongo_mock: bool = True, llm_options: Optional[dict] = None,
+                 log_level: str = "warning"):
+        self.port = port
+        self._process = multiprocessing.get_context("spawn").Process(
+            target=_serve_backend, args=(port, env, mongo_mock, llm_options, log_level), daemon=True,
+        )
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        self._process.start()
+        deadline = time.monotonic() + 60
+        while True:
+            if not self._process.is_alive():
+                raise RuntimeError("Backend exited during startup; see its log above")
+            try:
+                if httpx.get(f"{self.base_url}/api/", timeout=1).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                self._process.terminate()
+                raise TimeoutError("Backend did not start within 60 seconds")
+            time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.join()
+
+
+def failure_reason(response: httpx.Response) -> Optional[str]:
+    """Why a response counts as an error, or None for a success"""
+    if response.status_code >= 400:
+        return f"HTTP {response.status_code}"
+    if response.headers.get("content-type", "").startswith("application/json"):
+        body = response.json()
+        if isinstance(body, dict) and body.get("error"):
+            return f"error: {str(body['error'])[:60]}"
+    return None
+
+
+async def drive(base_url: str, args) -> dict:
+    """Send Poisson arrivals for warmup + duration seconds; only those after the warmup are recorded"""
+    rng = random.Random(args.seed)
+    workload = Workload(rng, args.sessions)
+    mix = parse_mix(args.mix)
+    names, weights = list(mix), list(mix.values())
+    results = {name: {"latencies": [], "errors": 0} for name in names}
+    reasons = collections.Counter()
+    pending = set()
+    loop = asyncio.get_running_loop()
+
+    async def one(name: str, scheduled: float, recorded: bool):
+        try:
+            response = await REQUESTS[name](workload, client)
+            reason = failure_reason(response)
+        except httpx.HTTPError as e:
+            reason = type(e).__name__
+        if not recorded:
+            return
+        if reason:
+            results[name]["errors"] += 1
+            reasons[f"{name}: {reason}"] += 1
+        else:
+            results[name]["latencies"].append(loop.time() - scheduled)
+
+    limits = httpx.Limits(max_connections=args.connections, max_keepalive_connections=args.connections)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        start = loop.time()
+        measure_from = start + args.warmup
+        end = measure_from + args.duration
+        scheduled = start
+        while True:
+            scheduled += rng.expovariate(args.rps)
+            if scheduled >= end:
+                break
+            await asyncio.sleep(max(scheduled - loop.time(), 0))
+            name = rng.choices(names, weights)[0]
+            recorded = scheduled >= measure_from
+            if len(pending) >= args.max_outstanding:
+                # The client's own limit, so an overloaded backend cannot exhaust it.
+                if recorded:
+                    results[name]["errors"] += 1
+                    reasons[f"{name}: dropped at {args.max_outstanding} outstanding"] += 1
+                continue
+            task = asyncio.create_task(one(name, scheduled, recorded))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+        elapsed = loop.time() - measure_from
+
+    return {"results": results, "reasons": reasons, "elapsed": elapsed}
+
+
+def report(run: dict, args):
+    results, elapsed = run["results"], run["elapsed"]
+    print(f"\n{args.rps} rps target, {args.duration}s measured after {args.warmup}s warmup, "
+          f"LLM latency {args.llm_latency}s, search latency {args.search_latency}s")
+    print(HEADER)
+    everything, errors = [], 0
+    for name, result in results.items():
+        print(format_row(name, summarize(result["latencies"], elapsed, result["errors"])))
+        everything += result["latencies"]
+        errors += result["errors"]
+    print(format_row("total", summarize(everything, elapsed, errors)))
+    if run["reasons"]:
+        print("\nerrors")
+        for reason, count in run["reasons"].most_common(10):
+            print(f"  {count:>7}  {reason}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rps", type=float, default=20)
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds of load sent before measuring")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="relative weights of chat, jobs, resume and passport")
+    parser.add_argument("--sessions", type=int, default=50, help="chat sessions the chat turns are spread over")
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--max-outstanding", type=int, default=2000)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--llm", choices=("module", "provider"), default="module",
+                        help="fake emergentintegrations module, or the real package against the fake provider")
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--llm-jitter", type=float, default=0.2, help="fraction the LLM latency varies by")
+    parser.add_argument("--search-latency", type=float, default=0.3)
+    parser.add_argument("--mongo-url", default=None, help="local mongod to use instead of mongomock")
+    parser.add_argument("--port", type=int, default=8910, help="backend port; the fakes use the next two")
+    parser.add_argument("--base-url", default=None, help="load an already running backend instead of booting one")
+    parser.add_argument("--log-level", default="warning", help="log level of the booted backend")
+    args = parser.parse_args()
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.base_url:
+        report(asyncio.run(drive(args.base_url, args)), args)
+        return
+
+    db_name = f"glix_load_{uuid.uuid4().hex[:8]}"
+    env = {
+        "MONGO_URL": args.mongo_url or "mongodb://localhost:27017",
+        "DB_NAME": db_name,
+        "EMERGENT_LLM_KEY": "sk-load-test",
+    }
+    with StubSearchServer(port=args.port + 1, latency=args.search_latency) as search:
+        env["JOB_SEARCH_URL"] = search.search_url
+        llm_options = {"latency": args.llm_latency, "jitter": args.llm_jitter}
+        provider = None
+        if args.llm == "provider":
+            provider = FakeLlmServer(port=args.port + 2, latency=args.llm_latency).__enter__()
+            env.update(OPENAI_API_BASE=provider.base_url, LLM_API_BASE=provider.base_url)
+            llm_options = None
+        try:
+            with BackendServer(args.port, env, mongo_mock=not args.mongo_url, llm_options=llm_options,
+                               log_level=args.log_level) as backend:
+                run = asyncio.run(drive(backend.base_url, args))
+        finally:
+            if provider is not None:
+                provider.__exit__(None, None, None)
+        searches = search.stats["served"]
+
+    report(run, args)
+    print(f"\nstub search requests served: {searches}")
+    if args.mongo_url:
+        from pymongo import MongoClient
+        MongoClient(args.mongo_url).drop_database(db_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# rule-based agent microbenchmarks
@@ -0,0 +1,70 @@
+"""
+GlixAI Microbenchmark Gate
+Runs the rule-based agent microbenchmarks and fails when a case regresses past the threshold
+
+Baselines are pytest-benchmark runs stored per machine id (OS, Python
+version, word size) under BENCH_BASELINE_DIR, by default .benchmarks/micro
+in the backend directory, which git ignores. Timings only compare on the
+same hardware, so the machine that runs the gate records its own baseline
+with --save; none is committed. The newest saved run is the baseline.
+Cases are compared on their median, which a few slow rounds on a shared
+machine do not move, against a default threshold of 40%.
+
+The suite files are named bench_*.py so a plain pytest run does not
+collect them.
+
+Run from the backend directory:
+    python -m benchmarks.micro --save                # record the baseline on this machine
+    python -m benchmarks.micro                       # compare with it
+    python -m benchmarks.micro --threshold 20 -k skill_gaps
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SUITE_DIR = Path(__file__).parent
+BASELINES_DIR = Path(os.environ.get('BENCH_BASELINE_DIR', SUITE_DIR.parent.parent / ".benchmarks" / "micro"))
+
+
+def baseline_dir() -> Path:
+    from pytest_benchmark.utils import get_machine_id
+    return BASELINES_DIR / get_machine_id()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", action="store_true", help="record this run as the new baseline")
+    parser.add_argument("--threshold", type=float,
+                        default=float(os.environ.get('BENCH_REGRESSION_THRESHOLD', 40)),
+                        help="allowed slowdown per case, in percent")
+    parser.add_argument("--stat", default="median", choices=("min", "median", "mean"),
+                        help="statistic compared with the baseline")
+    parser.add_argument("-k", dest="keyword", default=None, help="only run cases matching this pytest expression")
+    args, extra = parser.parse_known_args()
+
+    pytest_args = [
+        str(SUITE_DIR), "-q", "-p", "no:cacheprovider", "-o", "python_files=bench_*.py",
+        f"--benchmark-storage=file://{BASELINES_DIR}",
+        "--benchmark-columns=min,median,mean,stddev,rounds",
+        "--benchmark-sort=fullname", "--benchmark-disable-gc",
+    ]
+    if args.keyword:
+        pytest_args += ["-k", args.keyword]
+
+    if args.save:
+        pytest_args.append("--benchmark-save=baseline")
+    elif not any(baseline_dir().glob("*.json")):
+        print(f"No baseline for {baseline_dir().name}; record one with --save", file=sys.stderr)
+        sys.exit(2)
+    else:
+        pytest_args += ["--benchmark-compare", f"--benchmark-compare-fail={args.stat}:{args.threshold:g}%"]
+
+    sys.exit(pytest.main(pytest_args + extra))
+
+
+if __name__ == "__main__":
+    main()
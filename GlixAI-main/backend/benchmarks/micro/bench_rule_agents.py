@@ -0,0 +1,168 @@
+"""
+GlixAI Rule-Based Agent Microbenchmarks
+pytest-benchmark cases for the pure-Python analyzers that run on almost every request
+
+Every case times a batch of distinct inputs per round, with the title and
+skill caches cleared first, so a round pays for real work rather than
+cache hits. Input sizes go from small (a short resume, a handful of
+skills) to very large (200,000 words, 5,000 skills).
+
+Run through the regression gate from the backend directory:
+    python -m benchmarks.micro
+"""
+
+import math
+import os
+import random
+import time
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from agents.eq_scoring import analyze_eq_sq
+from agents.resume_analyzer import parse_resume_text
+from agents.risk_analytics import (
+    RISK_ROLE_RESOLVER, ROLE_RISK_PROFILES, SALARY_ROLE_RESOLVER, SHADOW_SALARIES,
+    calculate_automation_risk, get_shadow_salary,
+)
+from agents.roadmap_architect import generate_roadmap
+from agents.science_streams import SCIENCE_STREAMS, match_stream_keywords
+from agents.sprint_generator import SPRINT_TEMPLATES, generate_sprint
+from benchmarks.bench_keyword_matcher import synthetic_resume
+from shared import skill_dictionary
+from shared.skill_dictionary import ROLE_NAMES, SKILL_DICTIONARY, get_skill_gaps
+
+MIN_ROUNDS = int(os.environ.get('BENCH_MIN_ROUNDS', 15))
+# Rounds are added until a case has run this long, so its median is not
+# taken from one short, unlucky stretch on a shared machine.
+MIN_SECONDS = float(os.environ.get('BENCH_MIN_SECONDS', 1.0))
+SIZES = ["small", "medium", "large", "xlarge"]
+
+RESUME_WORDS = {"small": 200, "medium": 2_000, "large": 20_000, "xlarge": 200_000}
+SKILL_COUNTS = {"small": 5, "medium": 50, "large": 500, "xlarge": 5_000}
+TITLE_WORDS = {"small": 2, "medium": 8, "large": 32, "xlarge": 256}
+
+RESUME_HEADER = """Candidate {n}
+candidate{n}@example.com | +91 98765 43210 | linkedin.com/in/candidate{n}
+B.Tech in Computer Science, M.S. in Data Science. {years}+ years of experience.
+"""
+SKILL_WORDS = sorted(set(SKILL_DICTIONARY) | set(SKILL_DICTIONARY.values()))
+FILLER_TITLE_WORDS = ["senior", "lead", "principal", "associate", "remote", "platform", "team", "ii", "staff"]
+
+
+def clear_caches():
+    skill_dictionary.normalize_skill.cache_clear()
+    skill_dictionary._normalize_skill_tuple.cache_clear()
+    RISK_ROLE_RESOLVER.resolve.cache_clear()
+    SALARY_ROLE_RESOLVER.resolve.cache_clear()
+
+
+def run_batch(benchmark, fn, inputs: list):
+    """Time fn over every input tuple per round, starting each round with cold caches"""
+    def batch():
+        for args in inputs:
+            fn(*args)
+
+    clear_caches()
+    start = time.perf_counter()
+    batch()
+    rounds = max(MIN_ROUNDS, math.ceil(MIN_SECONDS / max(time.perf_counter() - start, 1e-6)))
+    benchmark.extra_info["calls_per_round"] = len(inputs)
+    benchmark.pedantic(batch, setup=clear_caches, rounds=rounds)
+
+
+def resumes(size: str, count: int = 4) -> list:
+    rng = random.Random(size)
+    return [
+        (RESUME_HEADER.format(n=n, years=rng.randint(1, 15)) + synthetic_resume(RESUME_WORDS[size], seed=n),)
+        for n in range(count)
+    ]
+
+
+def skill_lists(size: str, count: int = 20) -> list:
+    """Skill lists mixing dictionary terms, odd casing and unknown skills, all distinct"""
+    rng = random.Random(size)
+    lists = []
+    for n in range(count):
+        skills = []
+        for i in range(SKILL_COUNTS[size]):
+            if rng.random() < 0.7:
+                skill = rng.choice(SKILL_WORDS)
+                skills.append(skill.upper() if rng.random() < 0.2 else skill)
+            else:
+                skills.append(f"tool-{n}-{i}")
+        lists.append(skills)
+    return lists
+
+
+def titles(size: str, roles, count: int = 100) -> list:
+    """Job titles with a known role buried among filler words"""
+    rng = random.Random(size)
+    roles = list(roles)
+    out = []
+    for n in range(count):
+        words = [rng.choice(FILLER_TITLE_WORDS) for _ in range(max(TITLE_WORDS[size] - 2, 0))]
+        words.insert(rng.randint(0, len(words)), rng.choice(roles) if n % 4 else f"unknown-{n}")
+        out.append(" ".join(words + [f"r{n}"]))
+    return out
+
+
+@pytest.mark.benchmark(group="parse_resume_text")
+@pytest.mark.parametrize("size", SIZES)
+def test_parse_resume_text(benchmark, size):
+    run_batch(benchmark, parse_resume_text, resumes(size))
+
+
+@pytest.mark.benchmark(group="analyze_eq_sq")
+@pytest.mark.parametrize("size", SIZES)
+def test_analyze_eq_sq(benchmark, size):
+    run_batch(benchmark, analyze_eq_sq, resumes(size))
+
+
+@pytest.mark.benchmark(group="generate_roadmap")
+@pytest.mark.parametrize("size", SIZES)
+def test_generate_roadmap(benchmark, size):
+    roles = sorted(ROLE_NAMES)
+    inputs = [(skills, roles[n % len(roles)], 12) for n, skills in enumerate(skill_lists(size))]
+    run_batch(benchmark, generate_roadmap, inputs)
+
+
+@pytest.mark.benchmark(group="generate_sprint")
+@pytest.mark.parametrize("size", SIZES)
+def test_generate_sprint(benchmark, size):
+    # Half the skills have a sprint template, the rest use the generic one.
+    known = sorted(SPRINT_TEMPLATES)
+    inputs = [
+        (known[n % len(known)] if n % 2 else title,)
+        for n, title in enumerate(titles(size, SKILL_WORDS))
+    ]
+    run_batch(benchmark, generate_sprint, inputs)
+
+
+@pytest.mark.benchmark(group="calculate_automation_risk")
+@pytest.mark.parametrize("size", SIZES)
+def test_calculate_automation_risk(benchmark, size):
+    run_batch(benchmark, calculate_automation_risk, [(title,) for title in titles(size, ROLE_RISK_PROFILES)])
+
+
+@pytest.mark.benchmark(group="get_shadow_salary")
+@pytest.mark.parametrize("size", SIZES)
+def test_get_shadow_salary(benchmark, size):
+    run_batch(benchmark, get_shadow_salary, [(title,) for title in titles(size, SHADOW_SALARIES)])
+
+
+@pytest.mark.benchmark(group="get_skill_gaps")
+@pytest.mark.parametrize("size", SIZES)
+def test_get_skill_gaps(benchmark, size):
+    roles = sorted(ROLE_NAMES)
+    inputs = [(skills, roles[n % len(roles)]) for n, skills in enumerate(skill_lists(size))]
+    run_batch(benchmark, get_skill_gaps, inputs)
+
+
+@pytest.mark.benchmark(group="match_stream_keywords")
+@pytest.mark.parametrize("size", SIZES)
+def test_match_stream_keywords(benchmark, size):
+    streams = sorted(SCIENCE_STREAMS)
+    inputs = [(skills, streams[n % len(streams)]) for n, skills in enumerate(skill_lists(size))]
+    run_batch(benchmark, match_stream_keywords, inputs)
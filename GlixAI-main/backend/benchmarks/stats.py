@@ -0,0 +1,39 @@
+"""
+GlixAI Benchmark Stats
+Latency summaries shared by the benchmark scripts
+"""
+
+import math
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(latencies: list, elapsed: float, errors: int = 0) -> dict:
+    """Throughput and latency percentiles (milliseconds) for one run"""
+    total = len(latencies) + errors
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total * 100, 2) if total else 0.0,
+        "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+    }
+
+
+def format_row(label: str, summary: dict) -> str:
+    return (
+        f"{label:<22}{summary['requests']:>9}{summary['error_rate']:>9.1f}%"
+        f"{summary['throughput_rps']:>10.1f}{summary['p50_ms']:>10.1f}{summary['p95_ms']:>10.1f}{summary['p99_ms']:>10.1f}"
+    )
+
+
+HEADER = f"{'run':<22}{'requests':>9}{'errors':>10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
@@ -0,0 +1,116 @@
+"""
+GlixAI Stub Search Server
+Serves Google-style result pages with configurable latency for job search benchmarks
+
+Run standalone from the backend directory:
+    python -m benchmarks.stub_search_server --port 8901 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import time
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, JSONResponse
+from starlette.routing import Route
+
+RESULT_TEMPLATE = """
+<div class="g">
+  <a href="https://www.linkedin.com/jobs/view/{n}"><h3>{query} Engineer - Company {n}</h3></a>
+  <div class="VwiC3b">Build services with python, docker and aws. $140,000 - $170,000 per year.</div>
+</div>
+"""
+
+
+def create_app(latency: float = 0.05, results: int = 10) -> Starlette:
+    """Build the stub search engine; ``latency`` is the server think time in seconds"""
+    state = {"served": 0, "connections": 0}
+
+    async def search(request: Request):
+        await asyncio.sleep(latency)
+        state["served"] += 1
+        query = request.query_params.get("q", "").split(" jobs")[0].title() or "Software"
+        body = "".join(RESULT_TEMPLATE.format(n=n, query=query) for n in range(results))
+        return HTMLResponse(f"<html><body>{body}</body></html>")
+
+    async def stats(request: Request):
+        return JSONResponse(state)
+
+    app = Starlette(routes=[Route("/search", search), Route("/stats", stats)])
+    app.state.stats = state
+    return app
+
+
+class _CountingProtocol:
+    """Wraps uvicorn's protocol factory to count accepted connections"""
+
+    def __init__(self, factory, state: dict):
+        self.factory = factory
+        self.state = state
+
+    def __call__(self, *args, **kwargs):
+        self.state["connections"] += 1
+        return self.factory(*args, **kwargs)
+
+
+def _serve(port: int, certfile: str, keyfile: str, options: dict):
+    app = create_app(**options)
+    config = uvicorn.Config(
+        app, host="127.0.0.1", port=port, log_level="warning",
+        ssl_certfile=certfile, ssl_keyfile=keyfile, backlog=4096,
+    )
+    config.load()
+    config.http_protocol_class = _CountingProtocol(config.http_protocol_class, app.state.stats)
+    uvicorn.Server(config).run()
+
+
+class StubSearchServer:
+    """Runs the stub search engine in a separate process, so it does not share the client's GIL"""
+
+    def __init__(self, port: int = 8901, certfile: str = None, keyfile: str = None, **options):
+        self.port = port
+        self.scheme = "https" if certfile else "http"
+        self._process = multiprocessing.get_context("spawn").Process(
+            target=_serve, args=(port, certfile, keyfile, options), daemon=True,
+        )
+
+    @property
+    def search_url(self) -> str:
+        return f"{self.scheme}://localhost:{self.port}/search"
+
+    @property
+    def stats(self) -> dict:
+        return httpx.get(f"{self.scheme}://localhost:{self.port}/stats", verify=False).json()
+
+    def __enter__(self):
+        self._process.start()
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.1):
+                    return self
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub search engine for job search benchmarks")
+    parser.add_argument("--port", type=int, default=8901)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,30 @@
-from fastapi import FastAPI, APIRouter, UploadFile, File, Form, Body
+from fastapi import FastAPI, APIRouter, UploadFile, File, Form, Body, Request, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import json
+import asyncio
 import logging
+import inspect
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel
 from typing import List, Optional
 import uuid
 from datetime import datetime, timezone
 
-from agents.chat_engine import get_ai_response, analyze_resume_with_ai, generate_roadmap_with_ai
-from agents.job_hunter import search_jobs_web
+from agents.chat_engine import get_ai_response, stream_ai_response, analyze_resume_with_ai, generate_roadmap_with_ai
+from agents.llm_client import start_llm_client, close_llm_client, get_llm_client
+from agents.llm_cache import get_llm_cache
+from agents.chat_store import ChatStore
+from agents.chat_context import ChatContext
+from agents.job_queue import JobQueue, JobQueueFull
+from agents.pdf_extractor import get_pdf_extractor, close_pdf_extractor
+from agents.resume_batch import get_resume_batch_analyzer, close_resume_batch_analyzer
+from agents.job_hunter import search_jobs_live, get_filtered_sample_jobs, get_search_client, close_search_client
+from agents.search_cache import get_search_cache, make_search_key
+from agents.job_enrichment import enrich_jobs
 from agents.roadmap_architect import generate_roadmap
 from agents.resume_analyzer import parse_resume_text
 from agents.risk_analytics import calculate_automation_risk, get_shadow_salary, get_future_proofing_score
@@ -22,49 +35,47 @@ from agents.science_streams import (
     get_stream_roles, match_stream_keywords
 )
 from shared.skill_dictionary import (
-    expand_abbreviation, normalize_skills, calculate_skill_match,
-    get_skill_gaps, SKILL_DICTIONARY, ROLE_REQUIREMENTS
+    expand_abbreviation, normalize_skills,
+    get_skill_gaps, SKILL_DICTIONARY, ROLE_REQUIREMENTS, ROLE_NAMES
 )
 from shared.brand_config import BRAND_CONFIG
+from shared.static_payload import StaticPayload
+from shared.skill_matrix import match_roles
+from shared.json_response import FastJSONResponse, FastJSONRoute, pre_encode
+from shared.pagination import fetch_page
+from shared.metrics import metrics, MetricsMiddleware, MongoCommandTimer
+from shared.mongo_indexes import (
+    CHECK_QUERY_PLANS, MESSAGE_SORT, SESSION_SORT, check_query_plans, ensure_indexes
+)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, event_listeners=[MongoCommandTimer()])
 db = client[os.environ['DB_NAME']]
+chat_store = ChatStore(db)
+chat_context = ChatContext(db)
+job_queue = JobQueue(db.jobs)
 
-app = FastAPI()
-api_router = APIRouter(prefix="/api")
+app = FastAPI(default_response_class=FastJSONResponse)
+api_router = APIRouter(prefix="/api", route_class=FastJSONRoute)
+# Embedded in most responses, so it is encoded once here rather than in each one.
+pre_encode(BRAND_CONFIG["white_label"])
 
 # --- Pydantic Models ---
 
-class ChatMessage(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    session_id: str
-    role: str
-    content: str
-    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-
 class ChatRequest(BaseModel):
     session_id: str
     message: str
     context: Optional[str] = ""
 
-class ChatSession(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    title: str = "New Chat"
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    message_count: int = 0
-
 class JobSearchRequest(BaseModel):
     query: str
     location: Optional[str] = ""
     skills: Optional[List[str]] = []
     stream: Optional[str] = ""
+    page: Optional[int] = 1
 
 class RoadmapRequest(BaseModel):
     current_skills: List[str]
@@ -117,50 +128,96 @@ class ResumeTextRequest(BaseModel):
 @api_router.post("/chat")
 async def chat(request: ChatRequest):
     session_id = request.session_id
-    existing = await db.chat_sessions.find_one({"id": session_id}, {"_id": 0})
-    if not existing:
-        session = ChatSession(id=session_id)
-        await db.chat_sessions.insert_one(session.model_dump())
+    turn = await chat_store.start_turn(session_id, request.message)
+    window = await chat_context.build(turn)
 
-    user_msg = ChatMessage(session_id=session_id, role="user", content=request.message)
-    await db.chat_messages.insert_one(user_msg.model_dump())
+    ai_text = await get_ai_response(session_id, request.message, request.context or "", history=window["text"])
 
-    ai_text = await get_ai_response(session_id, request.message, request.context or "")
-
-    assistant_msg = ChatMessage(session_id=session_id, role="assistant", content=ai_text)
-    await db.chat_messages.insert_one(assistant_msg.model_dump())
-
-    title_text = request.message[:50] + ("..." if len(request.message) > 50 else "")
-    await db.chat_sessions.update_one(
-        {"id": session_id},
-        {"$set": {"updated_at": datetime.now(timezone.utc).isoformat(), "title": title_text},
-         "$inc": {"message_count": 2}}
-    )
+    assistant_msg = await chat_store.finish_turn(turn, ai_text)
+    chat_context.schedule_summary(session_id, window)
 
     return {
         "session_id": session_id,
         "message": {
-            "id": assistant_msg.id,
+            "id": assistant_msg["id"],
             "role": "assistant",
             "content": ai_text,
-            "timestamp": assistant_msg.timestamp,
+            "timestamp": assistant_msg["timestamp"],
         },
         "brand": BRAND_CONFIG["white_label"],
     }
 
 
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@api_router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """Same turn as /chat, but the reply is sent as Server-Sent Events.
+
+    Emits one "token" event per chunk and a final "done" event carrying the
+    stored assistant message. The user message is stored before streaming
+    starts; the assistant message is stored once, when the stream ends,
+    even if the client disconnects midway.
+    """
+    session_id = request.session_id
+    turn = await chat_store.start_turn(session_id, request.message)
+    window = await chat_context.build(turn)
+
+    async def events():
+        parts = []
+        try:
+            async for chunk in stream_ai_response(session_id, request.message, request.context or "",
+                                                  history=window["text"]):
+                parts.append(chunk)
+                yield sse_event("token", {"content": chunk})
+        finally:
+            # Shielded so a client disconnect cannot cancel the write.
+            finished = await asyncio.shield(chat_store.finish_turn(turn, "".join(parts)))
+            chat_context.schedule_summary(session_id, window)
+
+        yield sse_event("done", {
+            "session_id": session_id,
+            "message": {
+                "id": finished["id"],
+                "role": "assistant",
+                "content": finished["content"],
+                "timestamp": finished["timestamp"],
+            },
+            "brand": BRAND_CONFIG["white_label"],
+        })
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @api_router.get("/chat/sessions")
-async def get_sessions():
-    sessions = await db.chat_sessions.find({}, {"_id": 0}).sort("updated_at", -1).to_list(50)
-    return {"sessions": sessions, "brand": BRAND_CONFIG["white_label"]}
+async def get_sessions(limit: int = Query(50, ge=1, le=200), cursor: Optional[str] = None):
+    """Most recently updated sessions first; pass next_cursor back to get the next page"""
+    try:
+        sessions, next_cursor = await fetch_page(
+            db.chat_sessions, {}, SESSION_SORT, limit, cursor,
+            projection={"_id": 0, "pending_messages": 0, "summary_until": 0}
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    return {"sessions": sessions, "next_cursor": next_cursor, "brand": BRAND_CONFIG["white_label"]}
 
 
 @api_router.get("/chat/history/{session_id}")
-async def get_chat_history(session_id: str):
-    messages = await db.chat_messages.find(
-        {"session_id": session_id}, {"_id": 0}
-    ).sort("timestamp", 1).to_list(200)
-    return {"messages": messages, "session_id": session_id}
+async def get_chat_history(session_id: str, limit: int = Query(200, ge=1, le=500), cursor: Optional[str] = None):
+    """Messages of a session, oldest first; pass next_cursor back to get the next page"""
+    try:
+        messages, next_cursor = await fetch_page(
+            db.chat_messages, {"session_id": session_id}, MESSAGE_SORT, limit, cursor
+        )
+    except ValueError as e:
+        return {"error": str(e)}
+    return {"messages": messages, "session_id": session_id, "next_cursor": next_cursor}
 
 
 @api_router.delete("/chat/sessions/{session_id}")
@@ -180,21 +237,14 @@ async def search_jobs(request: JobSearchRequest):
         if stream_info:
             query += " " + " ".join(stream_info.get("keywords", [])[:3])
 
-    jobs = await search_jobs_web(query, request.location)
-
-    # Add risk scores and salary data
-    for job in jobs:
-        risk = calculate_automation_risk(job.get("title", ""))
-        job["risk_score"] = risk["risk_score"]
-        job["risk_level"] = risk["risk_level"]
-        job["human_necessity"] = risk["human_necessity"]
-        job["horizon"] = risk["horizon"]
-
-        salary_data = get_shadow_salary(job.get("title", ""))
-        job["shadow_salary"] = salary_data
-
-        if request.skills:
-            job["match_score"] = calculate_skill_match(request.skills, job.get("skills", []))
+    key = make_search_key(request.query, request.location, request.stream, request.page)
+    results = await get_search_cache().get_or_fetch(
+        key, lambda: search_jobs_live(query, request.location, request.page or 1)
+    )
+    # Sample jobs stand in when the web search fails; they are never cached.
+    results = results or get_filtered_sample_jobs(query, request.location)
+    # Cached results are shared between requests, so enrich copies.
+    jobs = enrich_jobs([dict(job) for job in results], request.skills)
 
     if request.skills:
         jobs.sort(key=lambda x: x.get("match_score", 0), reverse=True)
@@ -210,36 +260,74 @@ async def search_jobs(request: JobSearchRequest):
 
 # --- Resume ---
 
+async def enqueue_job(kind: str, run, webhook_url: Optional[str] = None):
+    """Queue run() on the job queue and answer 202 with the job id to poll"""
+    if webhook_url:
+        refused = job_queue.check_webhook(webhook_url)
+        if refused:
+            return {"error": refused}
+    try:
+        job = await job_queue.submit(kind, run, webhook_url)
+    except JobQueueFull:
+        return FastJSONResponse(status_code=503, content={"error": "Too many jobs in progress. Please try again shortly."})
+    return FastJSONResponse(status_code=202, content={
+        "job_id": job["id"],
+        "status": job["status"],
+        "poll_url": f"/api/jobs/{job['id']}",
+    })
+
+
+@api_router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = await job_queue.get(job_id)
+    if not job:
+        return {"error": "Job not found"}
+    return {"job": job}
+
+
 @api_router.post("/resume/analyze")
-async def analyze_resume(file: UploadFile = File(...)):
+async def analyze_resume(file: UploadFile = File(...), mode: str = "sync", webhook_url: Optional[str] = None):
+    """Analyze one resume; with mode=async the analysis runs as a background job"""
     content = await file.read()
+    if mode == "async":
+        return await enqueue_job("resume_analysis", lambda: run_resume_analysis(file.filename, content), webhook_url)
+    return await run_resume_analysis(file.filename, content)
+
+
+async def run_resume_analysis(filename: Optional[str], content: bytes) -> dict:
+    session_id = f"resume-{str(uuid.uuid4())[:8]}"
     text = ""
-    if file.filename and file.filename.lower().endswith('.pdf'):
+    ai_task = None
+    if filename and filename.lower().endswith('.pdf'):
+        # Pages arrive in order from the extraction pool. The LLM only reads
+        # the first 3000 characters, so it starts as soon as those are in.
         try:
-            import PyPDF2
-            import io
-            reader = PyPDF2.PdfReader(io.BytesIO(content))
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            async for page_text in get_pdf_extractor().iter_pages(content):
+                text += page_text + "\n"
+                if ai_task is None and len(text) >= 3000:
+                    ai_task = asyncio.create_task(analyze_resume_with_ai(session_id, text[:3000]))
         except Exception as e:
-            logging.error(f"PDF parse error: {e}")
-            text = content.decode('utf-8', errors='ignore')
+            # Pages extracted before a timeout are still analyzed; raw PDF bytes never are.
+            logging.error(f"PDF parse error: {e!r}")
+            if not text.strip():
+                return {"error": "Could not extract text from the uploaded PDF."}
     else:
         text = content.decode('utf-8', errors='ignore')
 
     if not text.strip():
         return {"error": "Could not extract text from the uploaded file."}
 
-    parsed = parse_resume_text(text)
-    session_id = f"resume-{str(uuid.uuid4())[:8]}"
-    ai_analysis = await analyze_resume_with_ai(session_id, text[:3000])
-    eq_sq = analyze_eq_sq(text)
+    # The LLM call is scheduled first; the rule-based analyzers run in worker
+    # threads while it is in flight.
+    ai_analysis, parsed, eq_sq = await asyncio.gather(
+        ai_task or analyze_resume_with_ai(session_id, text[:3000]),
+        asyncio.to_thread(parse_resume_text, text),
+        asyncio.to_thread(analyze_eq_sq, text),
+    )
 
     resume_doc = {
         "id": str(uuid.uuid4()),
-        "filename": file.filename,
+        "filename": filename,
         "parsed_data": parsed,
         "ai_analysis": ai_analysis,
         "eq_sq_assessment": eq_sq,
@@ -257,15 +345,35 @@ async def analyze_resume(file: UploadFile = File(...)):
     }
 
 
+@api_router.post("/resume/analyze-batch")
+async def analyze_resume_batch(files: List[UploadFile] = File(...)):
+    """Analyze many resumes, streaming one NDJSON line per file as it finishes.
+
+    Uploads may be resumes or zip archives of resumes. The last line is a
+    summary with the number of files analyzed and saved.
+    """
+    uploads = [(f.filename or "", await f.read()) for f in files]
+
+    async def results():
+        async for result in get_resume_batch_analyzer().run(uploads, db.resumes):
+            if result["status"] == "done":
+                result["brand"] = BRAND_CONFIG["white_label"]
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
 @api_router.post("/resume/analyze-text")
 async def analyze_resume_text_endpoint(request: ResumeTextRequest):
     if not request.text.strip():
         return {"error": "No text provided."}
 
-    parsed = parse_resume_text(request.text)
     session_id = f"resume-{str(uuid.uuid4())[:8]}"
-    ai_analysis = await analyze_resume_with_ai(session_id, request.text[:3000])
-    eq_sq = analyze_eq_sq(request.text)
+    ai_analysis, parsed, eq_sq = await asyncio.gather(
+        analyze_resume_with_ai(session_id, request.text[:3000]),
+        asyncio.to_thread(parse_resume_text, request.text),
+        asyncio.to_thread(analyze_eq_sq, request.text),
+    )
 
     return {
         "parsed": parsed,
@@ -277,19 +385,30 @@ async def analyze_resume_text_endpoint(request: ResumeTextRequest):
 
 # --- Roadmap ---
 
+def build_structured_roadmap(current_skills: List[str], target_role: str, timeline_weeks: int) -> tuple:
+    """Rule-based roadmap plus sprints for its missing must-have skills"""
+    roadmap = generate_roadmap(current_skills, target_role, timeline_weeks)
+    missing = roadmap.get("skill_gap_analysis", {}).get("missing_must_have", [])
+    return roadmap, generate_gap_sprints(missing)
+
+
 @api_router.post("/roadmap/generate")
-async def generate_career_roadmap(request: RoadmapRequest):
-    roadmap = generate_roadmap(request.current_skills, request.target_role, request.timeline_weeks)
+async def generate_career_roadmap(request: RoadmapRequest, mode: str = "sync", webhook_url: Optional[str] = None):
+    """Generate a roadmap; with mode=async it is built as a background job"""
+    if mode == "async":
+        return await enqueue_job("roadmap_generation", lambda: run_roadmap_generation(request), webhook_url)
+    return await run_roadmap_generation(request)
+
 
+async def run_roadmap_generation(request: RoadmapRequest) -> dict:
     session_id = f"roadmap-{str(uuid.uuid4())[:8]}"
-    ai_roadmap = await generate_roadmap_with_ai(
-        session_id, request.current_skills, request.target_role, request.timeline_weeks
+    # The LLM call is scheduled first; the structured roadmap is built in a
+    # worker thread while it is in flight.
+    ai_roadmap, (roadmap, sprints) = await asyncio.gather(
+        generate_roadmap_with_ai(session_id, request.current_skills, request.target_role, request.timeline_weeks),
+        asyncio.to_thread(build_structured_roadmap, request.current_skills, request.target_role, request.timeline_weeks),
     )
 
-    # Generate gap sprints for missing skills
-    missing = roadmap.get("skill_gap_analysis", {}).get("missing_must_have", [])
-    sprints = generate_gap_sprints(missing)
-
     roadmap_doc = {
         "id": str(uuid.uuid4()),
         "target_role": request.target_role,
@@ -356,8 +475,7 @@ async def analyze_eq(request: EQRequest):
 
 # --- Science Streams ---
 
-@api_router.get("/streams")
-async def get_streams():
+def build_streams_catalog() -> dict:
     streams = []
     for code, info in SCIENCE_STREAMS.items():
         streams.append({
@@ -370,6 +488,11 @@ async def get_streams():
     return {"streams": streams}
 
 
+@api_router.get("/streams")
+async def get_streams(request: Request):
+    return catalog_payloads["streams"].respond(request)
+
+
 @api_router.post("/streams/match")
 async def match_stream(request: StreamRequest):
     result = match_stream_keywords(request.skills, request.stream)
@@ -439,7 +562,8 @@ async def skill_gap_analysis(request: SkillGapRequest):
     return {
         "analysis": gaps,
         "target_role": request.target_role,
-        "available_roles": list(ROLE_REQUIREMENTS.keys()),
+        "closest_roles": match_roles(request.current_skills),
+        "available_roles": ROLE_NAMES,
         "brand": BRAND_CONFIG["white_label"],
     }
 
@@ -453,14 +577,17 @@ async def expand_skill(request: ExpandRequest):
     return {"term": request.term, "expanded": expanded}
 
 
-@api_router.get("/skills/dictionary")
-async def get_skill_dictionary():
+def build_dictionary_catalog() -> dict:
     combined = {**SKILL_DICTIONARY, **SCIENCE_FULL_FORMS}
     return {"dictionary": combined, "total": len(combined)}
 
 
-@api_router.get("/skills/roles")
-async def get_available_roles():
+@api_router.get("/skills/dictionary")
+async def get_skill_dictionary(request: Request):
+    return catalog_payloads["dictionary"].respond(request)
+
+
+def build_roles_catalog() -> dict:
     roles = []
     for role, info in ROLE_REQUIREMENTS.items():
         risk = calculate_automation_risk(role)
@@ -477,6 +604,21 @@ async def get_available_roles():
     return {"roles": roles}
 
 
+@api_router.get("/skills/roles")
+async def get_available_roles(request: Request):
+    return catalog_payloads["roles"].respond(request)
+
+
+# Catalog responses built from static module data, serialized once at startup
+catalog_payloads = {}
+
+
+def build_catalog_payloads():
+    catalog_payloads["streams"] = StaticPayload(build_streams_catalog())
+    catalog_payloads["dictionary"] = StaticPayload(build_dictionary_catalog())
+    catalog_payloads["roles"] = StaticPayload(build_roles_catalog())
+
+
 # --- Brand ---
 
 @api_router.get("/brand")
@@ -492,6 +634,45 @@ async def root():
     ]}
 
 
+# --- Metrics ---
+
+def collect_runtime_metrics() -> list:
+    """Cache, LLM and job queue counters kept by their own modules"""
+    llm = get_llm_client()
+    llm_cache = get_llm_cache().stats()
+    search_cache = get_search_cache().stats()
+    jobs = job_queue.stats()
+    return [
+        ("glixai_llm_in_flight", "gauge", "LLM requests in flight", {}, llm.in_flight),
+        ("glixai_llm_waiting", "gauge", "LLM requests waiting for a slot", {}, llm.waiting),
+        ("glixai_llm_streaming", "gauge", "1 when chat replies stream from the provider, 0 when sent whole",
+         {}, int(llm.can_stream)),
+        ("glixai_cache_lookups_total", "counter", "Cache lookups by cache and outcome",
+         {"cache": "llm", "outcome": "memory_hit"}, llm_cache["memory_hits"]),
+        ("glixai_cache_lookups_total", "counter", "Cache lookups by cache and outcome",
+         {"cache": "llm", "outcome": "mongo_hit"}, llm_cache["mongo_hits"]),
+        ("glixai_cache_lookups_total", "counter", "Cache lookups by cache and outcome",
+         {"cache": "llm", "outcome": "miss"}, llm_cache["misses"]),
+        ("glixai_cache_lookups_total", "counter", "Cache lookups by cache and outcome",
+         {"cache": "job_search", "outcome": "hit"}, search_cache["hits"]),
+        ("glixai_cache_lookups_total", "counter", "Cache lookups by cache and outcome",
+         {"cache": "job_search", "outcome": "stale_hit"}, search_cache["stale_hits"]),
+        ("glixai_cache_lookups_total", "counter", "Cache lookups by cache and outcome",
+         {"cache": "job_search", "outcome": "miss"}, search_cache["misses"]),
+        ("glixai_jobs_queued", "gauge", "Background jobs waiting for a worker", {}, jobs["queued"]),
+        ("glixai_jobs_active", "gauge", "Background jobs queued or running in this process", {}, jobs["active"]),
+    ]
+
+
+metrics.register_collector(collect_runtime_metrics)
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text exposition of every histogram, gauge and counter"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 app.include_router(api_router)
 
 app.add_middleware(
@@ -501,6 +682,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Added last so it is outermost and times the whole request.
+app.add_middleware(MetricsMiddleware)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -508,6 +691,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_llm_client():
+    await start_llm_client()
+    if os.environ.get('LLM_CACHE_MONGO', 'true').lower() != 'false':
+        get_llm_cache().use_mongo(db.llm_cache)
+
+
+@app.on_event("startup")
+async def startup_indexes():
+    # Failures are logged per index; the app still starts without them.
+    await ensure_indexes(db)
+    if CHECK_QUERY_PLANS:
+        # Dev mode: refuse to start when a known query shape would scan a collection.
+        await check_query_plans(db)
+
+
+@app.on_event("startup")
+async def startup_job_queue():
+    job_queue.start()
+
+
+@app.on_event("startup")
+async def startup_catalog_payloads():
+    build_catalog_payloads()
+
+
+@app.on_event("startup")
+async def startup_pdf_extractor():
+    get_pdf_extractor().start()
+
+
+@app.on_event("startup")
+async def startup_search_client():
+    get_search_client()
+
+
 @app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+async def shutdown_services():
+    # One hook so the order is explicit: the job queue and pending chat
+    # summaries still write to Mongo and call the LLM, so they stop first
+    # and the Mongo client closes last. A failing step does not skip the rest.
+    steps = [
+        ("job queue", job_queue.close),
+        ("resume batch analyzer", close_resume_batch_analyzer),
+        ("chat context", chat_context.close),
+        ("LLM client", close_llm_client),
+        ("PDF extractor", close_pdf_extractor),
+        ("search client", close_search_client),
+        ("Mongo client", client.close),
+    ]
+    for name, close in steps:
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"Shutdown of {name} failed: {e!r}")
@@ -0,0 +1,286 @@
+"""
+GlixAI Job Index
+In-memory inverted index with field-weighted BM25 scoring for job postings
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import islice
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+
+# Field weights follow the old linear scan: a title hit counted 3, a skill 2
+# and a description word 1.
+FIELD_WEIGHTS = {"title": 3.0, "skills": 2.0, "description": 1.0}
+LOCATION_BOOST = 2.0
+# A query word also matches up to this many longer indexed words it prefixes.
+MAX_PREFIX_EXPANSIONS = 16
+# Cached term scores are refreshed once the corpus has grown or shrunk by this fraction.
+STATS_DRIFT = 0.05
+# Recent search results kept until the index next changes.
+RESULT_CACHE_SIZE = 256
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class _ScoreList:
+    """Per-document scores of one query clause, with sorted and random access"""
+
+    __slots__ = ("order", "scores")
+
+    def __init__(self, scores: dict):
+        self.scores = scores
+        self.order = sorted(((score, doc_id) for doc_id, score in scores.items()), key=lambda e: (-e[0], e[1]))
+
+
+class JobIndex:
+    """Inverted index over job postings.
+
+    Title, skills and description are scored with BM25 per field and
+    combined with the field weights; jobs whose location matches, or that
+    are remote, get a flat boost. Query words also match indexed words they
+    are a prefix of, so "dev" finds "developer"; like the old substring
+    scan, a word counts once per job, through its best-scoring match.
+
+    Each term's scores are computed once and kept sorted, and the top
+    results are found with the threshold algorithm, which stops reading
+    the lists as soon as no unseen job can beat the current top ``limit``.
+    Repeated searches are answered from a small result cache. Adding or
+    removing a job clears that cache but only drops the score lists of its
+    own terms; the corpus statistics behind the scores are refreshed once
+    the corpus has drifted by ``STATS_DRIFT``.
+    """
+
+    def __init__(self, jobs=(), k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._jobs = {}
+        self._next_id = 0
+        # field -> term -> {doc_id: term frequency}
+        self._postings = {field: {} for field in FIELD_WEIGHTS}
+        self._lengths = {field: {} for field in FIELD_WEIGHTS}
+        self._total_length = {field: 0 for field in FIELD_WEIGHTS}
+        self._location_terms = {}
+        self._doc_terms = {}
+        self._terms = set()
+        self._vocabulary = []
+        self._vocabulary_stale = False
+        self._term_cache = {}
+        self._word_cache = {}
+        self._location_cache = {}
+        self._result_cache = OrderedDict()
+        self._stats_size = 0
+        self.add_many(jobs)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @staticmethod
+    def _field_tokens(job: dict) -> dict:
+        return {
+            "title": tokenize(job.get("title", "")),
+            "skills": tokenize(" ".join(job.get("skills", []))),
+            "description": tokenize(job.get("description", "")),
+        }
+
+    def _changed(self, terms):
+        for term in terms:
+            self._term_cache.pop(term, None)
+        self._word_cache.clear()
+        self._location_cache.clear()
+        self._result_cache.clear()
+        if abs(len(self._jobs) - self._stats_size) > STATS_DRIFT * max(self._stats_size, 1):
+            self._stats_size = len(self._jobs)
+            self._term_cache.clear()
+
+    def add(self, job: dict) -> int:
+        """Index a job and return its id"""
+        doc_id = self._next_id
+        self._next_id += 1
+        self._jobs[doc_id] = job
+
+        terms = set()
+        for field, tokens in self._field_tokens(job).items():
+            self._lengths[field][doc_id] = len(tokens)
+            self._total_length[field] += len(tokens)
+            postings = self._postings[field]
+            for token in tokens:
+                docs = postings.get(token)
+                if docs is None:
+                    docs = postings[token] = {}
+                docs[doc_id] = docs.get(doc_id, 0) + 1
+                terms.add(token)
+
+        location_tokens = set(tokenize(job.get("location", "")))
+        for token in location_tokens:
+            self._location_terms.setdefault(token, set()).add(doc_id)
+
+        new_terms = (terms | location_tokens) - self._terms
+        if new_terms:
+            self._terms |= new_terms
+            self._vocabulary_stale = True
+        self._doc_terms[doc_id] = (terms, location_tokens)
+        self._changed(terms)
+        return doc_id
+
+    def add_many(self, jobs) -> list:
+        return [self.add(job) for job in jobs]
+
+    def remove(self, doc_id: int):
+        """Drop a job from the index"""
+        if doc_id not in self._jobs:
+            return
+        terms, location_tokens = self._doc_terms.pop(doc_id)
+        for field in FIELD_WEIGHTS:
+            self._total_length[field] -= self._lengths[field].pop(doc_id)
+            postings = self._postings[field]
+            for term in terms:
+                docs = postings.get(term)
+                if docs and doc_id in docs:
+                    del docs[doc_id]
+                    if not docs:
+                        del postings[term]
+        for token in location_tokens:
+            docs = self._location_terms[token]
+            docs.discard(doc_id)
+            if not docs:
+                del self._location_terms[token]
+        del self._jobs[doc_id]
+        # Unused vocabulary entries only cost a lookup, so they are left in place.
+        self._changed(terms)
+
+    def _expand(self, word: str) -> list:
+        """Indexed terms that start with word, the word itself first"""
+        if self._vocabulary_stale:
+            self._vocabulary = sorted(self._terms)
+            self._vocabulary_stale = False
+        vocabulary = self._vocabulary
+        index = bisect_left(vocabulary, word)
+        terms = []
+        while index < len(vocabulary) and vocabulary[index].startswith(word) and len(terms) < MAX_PREFIX_EXPANSIONS:
+            terms.append(vocabulary[index])
+            index += 1
+        return terms
+
+    def _term_scores(self, term: str) -> _ScoreList:
+        cached = self._term_cache.get(term)
+        if cached is not None:
+            return cached
+
+        total = len(self._jobs)
+        k1, b = self.k1, self.b
+        scores = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            docs = self._postings[field].get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            avg_length = self._total_length[field] / total or 1.0
+            lengths = self._lengths[field]
+            for doc_id, tf in docs.items():
+                norm = k1 * (1 - b + b * lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf * tf * (k1 + 1) / (tf + norm)
+
+        entry = self._term_cache[term] = _ScoreList(scores)
+        return entry
+
+    def _word_scores(self, word: str) -> _ScoreList:
+        """Scores for a query word: its best-scoring expansion in each job"""
+        terms = self._expand(word)
+        if len(terms) == 1:
+            return self._term_scores(terms[0])
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            return cached
+
+        scores = {}
+        for term in terms:
+            for doc_id, score in self._term_scores(term).scores.items():
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        entry = self._word_cache[word] = _ScoreList(scores)
+        return entry
+
+    def _location_scores(self, location: str) -> _ScoreList:
+        key = location.lower().strip()
+        cached = self._location_cache.get(key)
+        if cached is not None:
+            return cached
+
+        matched = set(self._location_terms.get("remote", ()))
+        docs = None
+        for word in tokenize(location):
+            word_docs = set()
+            for term in self._expand(word):
+                word_docs |= self._location_terms.get(term, set())
+            docs = word_docs if docs is None else docs & word_docs
+            if not docs:
+                break
+        matched |= docs or set()
+
+        entry = self._location_cache[key] = _ScoreList(dict.fromkeys(matched, LOCATION_BOOST))
+        return entry
+
+    @staticmethod
+    def _top(lists: list, limit: int) -> list:
+        """Threshold algorithm over score lists sorted best first"""
+        if len(lists) == 1:
+            return [(score, doc_id) for score, doc_id in lists[0].order[:limit]]
+
+        seen = set()
+        top = []  # min-heap of (score, -doc_id)
+        depth = 0
+        while True:
+            threshold = 0.0
+            exhausted = True
+            for entries in lists:
+                if depth >= len(entries.order):
+                    continue
+                exhausted = False
+                score, doc_id = entries.order[depth]
+                threshold += score
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                total = sum(other.scores.get(doc_id, 0.0) for other in lists)
+                item = (total, -doc_id)
+                if len(top) < limit:
+                    heapq.heappush(top, item)
+                elif item > top[0]:
+                    heapq.heapreplace(top, item)
+            depth += 1
+            if exhausted or (len(top) == limit and top[0][0] >= threshold):
+                break
+        return [(score, -neg_id) for score, neg_id in sorted(top, reverse=True)]
+
+    def search(self, query: str, location: str = "", limit: int = 8) -> list:
+        """Return up to limit jobs, best first"""
+        words = frozenset(tokenize(query))
+        key = (words, location.lower().strip(), limit)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return list(cached)
+
+        lists = [self._word_scores(word) for word in words]
+        if location:
+            lists.append(self._location_scores(location))
+        lists = [entries for entries in lists if entries.order]
+
+        best = self._top(lists, limit) if lists else []
+        results = [self._jobs[doc_id] for _, doc_id in best]
+        if not words and len(results) < limit:
+            # Without a query every job qualifies; the rest follow in insertion order.
+            ranked = {doc_id for _, doc_id in best}
+            rest = (job for doc_id, job in self._jobs.items() if doc_id not in ranked)
+            results.extend(islice(rest, limit - len(results)))
+
+        self._result_cache[key] = results
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return list(results)
@@ -0,0 +1,91 @@
+"""
+GlixAI JSON Responses
+orjson-encoded responses that skip FastAPI's jsonable_encoder pass, with pre-encoded blocks spliced in
+"""
+
+import functools
+import inspect
+from typing import Any
+
+import orjson
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from starlette.responses import JSONResponse, Response
+
+# id(value) -> (value, encoded fragment). The value is held so its id stays unique.
+_fragments = {}
+
+
+def pre_encode(value):
+    """Encode ``value`` once for every response that carries it.
+
+    A response whose top-level entry is this very object gets the stored
+    bytes spliced in instead of encoding it again. The value must not be
+    mutated afterwards.
+    """
+    _fragments[id(value)] = (value, orjson.Fragment(orjson.dumps(value)))
+    return value
+
+
+def _default(value):
+    # Types orjson does not know (sets, pydantic models) go through FastAPI's encoder.
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson, splicing in pre_encode()d values"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, dict) and _fragments:
+            content = {
+                key: _fragments[id(value)][1] if id(value) in _fragments else value
+                for key, value in content.items()
+            }
+        return dumps(content)
+
+
+def _respond_directly(endpoint, response_class):
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            content = await endpoint(*args, **kwargs)
+            return content if isinstance(content, Response) else response_class(content)
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            content = endpoint(*args, **kwargs)
+            return content if isinstance(content, Response) else response_class(content)
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """APIRoute that hands plain return values straight to FastJSONResponse.
+
+    FastAPI runs every returned value through jsonable_encoder before the
+    response class sees it, which costs several times the encoding itself.
+    Routes without a response model, return annotation or explicit status
+    code skip that pass here; orjson encodes the value directly and falls
+    back to jsonable_encoder only for types it does not know. Other routes
+    behave as usual.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        response_class = kwargs.get("response_class")
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        response_model = kwargs.get("response_model")
+        if isinstance(response_model, DefaultPlaceholder):
+            response_model = response_model.value
+        if (
+            isinstance(response_class, type) and issubclass(response_class, FastJSONResponse)
+            and response_model is None
+            and kwargs.get("status_code") is None
+            and inspect.signature(endpoint).return_annotation is inspect.Signature.empty
+        ):
+            endpoint = _respond_directly(endpoint, response_class)
+        super().__init__(path, endpoint, **kwargs)
@@ -0,0 +1,89 @@
+"""
+GlixAI Keyword Matcher
+Multi-pattern keyword automaton for skill and indicator extraction
+"""
+
+import re
+
+WORD_CHAR = r"[^\W_]"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum()
+
+
+class KeywordMatcher:
+    """Find every keyword in a text in a single pass.
+
+    The keywords are folded into a trie and compiled into one regular
+    expression, so the scan runs inside the regex engine and its cost does
+    not grow with the number of keywords. Matches only start on a word
+    boundary and, unless ``prefix=True``, only end on one: "java" does not
+    match inside "javascript" and "go" does not match "good". With
+    ``prefix=True`` a keyword also matches the start of a longer word, so
+    "mentor" still matches "mentored" and "team" matches "teams".
+    """
+
+    def __init__(self, keywords, prefix: bool = False):
+        self.keywords = list(dict.fromkeys(k.lower() for k in keywords))
+        self.prefix = prefix
+        self._index = {keyword: i for i, keyword in enumerate(self.keywords)}
+
+        trie = {}
+        for keyword in self.keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = True
+        self._pattern = re.compile(f"(?<!{WORD_CHAR})(?:{self._compile(trie)})")
+
+        # The regex reports the longest keyword at each start; shorter keywords
+        # at the same start are implied by it.
+        self._implied = {keyword: self._shorter_matches(keyword) for keyword in self.keywords}
+        # Word starts inside a keyword where another keyword could begin,
+        # e.g. "data science" inside "big data science".
+        self._inner_starts = {
+            keyword: [
+                i for i in range(1, len(keyword))
+                if _is_word_char(keyword[i]) and not _is_word_char(keyword[i - 1])
+            ]
+            for keyword in self.keywords
+        }
+
+    def _compile(self, node: dict) -> str:
+        """Emit a trie node as a regex, preferring the longest keyword"""
+        branches = [re.escape(ch) + self._compile(child) for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            branches.append("" if self.prefix else f"(?!{WORD_CHAR})")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    def _shorter_matches(self, keyword: str) -> tuple:
+        implied = []
+        for length in range(1, len(keyword) + 1):
+            candidate = keyword[:length]
+            if candidate not in self._index:
+                continue
+            if self.prefix or length == len(keyword) or not _is_word_char(keyword[length]):
+                implied.append(self._index[candidate])
+        return tuple(implied)
+
+    def find(self, text: str) -> list:
+        """Return the distinct keywords found in text, in declaration order"""
+        text = text.lower()
+        found = set()
+        for match in self._pattern.finditer(text):
+            pending = [match]
+            while pending:
+                current = pending.pop()
+                keyword = current.group()
+                found.update(self._implied[keyword])
+                for offset in self._inner_starts[keyword]:
+                    if current.start() + offset >= match.end():
+                        break
+                    inner = self._pattern.match(text, current.start() + offset)
+                    if inner:
+                        pending.append(inner)
+
+        return [self.keywords[i] for i in sorted(found)]
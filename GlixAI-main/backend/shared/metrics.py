@@ -0,0 +1,263 @@
+"""
+GlixAI Metrics
+Latency histograms, in-flight gauges and counters, exposed in Prometheus text format
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Tuple
+
+from pymongo import monitoring
+
+# HDR-style log-linear buckets: four per power of two from 2**-13 s (122 us)
+# to 2**6 s (64 s), so every bucket is within 19% of its neighbours.
+SUB_BUCKETS = (1.0, 1.1892, 1.4142, 1.6818)
+BUCKET_BOUNDS = tuple(m * 2.0 ** e for e in range(-13, 6) for m in SUB_BUCKETS) + (64.0,)
+
+# The request scope of the current task, so spans can be labelled with the route.
+_current_scope: contextvars.ContextVar = contextvars.ContextVar("glixai_request_scope", default=None)
+
+
+def current_route() -> str:
+    scope = _current_scope.get()
+    if scope is None:
+        return ""
+    return route_of(scope)
+
+
+def route_of(scope: dict) -> str:
+    """Route template of a request (``/api/jobs/{job_id}``), never its raw path"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class Histogram:
+    """Counts of observations per bucket, plus their count and sum"""
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        low, high = 0, len(BUCKET_BOUNDS)
+        while low < high:
+            mid = (low + high) // 2
+            if seconds <= BUCKET_BOUNDS[mid]:
+                high = mid
+            else:
+                low = mid + 1
+        self.counts[low] += 1
+        self.count += 1
+        self.sum += seconds
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """Thread-safe store of every metric family, rendered on demand.
+
+    Histograms, gauges and counters are created on first use. Collectors
+    are callables run at render time, for numbers other modules already
+    keep, such as cache hit counts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._families: Dict[str, dict] = {}
+        self._collectors = []
+
+    def _family(self, name: str, kind: str, help_text: str, label_names: Tuple[str, ...]) -> dict:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = {"kind": kind, "help": help_text, "labels": label_names, "series": {}}
+        return family
+
+    def observe(self, name: str, help_text: str, labels: Dict[str, str], seconds: float):
+        with self._lock:
+            family = self._family(name, "histogram", help_text, tuple(labels))
+            key = tuple(labels.values())
+            histogram = family["series"].get(key)
+            if histogram is None:
+                histogram = family["series"][key] = Histogram()
+            histogram.observe(seconds)
+
+    def add(self, name: str, help_text: str, labels: Dict[str, str], value: float = 1, kind: str = "counter"):
+        with self._lock:
+            family = self._family(name, kind, help_text, tuple(labels))
+            key = tuple(labels.values())
+            family["series"][key] = family["series"].get(key, 0) + value
+
+    def register_collector(self, collector: Callable[[], list]):
+        """collector() returns (name, kind, help, {label: value}, value) tuples"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, family in sorted(self._families.items()):
+                lines.append(f"# HELP {name} {family['help']}")
+                lines.append(f"# TYPE {name} {family['kind']}")
+                for key, series in sorted(family["series"].items()):
+                    if family["kind"] == "histogram":
+                        lines.extend(self._render_histogram(name, family["labels"], key, series))
+                    else:
+                        lines.append(f"{name}{_format_labels(family['labels'], key)} {_format_number(series)}")
+
+        collected = {}
+        for collector in self._collectors:
+            for name, kind, help_text, labels, value in collector():
+                entry = collected.setdefault(name, (kind, help_text, []))
+                entry[2].append((labels, value))
+        for name, (kind, help_text, samples) in sorted(collected.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(name: str, label_names: Tuple[str, ...], key: Tuple, histogram: Histogram) -> list:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(BUCKET_BOUNDS, histogram.counts):
+            cumulative += count
+            le = 'le="%.6g"' % bound
+            lines.append(f"{name}_bucket{_format_labels(label_names, key, le)} {cumulative}")
+        le = 'le="+Inf"'
+        lines.append(f"{name}_bucket{_format_labels(label_names, key, le)} {histogram.count}")
+        lines.append(f"{name}_count{_format_labels(label_names, key)} {histogram.count}")
+        lines.append(f"{name}_sum{_format_labels(label_names, key)} {histogram.sum!r}")
+        return lines
+
+
+metrics = MetricsRegistry()
+
+STAGE_SECONDS = "glixai_stage_duration_seconds"
+STAGE_HELP = "Time spent in one stage of request handling (LLM, job search, PDF extraction, analyzers)"
+STAGE_IN_FLIGHT = "glixai_stage_in_flight"
+
+
+@contextmanager
+def span(stage: str):
+    """Time a block as one stage of the current request"""
+    labels = {"stage": stage, "route": current_route()}
+    metrics.add(STAGE_IN_FLIGHT, "Stage executions currently running", labels, 1, kind="gauge")
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe(STAGE_SECONDS, STAGE_HELP, labels, time.perf_counter() - start)
+        metrics.add(STAGE_IN_FLIGHT, "Stage executions currently running", labels, -1, kind="gauge")
+
+
+def timed(stage: str):
+    """Decorator form of span() for sync, async and async generator functions"""
+    def decorate(fn):
+        if inspect.isasyncgenfunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                with span(stage):
+                    async for item in fn(*args, **kwargs):
+                        yield item
+        elif inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                with span(stage):
+                    return await fn(*args, **kwargs)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with span(stage):
+                    return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request by method, route template and status.
+
+    The time covers the whole response, including streamed bodies.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        token = _current_scope.set(scope)
+        in_flight = {"method": scope["method"]}
+        metrics.add("glixai_http_in_flight", "HTTP requests currently being served", in_flight, 1, kind="gauge")
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_scope.reset(token)
+            metrics.add("glixai_http_in_flight", "HTTP requests currently being served", in_flight, -1, kind="gauge")
+            metrics.observe(
+                "glixai_http_request_duration_seconds", "HTTP request latency by route",
+                {"method": scope["method"], "route": route_of(scope), "status": str(status["code"])}, elapsed,
+            )
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """pymongo command listener recording every Mongo command's server round trip.
+
+    Motor runs commands on its executor with a copy of the caller's context,
+    so the request route is still readable here; commands issued outside a
+    request (startup, job workers) get an empty route.
+    """
+
+    def __init__(self):
+        self._commands = {}
+
+    def started(self, event):
+        command = event.command
+        collection = command.get(event.command_name)
+        self._commands[(event.connection_id, event.request_id)] = (
+            collection if isinstance(collection, str) else "", current_route(),
+        )
+
+    def _record(self, event, outcome: str):
+        collection, route = self._commands.pop((event.connection_id, event.request_id), ("", ""))
+        metrics.observe(
+            "glixai_mongo_command_duration_seconds", "Mongo command round trip by route, command and collection",
+            {"route": route, "command": event.command_name, "collection": collection, "outcome": outcome},
+            event.duration_micros / 1_000_000,
+        )
+
+    def succeeded(self, event):
+        self._record(event, "ok")
+
+    def failed(self, event):
+        self._record(event, "error")
@@ -0,0 +1,107 @@
+"""
+GlixAI Mongo Indexes
+Declarative index registry for the app's collections, plus a query-plan check for dev mode
+"""
+
+import logging
+import os
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from shared.pagination import after_filter
+
+logger = logging.getLogger(__name__)
+
+CHECK_QUERY_PLANS = os.environ.get('CHECK_QUERY_PLANS', 'false').lower() == 'true'
+
+# Page orders; each ends in the unique id so that cursors are unambiguous.
+SESSION_SORT = [("updated_at", DESCENDING), ("id", DESCENDING)]
+MESSAGE_SORT = [("timestamp", ASCENDING), ("id", ASCENDING)]
+
+# Every index the app relies on, by collection
+INDEXES = {
+    "chat_sessions": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel(SESSION_SORT),
+    ],
+    "chat_messages": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("session_id", ASCENDING), *MESSAGE_SORT]),
+    ],
+    "passports": [IndexModel([("id", ASCENDING)], unique=True)],
+    "resumes": [IndexModel([("id", ASCENDING)], unique=True)],
+    "roadmaps": [IndexModel([("id", ASCENDING)], unique=True)],
+    "jobs": [
+        IndexModel([("id", ASCENDING)], unique=True),
+        # Finished jobs carry expire_at; queued and running ones never expire.
+        IndexModel([("expire_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+    # Entries are keyed by prompt hash in _id and carry their own expire_at.
+    "llm_cache": [IndexModel([("expire_at", ASCENDING)], expireAfterSeconds=0)],
+}
+
+# The filter/sort shapes the endpoints query with, with placeholder values
+QUERY_SHAPES = [
+    # ChatStore.start_turn's find_one_and_update, and the session lookups
+    ("chat_sessions", {"id": "x"}, None),
+    ("chat_sessions", {}, SESSION_SORT),
+    ("chat_sessions", after_filter(SESSION_SORT, ["x", "x"]), SESSION_SORT),
+    # ChatStore.finish_turn's upserts
+    ("chat_messages", {"id": "x"}, None),
+    ("chat_messages", {"session_id": "x"}, MESSAGE_SORT),
+    ("chat_messages", {"$and": [{"session_id": "x"}, after_filter(MESSAGE_SORT, ["x", "x"])]}, MESSAGE_SORT),
+    # ChatContext.build: the newest unsummarized messages, then the oldest ones
+    ("chat_messages", {"session_id": "x", "timestamp": {"$gt": "x"}}, [("timestamp", DESCENDING), ("id", DESCENDING)]),
+    ("chat_messages", {"session_id": "x", "timestamp": {"$gt": "x", "$lt": "x"}}, MESSAGE_SORT),
+    ("passports", {"id": "x"}, None),
+    ("resumes", {"id": "x"}, None),
+    ("roadmaps", {"id": "x"}, None),
+    # JobQueue.get, and the find_one_and_update that records a finished job
+    ("jobs", {"id": "x"}, None),
+]
+
+
+async def ensure_indexes(db) -> list:
+    """Create every registered index; existing ones are left as they are.
+
+    Each index is created on its own, so one that fails (say, an existing
+    index with other options) does not keep the rest from being built.
+    Returns the failures as "collection.index: error" strings.
+    """
+    failures = []
+    for name, models in INDEXES.items():
+        created = []
+        for model in models:
+            try:
+                created += await db[name].create_indexes([model])
+            except Exception as e:
+                failures.append(f"{name}.{model.document['name']}: {e}")
+        logger.info(f"Indexes on {name}: {', '.join(created) or 'none'}")
+    for failure in failures:
+        logger.warning(f"Index creation failed: {failure}")
+    return failures
+
+
+def plan_stages(plan: dict):
+    """Every stage name in an explain() plan tree"""
+    yield plan.get("stage")
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            yield from plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from plan_stages(child)
+
+
+async def check_query_plans(db):
+    """Raise RuntimeError if any known query shape would scan a whole collection"""
+    scans = []
+    for name, query, sort in QUERY_SHAPES:
+        cursor = db[name].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        explained = await cursor.explain()
+        if "COLLSCAN" in plan_stages(explained["queryPlanner"]["winningPlan"]):
+            scans.append(f"{name} {query} sort={sort}")
+    if scans:
+        raise RuntimeError("Queries without a usable index: " + "; ".join(scans))
+    logger.info(f"Query plan check passed for {len(QUERY_SHAPES)} query shapes")
@@ -0,0 +1,56 @@
+"""
+GlixAI Pagination
+Keyset (cursor) pagination over Mongo collections
+"""
+
+import base64
+import json
+from typing import List, Optional, Tuple
+
+from pymongo import ASCENDING
+
+
+def encode_cursor(values: list) -> str:
+    """Opaque cursor for the sort key values of the last document of a page"""
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list:
+    """Sort key values from a cursor; raises ValueError when it is malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def after_filter(sort: List[Tuple[str, int]], values: list) -> dict:
+    """Filter matching the documents that come after ``values`` in ``sort`` order"""
+    if len(values) != len(sort):
+        raise ValueError("Invalid cursor")
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {prev_field: values[j] for j, (prev_field, _) in enumerate(sort[:i])}
+        clause[field] = {"$gt" if direction == ASCENDING else "$lt": values[i]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+
+async def fetch_page(collection, query: dict, sort: List[Tuple[str, int]], limit: int,
+                     cursor: Optional[str] = None, projection: Optional[dict] = None) -> Tuple[list, Optional[str]]:
+    """One page of documents and the cursor of the next page (None on the last page).
+
+    ``sort`` must end in a unique field so that the order is total, and an
+    index on the query fields followed by the sort fields keeps every page
+    an index range scan, however deep it is.
+    """
+    if cursor:
+        query = {"$and": [query, after_filter(sort, decode_cursor(cursor))]}
+    documents = await collection.find(query, projection or {"_id": 0}).sort(sort).limit(limit + 1).to_list(limit + 1)
+    if len(documents) <= limit:
+        return documents, None
+    documents = documents[:limit]
+    return documents, encode_cursor([documents[-1].get(field) for field, _ in sort])
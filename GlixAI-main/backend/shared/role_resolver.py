@@ -0,0 +1,96 @@
+"""
+GlixAI Role Resolver
+Maps free-form job titles onto the roles of a profile table through a token index
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Optional
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+# Title words also match role words they start with ("engineering" -> "engineer"),
+# and role words that start with them ("research" -> "researcher"), once the
+# shorter word is at least this long.
+MIN_STEM_LENGTH = 4
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class RoleResolver:
+    """Resolves a job title to the best-matching role name.
+
+    An exact (case-insensitive) role name wins outright. Otherwise every
+    role sharing a word with the title is scored by the summed IDF of the
+    shared words, so rare words like "clinical" outweigh common ones like
+    "engineer". Ties go to the role with the fewest unmatched words. When
+    several roles still tie, the title does not tell them apart ("Java
+    Developer" against frontend, backend and mobile developer) and None is
+    returned, so callers fall back to their defaults. ``aliases`` maps
+    abbreviations to their long form, and roles are also indexed under the
+    long form of their words, so "Machine Learning Engineer" finds
+    "ml engineer".
+
+    Lookups cost one index probe per title word and prefix, whatever the
+    number of roles, and the last ``cache_size`` titles are memoized.
+    """
+
+    def __init__(self, roles, aliases: Optional[dict] = None, cache_size: int = 2048):
+        aliases = {k.lower(): v for k, v in (aliases or {}).items()}
+        self.roles = list(dict.fromkeys(role.lower() for role in roles))
+        self._own_tokens = {}
+        self._index = {}
+        for position, role in enumerate(self.roles):
+            own = set(tokenize(role))
+            tokens = set(own)
+            for token in own:
+                if token in aliases:
+                    tokens.update(tokenize(aliases[token]))
+            self._own_tokens[role] = own
+            for token in tokens:
+                self._index.setdefault(token, []).append(position)
+
+        self._extensions = {}
+        for token in self._index:
+            for end in range(MIN_STEM_LENGTH, len(token)):
+                self._extensions.setdefault(token[:end], []).append(token)
+
+        total = len(self.roles)
+        self._idf = {
+            token: math.log(1 + (total - len(positions) + 0.5) / (len(positions) + 0.5))
+            for token, positions in self._index.items()
+        }
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _matching_tokens(self, word: str) -> list:
+        tokens = ([word] if word in self._index else []) + self._extensions.get(word, [])
+        if tokens:
+            return tokens
+        return [word[:end] for end in range(len(word) - 1, MIN_STEM_LENGTH - 1, -1) if word[:end] in self._index][:1]
+
+    def _resolve(self, title: str) -> Optional[str]:
+        title_lower = title.lower().strip()
+        if title_lower in self._own_tokens:
+            return title_lower
+
+        scores = {}
+        matched = {}
+        for word in set(tokenize(title_lower)):
+            for token in self._matching_tokens(word):
+                for position in self._index[token]:
+                    scores[position] = scores.get(position, 0.0) + self._idf[token]
+                    matched.setdefault(position, set()).add(token)
+        if not scores:
+            return None
+
+        def rank(position: int) -> tuple:
+            role = self.roles[position]
+            unmatched = len(self._own_tokens[role] - matched[position])
+            return -scores[position], unmatched
+
+        ranked = sorted(scores, key=rank)
+        if len(ranked) > 1 and rank(ranked[0]) == rank(ranked[1]):
+            return None
+        return self.roles[ranked[0]]
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Optional
+
 # Master Skill Dictionary for NLP matching
 # Maps abbreviations, acronyms, and short forms to full forms
 
@@ -193,25 +196,57 @@ ROLE_REQUIREMENTS = {
 }
 
 
+# Lowercase abbreviation -> lowercase full form, the lookup behind normalization
+NORMALIZED_DICTIONARY = {key.lower(): value.lower() for key, value in SKILL_DICTIONARY.items()}
+
+
 def expand_abbreviation(term):
     """Expand abbreviation to full form"""
     return SKILL_DICTIONARY.get(term.lower(), term)
 
 
+@lru_cache(maxsize=8192)
+def normalize_skill(skill: str) -> str:
+    """Normalized (expanded, lowercase) form of one skill, memoized"""
+    term = skill.strip().lower()
+    return NORMALIZED_DICTIONARY.get(term, term)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_skill_tuple(skills: tuple) -> frozenset:
+    return frozenset(map(normalize_skill, skills))
+
+
+def normalize_skill_set(skills) -> frozenset:
+    """Normalized skill set of a skill list, memoized per list"""
+    if isinstance(skills, frozenset):
+        skills = tuple(sorted(skills))
+    return _normalize_skill_tuple(tuple(skills))
+
+
 def normalize_skills(skills):
     """Normalize a list of skills using the dictionary"""
-    normalized = []
-    for skill in skills:
-        expanded = expand_abbreviation(skill.strip())
-        normalized.append(expanded.lower())
-    return list(set(normalized))
+    return list(normalize_skill_set(skills))
+
+
+def _role_skill_sets(info: dict) -> dict:
+    must_have = normalize_skill_set(info.get("must_have", []))
+    nice_to_have = normalize_skill_set(info.get("nice_to_have", []))
+    return {"must_have": must_have, "nice_to_have": nice_to_have, "all": must_have | nice_to_have}
+
+
+# Normalized skill sets of every role, built once at import
+ROLE_SKILL_SETS = {role: _role_skill_sets(info) for role, info in ROLE_REQUIREMENTS.items()}
+ROLE_NAMES = list(ROLE_REQUIREMENTS)
 
 
 def calculate_skill_match(user_skills, job_skills):
     """Calculate match score between user skills and job requirements"""
-    user_normalized = set(normalize_skills(user_skills))
-    job_normalized = set(normalize_skills(job_skills))
-    
+    return match_normalized_skills(normalize_skill_set(user_skills), normalize_skill_set(job_skills))
+
+
+def match_normalized_skills(user_normalized, job_normalized):
+    """Match score between skill sets that are already normalized"""
     if not job_normalized:
         return 0.0
     
@@ -221,23 +256,29 @@ def calculate_skill_match(user_skills, job_skills):
     return round(score, 1)
 
 
+def normalized_skill_gaps(user_normalized: frozenset, target_role: str) -> Optional[dict]:
+    """Gap sets of a normalized skill set against a role, or None for unknown roles"""
+    role_sets = ROLE_SKILL_SETS.get(target_role.lower())
+    if role_sets is None:
+        return None
+    matching = user_normalized & role_sets["all"]
+    return {
+        "missing_must_have": role_sets["must_have"] - user_normalized,
+        "missing_nice_to_have": role_sets["nice_to_have"] - user_normalized,
+        "matching": matching,
+        "match_score": round(len(matching) / max(len(role_sets["all"]), 1) * 100, 1),
+    }
+
+
 def get_skill_gaps(user_skills, target_role):
     """Identify skill gaps for a target role"""
-    role_info = ROLE_REQUIREMENTS.get(target_role.lower(), {})
-    if not role_info:
+    gaps = normalized_skill_gaps(normalize_skill_set(user_skills), target_role)
+    if gaps is None:
         return {"missing_must_have": [], "missing_nice_to_have": [], "matching": []}
     
-    user_normalized = set(normalize_skills(user_skills))
-    must_have = set(normalize_skills(role_info.get("must_have", [])))
-    nice_to_have = set(normalize_skills(role_info.get("nice_to_have", [])))
-    
-    missing_must = must_have - user_normalized
-    missing_nice = nice_to_have - user_normalized
-    matching = user_normalized.intersection(must_have.union(nice_to_have))
-    
     return {
-        "missing_must_have": list(missing_must),
-        "missing_nice_to_have": list(missing_nice),
-        "matching": list(matching),
-        "match_score": round(len(matching) / max(len(must_have.union(nice_to_have)), 1) * 100, 1)
+        "missing_must_have": list(gaps["missing_must_have"]),
+        "missing_nice_to_have": list(gaps["missing_nice_to_have"]),
+        "matching": list(gaps["matching"]),
+        "match_score": gaps["match_score"],
     }
@@ -0,0 +1,120 @@
+"""
+GlixAI Skill Matrix
+Vectorized skill matching of many users against many jobs or roles with NumPy
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from shared.skill_dictionary import ROLE_SKILL_SETS, normalize_skill_set
+
+# Upper bound on the users x rows x words intermediate of match_matrix, in elements.
+CHUNK_ELEMENTS = 1 << 22
+
+
+class SkillMatrix:
+    """Skill sets of N jobs or roles, scored against users in bulk.
+
+    Every normalized skill gets an integer id, and each row is stored twice:
+    as CSR (``indptr``/``indices``) and as a packed uint64 bitset. The
+    overlap between a user and all rows is then one AND plus a popcount per
+    64 skills. Scores equal ``match_normalized_skills``: the share of the
+    row's skills the user has, in percent, rounded to one decimal.
+    """
+
+    def __init__(self, rows: Iterable[Iterable[str]], labels: Optional[List[str]] = None,
+                 normalized: bool = False):
+        self.vocabulary = {}
+        indptr = [0]
+        indices = []
+        for row in rows:
+            skills = set(row) if normalized else normalize_skill_set(row)
+            indices.extend(self.vocabulary.setdefault(skill, len(self.vocabulary)) for skill in skills)
+            indptr.append(len(indices))
+
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.sizes = np.diff(self.indptr)
+        self.labels = labels
+        self.words = max(1, -(-len(self.vocabulary) // 64))
+        row_ids = np.repeat(np.arange(len(self.sizes)), self.sizes)
+        self.bits = self._pack(row_ids, self.indices, len(self.sizes))
+
+        # Score of k shared skills for each distinct row size, rounded by Python's
+        # round() so every score equals match_normalized_skills bit for bit
+        # (np.round rounds halves to even on the binary value and drifts from it).
+        distinct, self._size_index = np.unique(self.sizes, return_inverse=True)
+        self._score_table = np.zeros((len(distinct), int(distinct.max(initial=0)) + 1))
+        for i, size in enumerate(distinct.tolist()):
+            if size:
+                self._score_table[i, :size + 1] = [round(k / size * 100, 1) for k in range(size + 1)]
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def _pack(self, row_ids: np.ndarray, skill_ids: np.ndarray, count: int) -> np.ndarray:
+        bits = np.zeros((count, self.words), dtype=np.uint64)
+        masks = np.left_shift(np.uint64(1), (skill_ids % 64).astype(np.uint64))
+        np.bitwise_or.at(bits, (row_ids, skill_ids // 64), masks)
+        return bits
+
+    def encode(self, users: Iterable[Iterable[str]], normalized: bool = False) -> np.ndarray:
+        """Bitsets of the given users' skills; skills no row has are dropped"""
+        row_ids = []
+        skill_ids = []
+        count = 0
+        for count, skills in enumerate(users, start=1):
+            for skill in (skills if normalized else normalize_skill_set(skills)):
+                skill_id = self.vocabulary.get(skill)
+                if skill_id is not None:
+                    row_ids.append(count - 1)
+                    skill_ids.append(skill_id)
+        return self._pack(np.asarray(row_ids, dtype=np.int64), np.asarray(skill_ids, dtype=np.int64), count)
+
+    def _scores(self, overlap: np.ndarray) -> np.ndarray:
+        return self._score_table[self._size_index, overlap]
+
+    def overlap(self, user_skills: Iterable[str], normalized: bool = False) -> np.ndarray:
+        """Number of shared skills between one user and every row"""
+        user = self.encode([user_skills], normalized)[0]
+        return np.bitwise_count(self.bits & user).sum(axis=1, dtype=np.int64)
+
+    def match_scores(self, user_skills: Iterable[str], normalized: bool = False) -> np.ndarray:
+        """Match score of one user against every row"""
+        return self._scores(self.overlap(user_skills, normalized))
+
+    def match_matrix(self, users: Iterable[Iterable[str]], normalized: bool = False) -> np.ndarray:
+        """Users x rows matrix of match scores"""
+        user_bits = self.encode(users, normalized)
+        overlap = np.empty((len(user_bits), len(self)), dtype=np.int64)
+        step = max(1, CHUNK_ELEMENTS // max(1, len(self) * self.words))
+        for start in range(0, len(user_bits), step):
+            chunk = user_bits[start:start + step, None, :] & self.bits[None, :, :]
+            overlap[start:start + step] = np.bitwise_count(chunk).sum(axis=2, dtype=np.int64)
+        return self._scores(overlap)
+
+    def top(self, user_skills: Iterable[str], limit: int = 5, normalized: bool = False) -> list:
+        """Best-matching rows for one user as (label or index, score), highest first"""
+        scores = self.match_scores(user_skills, normalized)
+        # Stable sort keeps declaration order among equal scores.
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [(self.labels[i] if self.labels else int(i), float(scores[i])) for i in order]
+
+
+_role_matrix: Optional[SkillMatrix] = None
+
+
+def get_role_matrix() -> SkillMatrix:
+    """Matrix of every role's must-have plus nice-to-have skills, built on first use"""
+    global _role_matrix
+    if _role_matrix is None:
+        _role_matrix = SkillMatrix(
+            [sets["all"] for sets in ROLE_SKILL_SETS.values()], labels=list(ROLE_SKILL_SETS), normalized=True,
+        )
+    return _role_matrix
+
+
+def match_roles(user_skills: Iterable[str], limit: int = 5) -> list:
+    """Roles closest to a skill list, as {"role", "match_score"} dicts, best first"""
+    return [{"role": role, "match_score": score} for role, score in get_role_matrix().top(user_skills, limit)]
@@ -0,0 +1,43 @@
+"""
+GlixAI Static Payloads
+Pre-serialized JSON responses for static catalog endpoints, with ETag revalidation
+"""
+
+import hashlib
+import os
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from shared.json_response import dumps
+
+CATALOG_MAX_AGE_SECONDS = int(os.environ.get('CATALOG_MAX_AGE_SECONDS', 300))
+
+
+class StaticPayload:
+    """A JSON body serialized once, served with a strong ETag.
+
+    The ETag is a hash of the body, so it is the same on every replica and
+    only changes when the data does. Requests whose If-None-Match carries
+    it get an empty 304.
+    """
+
+    def __init__(self, content, max_age: int = CATALOG_MAX_AGE_SECONDS):
+        # Same encoding as the app's FastJSONResponse.
+        self.body = dumps(content)
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.headers = {"ETag": self.etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    def matches(self, if_none_match: str) -> bool:
+        """Whether an If-None-Match header value covers this payload"""
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == self.etag:
+                return True
+        return False
+
+    def respond(self, request: Request) -> Response:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.matches(if_none_match):
+            return Response(status_code=304, headers=self.headers)
+        return Response(self.body, media_type="application/json", headers=self.headers)
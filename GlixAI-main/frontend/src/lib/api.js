@@ -12,6 +12,38 @@ const api = axios.create({
 export const sendMessage = (session_id, message, context = "") =>
   api.post("/chat", { session_id, message, context });
 
+// Streams the reply as Server-Sent Events. onToken receives each chunk;
+// resolves with the final { session_id, message, brand } payload.
+export const streamMessage = async (session_id, message, context = "", onToken = () => {}) => {
+  const res = await fetch(`${API}/chat/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ session_id, message, context }),
+  });
+  if (!res.ok || !res.body) throw new Error(`Chat stream failed: ${res.status}`);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let result = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const events = buffer.split("\n\n");
+    buffer = events.pop();
+    for (const raw of events) {
+      const event = raw.match(/^event: (.*)$/m)?.[1];
+      const data = raw.match(/^data: (.*)$/m)?.[1];
+      if (!data) continue;
+      const payload = JSON.parse(data);
+      if (event === "token") onToken(payload.content);
+      else if (event === "done") result = payload;
+    }
+  }
+  return result;
+};
+
 export const getChatSessions = () => api.get("/chat/sessions");
 
 export const getChatHistory = (session_id) =>
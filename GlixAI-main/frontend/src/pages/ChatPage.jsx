@@ -19,7 +19,7 @@ import { Separator } from "../components/ui/separator";
 import ReactMarkdown from "react-markdown";
 import remarkGfm from "remark-gfm";
 import {
-  sendMessage,
+  streamMessage,
   getChatSessions,
   getChatHistory,
   deleteSession,
@@ -179,10 +179,19 @@ export default function ChatPage({ onNavigate, initialPrompt }) {
     setMessages((prev) => [...prev, userMsg]);
     setLoading(true);
 
+    const pendingId = crypto.randomUUID();
     try {
-      const res = await sendMessage(sid, msg);
-      const assistantMsg = res.data.message;
-      setMessages((prev) => [...prev, assistantMsg]);
+      const res = await streamMessage(sid, msg, "", (chunk) => {
+        setLoading(false);
+        setMessages((prev) =>
+          prev.some((m) => m.id === pendingId)
+            ? prev.map((m) => (m.id === pendingId ? { ...m, content: m.content + chunk } : m))
+            : [...prev, { id: pendingId, role: "assistant", content: chunk, timestamp: new Date().toISOString() }]
+        );
+      });
+      if (res?.message) {
+        setMessages((prev) => [...prev.filter((m) => m.id !== pendingId), res.message]);
+      }
       loadSessions();
     } catch (err) {
       setMessages((prev) => [
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The backend is not an installed package; its modules import as agents.*, shared.*
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from agents.job_queue import JobQueue, JobQueueFull
+
+
+class SlowInserts:
+    """A collection whose inserts take a while, so submissions overlap"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def insert_one(self, document):
+        await asyncio.sleep(0.01)
+        return await self.collection.insert_one(document)
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+
+@pytest.fixture
+def jobs():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    return mongomock_motor.AsyncMongoMockClient().db.jobs
+
+
+def test_overflow_raises_job_queue_full_without_writing(jobs):
+    async def run():
+        queue = JobQueue(SlowInserts(jobs), workers=1, max_pending=2)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return {"ok": True}
+
+        queue.start()
+        try:
+            results = await asyncio.gather(*(queue.submit("test", work) for _ in range(10)), return_exceptions=True)
+            accepted = [r for r in results if isinstance(r, dict)]
+            assert len(accepted) == 2
+            assert all(isinstance(r, JobQueueFull) for r in results if not isinstance(r, dict))
+            assert await jobs.count_documents({}) == 2
+
+            release.set()
+            for _ in range(100):
+                if await jobs.count_documents({"status": "done"}) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            assert [(await queue.get(job["id"]))["result"] for job in accepted] == [{"ok": True}] * 2
+            # Slots free up once the jobs have run.
+            await queue.submit("test", work)
+        finally:
+            await queue.close()
+
+    asyncio.run(run())
+
+
+def test_close_marks_unfinished_jobs_failed(jobs):
+    async def run():
+        queue = JobQueue(jobs, workers=1, max_pending=5)
+
+        async def hang():
+            await asyncio.sleep(60)
+
+        queue.start()
+        job = await queue.submit("test", hang)
+        await asyncio.sleep(0.05)
+        await queue.close()
+        stored = await queue.get(job["id"])
+        assert stored["status"] == "failed"
+        assert stored["error"] == "Interrupted by server shutdown"
+        assert queue.stats() == {"workers": 0, "queued": 0, "active": 0}
+
+    asyncio.run(run())
@@ -0,0 +1,62 @@
+import random
+import re
+
+import pytest
+
+from agents.resume_analyzer import ALL_SKILLS, SKILL_MATCHER
+from shared.keyword_matcher import WORD_CHAR, KeywordMatcher
+
+KEYWORDS = [
+    "data", "data science", "big data", "science", "java", "javascript", "go", "c++", "c#",
+    "ci/cd", "node.js", "machine learning", "learning", "team", "lead", "r",
+]
+FILLER = ["the", "good", "teams", "leader", "going", "javas", "database", "and", "scientific", "node", "ci"]
+SEPARATORS = [" ", " ", ", ", ". ", "/", "-", "(", ")", "\n"]
+
+
+def substring_find(keywords, text: str, prefix: bool = False) -> list:
+    """The substring test each keyword had before, restricted to word boundaries"""
+    text = text.lower()
+    end = "" if prefix else f"(?!{WORD_CHAR})"
+    return [
+        keyword for keyword in dict.fromkeys(k.lower() for k in keywords)
+        if re.search(f"(?<!{WORD_CHAR}){re.escape(keyword)}{end}", text)
+    ]
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    pool = KEYWORDS + FILLER
+    parts = []
+    for _ in range(words):
+        word = rng.choice(pool)
+        parts.append(word.upper() if rng.random() < 0.1 else word)
+        parts.append(rng.choice(SEPARATORS))
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("prefix", [False, True])
+def test_matches_per_keyword_substring_search(prefix):
+    matcher = KeywordMatcher(KEYWORDS, prefix=prefix)
+    rng = random.Random(prefix)
+    for _ in range(500):
+        text = random_text(rng, rng.randint(1, 12))
+        assert matcher.find(text) == substring_find(KEYWORDS, text, prefix), text
+
+
+def test_resume_skills_match_substring_search():
+    rng = random.Random(7)
+    skills = sorted(ALL_SKILLS)
+    for _ in range(100):
+        text = " and ".join(rng.sample(skills, 8)) + ", plus javascript and golang."
+        assert SKILL_MATCHER.find(text) == substring_find(SKILL_MATCHER.keywords, text)
+
+
+@pytest.mark.parametrize("text, prefix, found", [
+    ("JavaScript developer", False, ["javascript"]),
+    ("good governance", False, []),
+    ("big data science team", False, ["data", "data science", "big data", "science", "team"]),
+    ("mentored teams", True, ["team"]),
+    ("C++ and C# on CI/CD", False, ["c++", "c#", "ci/cd"]),
+])
+def test_documented_examples(text, prefix, found):
+    assert KeywordMatcher(KEYWORDS, prefix=prefix).find(text) == found
@@ -0,0 +1,91 @@
+import asyncio
+import base64
+
+import pytest
+
+from shared.mongo_indexes import MESSAGE_SORT, SESSION_SORT
+from shared.pagination import after_filter, decode_cursor, encode_cursor, fetch_page
+
+
+@pytest.mark.parametrize("values", [
+    ["2026-01-01T00:00:00+00:00", "5f0c4a8e-0000-4000-8000-000000000000"],
+    [None, "x"],
+    [1, 2.5, "ü/+="],
+    [],
+])
+def test_cursor_round_trip(values):
+    cursor = encode_cursor(values)
+    assert "=" not in cursor and "/" not in cursor and "+" not in cursor
+    assert decode_cursor(cursor) == values
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor!",
+    "%%%",
+    base64.urlsafe_b64encode(b"{not json").decode(),
+    base64.urlsafe_b64encode(b'{"a": 1}').decode(),
+    base64.urlsafe_b64encode(b'"text"').decode(),
+])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_cursor_with_wrong_length_is_rejected():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        after_filter(SESSION_SORT, ["only one value"])
+
+
+def test_after_filter_follows_sort_directions():
+    assert after_filter(SESSION_SORT, ["t", "i"]) == {"$or": [
+        {"updated_at": {"$lt": "t"}},
+        {"updated_at": "t", "id": {"$lt": "i"}},
+    ]}
+    assert after_filter(MESSAGE_SORT, ["t", "i"])["$or"][1] == {"timestamp": "t", "id": {"$gt": "i"}}
+
+
+def walk(collection, query, sort, limit, **kwargs) -> list:
+    async def run():
+        pages, cursor = [], None
+        while True:
+            page, cursor = await fetch_page(collection, query, sort, limit, cursor, **kwargs)
+            pages.append(page)
+            if cursor is None:
+                return pages
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def messages():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    collection = mongomock_motor.AsyncMongoMockClient().db.chat_messages
+    # Several messages share a timestamp, so pages must fall back to the id.
+    documents = [
+        {"id": f"m{i:03}", "session_id": "s" if i % 5 else "other", "timestamp": f"t{i // 3:03}"}
+        for i in range(50)
+    ]
+    asyncio.run(collection.insert_many([dict(d) for d in documents]))
+    return collection, documents
+
+
+@pytest.mark.parametrize("limit", [1, 4, 7, 40, 100])
+def test_pages_cover_every_document_once_in_order(messages, limit):
+    collection, documents = messages
+    pages = walk(collection, {"session_id": "s"}, MESSAGE_SORT, limit)
+    expected = [d for d in documents if d["session_id"] == "s"]
+    assert [d["id"] for page in pages for d in page] == [d["id"] for d in expected]
+    assert all(len(page) == limit for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= limit
+
+
+def test_descending_pages(messages):
+    collection, documents = messages
+    sort = [("timestamp", -1), ("id", -1)]
+    pages = walk(collection, {}, sort, 6)
+    assert [d["id"] for page in pages for d in page] == [d["id"] for d in reversed(documents)]
+
+
+def test_projection_hides_mongo_ids(messages):
+    collection, _ = messages
+    page, _ = asyncio.run(fetch_page(collection, {}, MESSAGE_SORT, 3))
+    assert all("_id" not in d for d in page)
@@ -0,0 +1,77 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+pytest.importorskip("litellm")
+
+from agents import resume_batch
+from agents.resume_batch import ResumeBatchAnalyzer, expand_uploads
+
+RESUME = b"Jane Doe python docker 5 years experience leadership teamwork"
+
+
+@pytest.fixture
+def resumes():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    return mongomock_motor.AsyncMongoMockClient().db.resumes
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    async def ai_analysis(session_id, text):
+        return {"summary": "ok"}
+
+    monkeypatch.setattr(resume_batch, "analyze_resume_with_ai", ai_analysis)
+    analyzer = ResumeBatchAnalyzer(max_workers=1)
+    yield analyzer
+    analyzer.close()
+
+
+def collect(analyzer, uploads, collection):
+    async def run():
+        return [result async for result in analyzer.run(uploads, collection)]
+
+    return asyncio.run(run())
+
+
+def test_direct_uploads_are_held_to_the_file_size_limit():
+    files = expand_uploads([("big.pdf", b"x" * 100), ("big2.txt", b"x" * 100)],
+                           max_files=10, max_file_bytes=10, max_total_bytes=15)
+    assert [(name, content) for name, content, _ in files] == [("big.pdf", b""), ("big2.txt", b"")]
+    assert all(error == "File is larger than 10 bytes." for _, _, error in files)
+
+
+def test_direct_uploads_are_held_to_the_batch_size_limit():
+    files = expand_uploads([("a.txt", b"x" * 10), ("b.txt", b"x" * 10), ("c.txt", b"x" * 5)],
+                           max_files=10, max_file_bytes=10, max_total_bytes=15)
+    assert [error is None for _, _, error in files] == [True, False, True]
+    assert files[1] == ("b.txt", b"", "File takes the batch past the 15 byte limit.")
+
+
+def test_failed_analysis_keeps_index_and_filename(analyzer, resumes, monkeypatch):
+    async def failing_ai(session_id, text):
+        raise RuntimeError("llm down")
+
+    monkeypatch.setattr(resume_batch, "analyze_resume_with_ai", failing_ai)
+    results = collect(analyzer, [("a.txt", RESUME), ("b.txt", RESUME)], resumes)
+
+    errors = sorted((r["index"], r["filename"], r["error"]) for r in results[:-1])
+    assert errors == [(0, "a.txt", "llm down"), (1, "b.txt", "llm down")]
+    assert results[-1]["failed"] == 2
+
+
+def test_broken_rules_pool_is_rebuilt(analyzer, resumes):
+    broken = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    with pytest.raises(Exception):
+        broken.submit(os._exit, 1).result()
+    analyzer._pool = broken
+
+    first = collect(analyzer, [("a.txt", RESUME)], resumes)
+    assert (first[0]["index"], first[0]["filename"], first[0]["status"]) == (0, "a.txt", "error")
+
+    second = collect(analyzer, [("a.txt", RESUME)], resumes)
+    assert second[0]["status"] == "ok"
+    assert analyzer._pool is not broken
@@ -0,0 +1,59 @@
+import pytest
+
+from agents.risk_analytics import RISK_ROLE_RESOLVER, SALARY_ROLE_RESOLVER
+from shared.role_resolver import RoleResolver
+
+# Job title -> risk profile it must resolve to (None: unknown-role defaults)
+RISK_GOLDEN = [
+    ("ML Engineer", "ml engineer"),
+    ("Machine Learning Engineer", "ml engineer"),
+    ("Senior Frontend Engineer", "frontend developer"),
+    ("Full-Stack Developer", "full stack developer"),
+    ("Clinical Research Coordinator", "clinical researcher"),
+    ("Biotech Research Associate", "biotech researcher"),
+    ("Research Scientist", "research scientist"),
+    ("Cloud Solutions Architect", "cloud architect"),
+    ("DevOps/SRE Engineer", "devops engineer"),
+    ("Software Developer", "software engineer"),
+    ("Backend Engineer", "backend developer"),
+    ("Java Developer", None),
+    ("Python Developer", None),
+    ("Developer", None),
+    ("Nurse", None),
+]
+
+
+@pytest.mark.parametrize("title, role", RISK_GOLDEN)
+def test_risk_golden_titles(title, role):
+    assert RISK_ROLE_RESOLVER.resolve(title) == role
+
+
+@pytest.mark.parametrize("title, role", [
+    ("Senior Product Manager", "product manager"),
+    ("iOS Mobile Developer", "mobile developer"),
+    ("Clinical Research Coordinator", "clinical researcher"),
+    ("Java Developer", None),
+])
+def test_salary_golden_titles(title, role):
+    assert SALARY_ROLE_RESOLVER.resolve(title) == role
+
+
+def test_exact_name_wins_case_insensitively():
+    resolver = RoleResolver(["data scientist", "research scientist"])
+    assert resolver.resolve("  Research Scientist ") == "research scientist"
+
+
+def test_title_word_matches_longer_role_word():
+    resolver = RoleResolver(["research scientist", "clinical researcher"])
+    assert resolver.resolve("clinical research lead") == "clinical researcher"
+
+
+def test_indistinguishable_roles_resolve_to_none():
+    resolver = RoleResolver(["frontend developer", "backend developer"])
+    assert resolver.resolve("java developer") is None
+    assert resolver.resolve("backend java developer") == "backend developer"
+
+
+def test_aliases_index_long_forms():
+    resolver = RoleResolver(["ml engineer", "software engineer"], aliases={"ml": "machine learning"})
+    assert resolver.resolve("Machine Learning Engineer") == "ml engineer"
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from shared.skill_dictionary import ROLE_REQUIREMENTS, SKILL_DICTIONARY, calculate_skill_match, get_skill_gaps
+from shared.skill_matrix import SkillMatrix, get_role_matrix, match_roles
+
+SKILL_POOL = sorted(set(SKILL_DICTIONARY) | set(SKILL_DICTIONARY.values())) + [f"tool-{i}" for i in range(40)]
+
+
+def random_skills(rng: random.Random, most: int) -> list:
+    skills = rng.sample(SKILL_POOL, rng.randint(0, most))
+    return [skill.upper() if rng.random() < 0.2 else skill for skill in skills]
+
+
+def test_scores_equal_calculate_skill_match():
+    rng = random.Random(14)
+    jobs = [random_skills(rng, 30) for _ in range(300)]
+    matrix = SkillMatrix(jobs)
+    for _ in range(50):
+        user = random_skills(rng, 40)
+        assert matrix.match_scores(user).tolist() == [calculate_skill_match(user, job) for job in jobs]
+
+
+def test_match_matrix_equals_per_user_scores():
+    rng = random.Random(15)
+    jobs = [random_skills(rng, 20) for _ in range(60)]
+    users = [random_skills(rng, 20) for _ in range(25)]
+    expected = [[calculate_skill_match(user, job) for job in jobs] for user in users]
+    assert SkillMatrix(jobs).match_matrix(users).tolist() == expected
+
+
+def test_role_scores_equal_get_skill_gaps():
+    rng = random.Random(16)
+    for _ in range(50):
+        user = random_skills(rng, 15)
+        expected = [get_skill_gaps(user, role)["match_score"] for role in ROLE_REQUIREMENTS]
+        assert get_role_matrix().match_scores(user).tolist() == expected
+
+
+@pytest.mark.parametrize("shared, size", [(23, 80), (1, 2000), (3, 2000), (1, 3), (2, 3)])
+def test_rounding_matches_python_round(shared, size):
+    row = [f"skill-{i}" for i in range(size)]
+    matrix = SkillMatrix([row])
+    assert matrix.match_scores(row[:shared]).tolist() == [calculate_skill_match(row[:shared], row)]
+
+
+def test_empty_rows_score_zero():
+    assert SkillMatrix([[], ["python"]]).match_scores(["python"]).tolist() == [0.0, 100.0]
+
+
+def test_match_roles_ranks_best_first():
+    ranked = match_roles(ROLE_REQUIREMENTS["data scientist"]["must_have"], limit=3)
+    assert ranked[0] == {"role": "data scientist", "match_score": get_skill_gaps(
+        ROLE_REQUIREMENTS["data scientist"]["must_have"], "data scientist")["match_score"]}
+    assert [r["match_score"] for r in ranked] == sorted((r["match_score"] for r in ranked), reverse=True)
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from shared.static_payload import StaticPayload
+
+CATALOG = {"roles": [{"name": "data scientist", "skills": ["python", "sql"]}], "total": 1}
+
+
+@pytest.fixture
+def client():
+    payload = StaticPayload(CATALOG, max_age=60)
+    app = FastAPI()
+
+    @app.get("/catalog")
+    async def catalog(request: Request):
+        return payload.respond(request)
+
+    return TestClient(app), payload
+
+
+def test_full_response_carries_etag_and_cache_control(client):
+    http, payload = client
+    response = http.get("/catalog")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == payload.etag
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert json.loads(response.content) == CATALOG
+
+
+@pytest.mark.parametrize("if_none_match", ["{etag}", "W/{etag}", '"stale", {etag}', "*"])
+def test_matching_if_none_match_gets_empty_304(client, if_none_match):
+    http, payload = client
+    response = http.get("/catalog", headers={"If-None-Match": if_none_match.format(etag=payload.etag)})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == payload.etag
+
+
+@pytest.mark.parametrize("if_none_match", ['"stale"', "", "W/\"other\""])
+def test_other_if_none_match_gets_the_body(client, if_none_match):
+    http, _ = client
+    response = http.get("/catalog", headers={"If-None-Match": if_none_match})
+    assert response.status_code == 200
+    assert json.loads(response.content) == CATALOG
+
+
+def test_etag_depends_only_on_content():
+    assert StaticPayload(dict(CATALOG)).etag == StaticPayload(CATALOG).etag
+    assert StaticPayload({**CATALOG, "total": 2}).etag != StaticPayload(CATALOG).etag
@@ -4,6 +4,9 @@ Bulk Assessment Script for processing multiple resumes
 """
 
 import os
+import sys
+import argparse
+import multiprocessing
 from pathlib import Path
 import json
 from datetime import datetime
@@ -11,15 +14,106 @@ from datetime import datetime
 # Import the main assessment system
 from science_career_assessment import ScienceCareerAssessment
 
+# Per-process assessment instance used by pool workers
+_worker_assessment = None
+
+
+def assess_resume(assessment, file_path):
+    """Run one resume through the assessment with default answers"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        resume_text = f.read()
+    
+    # Process resume
+    profile = assessment.process_resume_text(resume_text)
+    
+    # Generate questions and simulate answers
+    questions = assessment.generate_assessment_questions()
+    
+    # For bulk processing, use default answers (first option for each question)
+    default_answers = []
+    for q in questions[:8]:  # First 8 questions only for bulk processing
+        default_answers.append({
+            'question_id': q['id'],
+            'question': q['question'],
+            'answer': q['options'][0],
+            'type': q['type'],
+            'weight': q['weight']
+        })
+    
+    assessment.assessment_answers = default_answers
+    analysis = assessment.analyze_assessment()
+    
+    # Generate roadmap
+    roadmap = assessment.generate_career_roadmap(analysis)
+    
+    return {
+        'file': Path(file_path).name,
+        'profile': profile,
+        'analysis': analysis,
+        'roadmap': roadmap
+    }
+
+
+def _init_worker():
+    """Give each worker process its own assessment and silence its console output"""
+    global _worker_assessment
+    _worker_assessment = ScienceCareerAssessment()
+    sys.stdout = open(os.devnull, 'w')
+
+
+def _assess_in_worker(file_path):
+    try:
+        return assess_resume(_worker_assessment, file_path)
+    except Exception as e:
+        return {'file': Path(file_path).name, 'error': str(e)}
+
+
 class BulkCareerAssessment:
-    """Process multiple resumes in batch"""
+    """Process multiple resumes in batch
+    
+    Results are appended to a JSONL file as each resume completes, and the
+    names of finished files to a checkpoint file next to it, so an
+    interrupted run picks up where it stopped. With workers > 1 resumes are
+    assessed on a process pool, one assessment instance per worker.
+    """
     
-    def __init__(self):
+    def __init__(self, workers=1, output_path=None, checkpoint_path=None):
         self.assessment = ScienceCareerAssessment()
-        self.results = []
         self.ai_engine = self.assessment.ai_engine
+        self.workers = max(1, workers)
+        self.output_path = Path(output_path) if output_path else None
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
     
-    def process_folder(self, folder_path):
+    def _load_checkpoint(self):
+        if not self.checkpoint_path.exists():
+            return set()
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            return {line.rstrip('\n') for line in f if line.strip()}
+    
+    def _assess_sequential(self, paths):
+        for file_path in paths:
+            try:
+                yield assess_resume(self.assessment, file_path)
+            except Exception as e:
+                yield {'file': file_path.name, 'error': str(e)}
+    
+    def _assess_parallel(self, paths):
+        with multiprocessing.Pool(self.workers, initializer=_init_worker) as pool:
+            yield from pool.imap_unordered(_assess_in_worker, [str(p) for p in paths], chunksize=8)
+    
+    def iter_results(self):
+        """Read the successful results back from the JSONL sink"""
+        if not self.output_path.exists():
+            return
+        with open(self.output_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                if 'error' not in result:
+                    yield result
+    
+    def process_folder(self, folder_path, fresh=False):
         """Process all text files in folder"""
         folder = Path(folder_path)
         
@@ -27,10 +121,15 @@ class BulkCareerAssessment:
             print(f"❌ Folder {folder_path} does not exist!")
             return
         
+        if self.output_path is None:
+            self.output_path = Path(f"bulk_assessment_{folder.resolve().name}.jsonl")
+        if self.checkpoint_path is None:
+            self.checkpoint_path = self.output_path.with_name(self.output_path.name + ".checkpoint")
+        
         print(f"\n🔍 Processing resumes from: {folder_path}")
         print("="*60)
         
-        txt_files = list(folder.glob("*.txt"))
+        txt_files = sorted(folder.glob("*.txt"))
         
         if not txt_files:
             print("❌ No .txt files found in the folder!")
@@ -38,49 +137,33 @@ class BulkCareerAssessment:
         
         print(f"📁 Found {len(txt_files)} resume files")
         
-        for file_path in txt_files:
-            print(f"\n📄 Processing: {file_path.name}")
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    resume_text = f.read()
-                
-                # Process resume
-                profile = self.assessment.process_resume_text(resume_text)
-                
-                # Generate questions and simulate answers
-                questions = self.assessment.generate_assessment_questions()
-                
-                # For bulk processing, use default answers (first option for each question)
-                default_answers = []
-                for q in questions[:8]:  # First 8 questions only for bulk processing
-                    default_answers.append({
-                        'question_id': q['id'],
-                        'question': q['question'],
-                        'answer': q['options'][0],
-                        'type': q['type'],
-                        'weight': q['weight']
-                    })
-                
-                self.assessment.assessment_answers = default_answers
-                analysis = self.assessment.analyze_assessment()
-                
-                # Generate roadmap
-                roadmap = self.assessment.generate_career_roadmap(analysis)
-                
-                self.results.append({
-                    'file': file_path.name,
-                    'profile': profile,
-                    'analysis': analysis,
-                    'roadmap': roadmap
-                })
-                
-                print(f"✅ Completed: {file_path.name}")
-                
-            except Exception as e:
-                print(f"❌ Error processing {file_path.name}: {str(e)}")
-                continue
+        if fresh:
+            for path in (self.output_path, self.checkpoint_path):
+                if path.exists():
+                    path.unlink()
+        done = self._load_checkpoint()
+        pending = [p for p in txt_files if p.name not in done]
+        if done:
+            print(f"⏩ Resuming: {len(txt_files) - len(pending)} already assessed, {len(pending)} remaining")
+        
+        results = self._assess_parallel(pending) if self.workers > 1 else self._assess_sequential(pending)
         
+        # Each result is written before its file is checkpointed, so a crash
+        # can at worst repeat one resume, never lose it. Failed files are not
+        # checkpointed and are retried on the next run.
+        with open(self.output_path, 'a', encoding='utf-8') as sink, \
+                open(self.checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            for result in results:
+                sink.write(json.dumps(result) + "\n")
+                sink.flush()
+                if 'error' in result:
+                    print(f"❌ Error processing {result['file']}: {result['error']}")
+                    continue
+                checkpoint.write(result['file'] + "\n")
+                checkpoint.flush()
+                print(f"✅ Completed: {result['file']}")
+        
+        print(f"\n💾 Results written to: {self.output_path}")
         self.generate_summary_report()
         self.save_detailed_report()
     
@@ -94,7 +177,7 @@ class BulkCareerAssessment:
         specialization_distribution = {}
         experience_levels = []
         
-        for result in self.results:
+        for result in self.iter_results():
             field = result['analysis']['primary_field']
             specialization = result['analysis']['specialization']
             exp_level = result['analysis']['experience_level']
@@ -108,20 +191,25 @@ class BulkCareerAssessment:
             # Collect experience levels
             experience_levels.append(exp_level)
         
+        total = len(experience_levels)
+        if not total:
+            print("\n❌ No completed assessments to summarize.")
+            return
+        
         print(f"\n📊 SUMMARY STATISTICS:")
-        print(f"   Total Candidates: {len(self.results)}")
-        print(f"   Average Experience Level: {sum(experience_levels)/len(experience_levels):.1f}/5")
+        print(f"   Total Candidates: {total}")
+        print(f"   Average Experience Level: {sum(experience_levels)/total:.1f}/5")
         
         print(f"\n🎯 FIELD DISTRIBUTION:")
         for field, count in sorted(field_distribution.items(), key=lambda x: x[1], reverse=True):
             field_name = self.ai_engine.career_knowledge['fields'][field]['name']
-            percentage = (count / len(self.results)) * 100
+            percentage = (count / total) * 100
             print(f"   {field_name}: {count} candidates ({percentage:.1f}%)")
         
         print(f"\n🔬 TOP SPECIALIZATIONS:")
         top_specializations = sorted(specialization_distribution.items(), key=lambda x: x[1], reverse=True)[:5]
         for spec, count in top_specializations:
-            percentage = (count / len(self.results)) * 100
+            percentage = (count / total) * 100
             print(f"   {spec}: {count} candidates ({percentage:.1f}%)")
         
         print(f"\n📈 EXPERIENCE LEVEL BREAKDOWN:")
@@ -135,7 +223,7 @@ class BulkCareerAssessment:
                 exp_ranges['Advanced'] += 1
         
         for level, count in exp_ranges.items():
-            percentage = (count / len(experience_levels)) * 100
+            percentage = (count / total) * 100
             print(f"   {level}: {count} candidates ({percentage:.1f}%)")
     
     def save_detailed_report(self):
@@ -143,17 +231,19 @@ class BulkCareerAssessment:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"bulk_assessment_report_{timestamp}.txt"
         
+        # Summary statistics
+        field_distribution = {}
+        total = 0
+        for result in self.iter_results():
+            field = result['analysis']['primary_field']
+            field_distribution[field] = field_distribution.get(field, 0) + 1
+            total += 1
+        
         with open(filename, 'w', encoding='utf-8') as f:
             f.write("BULK CAREER ASSESSMENT REPORT\n")
             f.write("="*60 + "\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Candidates: {len(self.results)}\n\n")
-            
-            # Summary statistics
-            field_distribution = {}
-            for result in self.results:
-                field = result['analysis']['primary_field']
-                field_distribution[field] = field_distribution.get(field, 0) + 1
+            f.write(f"Total Candidates: {total}\n\n")
             
             f.write("FIELD DISTRIBUTION:\n")
             f.write("-" * 30 + "\n")
@@ -166,7 +256,7 @@ class BulkCareerAssessment:
             f.write("INDIVIDUAL CANDIDATE DETAILS:\n")
             f.write("="*60 + "\n\n")
             
-            for i, result in enumerate(self.results, 1):
+            for i, result in enumerate(self.iter_results(), 1):
                 f.write(f"CANDIDATE #{i}: {result['file']}\n")
                 f.write("-" * 40 + "\n")
                 f.write(f"Name: {result['profile'].get('name', 'N/A')}\n")
@@ -326,10 +416,23 @@ AI Chatbot
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Bulk science career assessment")
+    parser.add_argument("folder", nargs="?", help="folder of .txt resumes; omit for the interactive menu")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default 1)")
+    parser.add_argument("--output", help="JSONL results file (default bulk_assessment_<folder>.jsonl)")
+    parser.add_argument("--checkpoint", help="checkpoint file (default <output>.checkpoint)")
+    parser.add_argument("--fresh", action="store_true", help="discard previous results and checkpoint")
+    args = parser.parse_args()
+    
     print("🔬 BULK SCIENCE CAREER ASSESSMENT")
     print("="*60)
     
-    bulk = BulkCareerAssessment()
+    bulk = BulkCareerAssessment(workers=args.workers, output_path=args.output, checkpoint_path=args.checkpoint)
+    
+    if args.folder:
+        bulk.process_folder(args.folder, fresh=args.fresh)
+        print("\n✅ Bulk assessment completed!")
+        return
     
     print("\nSelect option:")
     print("1. Process existing resume files")
@@ -340,7 +443,7 @@ def main():
     
     if choice == "1":
         folder_path = input("Enter folder path containing resume files: ").strip()
-        bulk.process_folder(folder_path)
+        bulk.process_folder(folder_path, fresh=args.fresh)
     elif choice == "2":
         count = input("Number of sample resumes to create (default 5): ").strip()
         try:
@@ -356,7 +459,7 @@ def main():
             count = 5
         
         bulk.create_sample_resumes(count)
-        bulk.process_folder("resumes")
+        bulk.process_folder("resumes", fresh=args.fresh)
     else:
         print("❌ Invalid choice!")
         return